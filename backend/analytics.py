@@ -0,0 +1,217 @@
+"""
+Analytics aggregation helpers.
+
+Counts for several date windows are computed with a single $facet pipeline per
+collection, and the collections are queried concurrently, so an overview costs
+roughly one database round trip regardless of how many windows it reports.
+Collections with daily rollups (see rollups.py) use day-aligned windows built
+with day_windows.
+"""
+import asyncio
+from datetime import datetime, timezone, timedelta
+from timeseries import created_at_range
+
+# Collections reported by the admin overview, keyed by their short name
+OVERVIEW_COLLECTIONS = {
+    "reports": "consultant_reports",
+    "calls": "call_logs",
+    "admissions": "admissions",
+    "queries": "student_queries",
+}
+
+
+def parse_window_bound(value: str, end: bool = False):
+    """Parse a since/until query parameter into a UTC datetime.
+
+    A bare date (YYYY-MM-DD) used as an upper bound covers the whole day.
+    Raises ValueError for malformed input.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def standard_windows(now: datetime = None):
+    """Start of today, this week (Monday) and this month in UTC"""
+    today = (now or datetime.now(timezone.utc)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        "today": (today, None),
+        "week": (today - timedelta(days=today.weekday()), None),
+        "month": (today.replace(day=1), None),
+    }
+
+
+def count_facet_pipeline(windows: dict, match: dict = None):
+    """One pipeline that counts the total plus every (start, end) window"""
+    facets = {"total": [{"$count": "n"}]}
+    for name, (start, end) in windows.items():
+        facets[name] = [{"$match": created_at_range(start, end)}, {"$count": "n"}]
+
+    pipeline = []
+    if match:
+        pipeline.append({"$match": match})
+    pipeline.append({"$facet": facets})
+    return pipeline
+
+
+def day_bound(value: datetime, end: bool = False):
+    """Convert a window bound to a YYYY-MM-DD rollup date (end bounds stay exclusive)"""
+    if value is None:
+        return None
+    d = value.astimezone(timezone.utc)
+    if end and d.time() != datetime.min.time():
+        d += timedelta(days=1)
+    return d.date().isoformat()
+
+
+def day_windows(windows: dict):
+    """Convert (start, end) datetime windows to rollup date windows"""
+    return {name: (day_bound(start), day_bound(end, end=True)) for name, (start, end) in windows.items()}
+
+
+def _facet_counts(result):
+    facets = result[0] if result else {}
+    return {name: (rows[0]["n"] if rows else 0) for name, rows in facets.items()}
+
+
+async def windowed_counts(db, collections: dict, windows: dict, match: dict = None):
+    """Return {short_name: {"total": n, window: n, ...}} for every collection.
+
+    All collections are aggregated concurrently, one $facet pipeline each.
+    """
+    pipeline = count_facet_pipeline(windows, match)
+    results = await asyncio.gather(*[
+        getattr(db, collection).aggregate(pipeline).to_list(1)
+        for collection in collections.values()
+    ])
+    return {name: _facet_counts(result) for name, result in zip(collections, results)}
+
+
+# ============ CHART PAYLOADS ============
+
+INTEREST_SCOPE_COLORS = {
+    "ACTIVELY INTERESTED": "#22c55e",
+    "LESS INTERESTED": "#f97316",
+    "RECALLING NEEDED": "#eab308",
+    "DROPOUT THIS YEAR": "#ef4444",
+    "ALREADY COLLEGE SELECTED": "#3b82f6",
+    "NOT INTERESTED": "#6b7280"
+}
+
+# Counter keys that are not call types / interest scopes
+SUMMARY_COUNTERS = {"total", "payout_total"}
+
+
+def call_distribution(call_counts: dict):
+    """Pie chart data from call counters keyed by call_type"""
+    return [
+        {"name": "Successful", "value": call_counts.get("successful", 0), "color": "#22c55e"},
+        {"name": "Failed", "value": call_counts.get("failed", 0), "color": "#ef4444"},
+        {"name": "Attempted", "value": call_counts.get("attempted", 0), "color": "#eab308"}
+    ]
+
+
+def interest_distribution(report_counts: dict):
+    """Pie chart data from report counters keyed by interest_scope, largest first"""
+    scopes = [(k, v) for k, v in report_counts.items() if k not in SUMMARY_COUNTERS and v]
+    scopes.sort(key=lambda item: item[1], reverse=True)
+    return [
+        {"name": scope, "value": count, "color": INTEREST_SCOPE_COLORS.get(scope, "#8b5cf6")}
+        for scope, count in scopes
+    ]
+
+
+def consultant_overview(totals: dict):
+    """Consultant overview cards from rollup window totals"""
+    def count(window, metric):
+        return totals.get(window, {}).get(metric, {}).get("total", 0)
+
+    return {
+        "total_reports": count("total", "reports"),
+        "total_calls": count("total", "calls"),
+        "total_admissions": count("total", "admissions"),
+        "today_reports": count("today", "reports"),
+        "today_calls": count("today", "calls"),
+        "week_reports": count("week", "reports")
+    }
+
+
+def reports_trend(series):
+    """Reports trend chart data from rollup buckets"""
+    return [
+        {"date": b["label"], "start": b["start"].isoformat(), "reports": b["counts"].get("total", 0)}
+        for b in series
+    ]
+
+
+def admissions_trend(series):
+    """Admissions trend chart data from rollup buckets"""
+    return [
+        {"month": b["label"], "start": b["start"].isoformat(), "admissions": b["counts"].get("total", 0)}
+        for b in series
+    ]
+
+
+def daily_calls(series):
+    """Per call type trend chart data from rollup buckets"""
+    return [
+        {
+            "date": b["label"],
+            "start": b["start"].isoformat(),
+            "successful": b["counts"].get("successful", 0),
+            "failed": b["counts"].get("failed", 0),
+            "attempted": b["counts"].get("attempted", 0)
+        }
+        for b in series
+    ]
+
+
+def admin_overview(rollup_totals: dict, query_counts: dict):
+    """Admin overview cards and per-window counts.
+
+    rollup_totals comes from rollup window totals (reports, calls, admissions)
+    and query_counts from windowed_counts over student_queries.
+    """
+    def count(window, name):
+        if name == "queries":
+            return query_counts.get(window, 0)
+        return rollup_totals.get(window, {}).get(name, {}).get("total", 0)
+
+    overview = {
+        "total_reports": count("total", "reports"),
+        "total_calls": count("total", "calls"),
+        "total_admissions": count("total", "admissions"),
+        "total_queries": count("total", "queries"),
+        "today_reports": count("today", "reports"),
+        "today_calls": count("today", "calls"),
+        "week_reports": count("week", "reports"),
+        "month_admissions": count("month", "admissions")
+    }
+    windows = {
+        window: {name: count(window, name) for name in OVERVIEW_COLLECTIONS}
+        for window in rollup_totals if window != "total"
+    }
+    return overview, windows
+
+
+def consultant_performance(ranking, names: dict):
+    """Performance bar chart data from rollup_consultant_ranking rows.
+
+    Current consultant names take precedence over the name stored in the rollups.
+    """
+    performance = []
+    for row in ranking:
+        name = names.get(row["consultant_id"]) or row.get("consultant_name") or row["consultant_id"]
+        performance.append({
+            "consultant_id": row["consultant_id"],
+            "name": name.split()[0],
+            "fullName": name,
+            "reports": row["reports"],
+            "calls": row["calls"],
+            "successful_calls": row["successful_calls"],
+            "admissions": row["admissions"]
+        })
+    return performance
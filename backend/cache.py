@@ -0,0 +1,231 @@
+"""
+In-process analytics cache.
+
+Analytics and leaderboard responses are cached per endpoint + parameters
+(which include the consultant_id for consultant endpoints) with a TTL and LRU
+eviction. Every entry remembers the version of each collection it was built
+from; write paths bump those versions, so an entry is invalidated as soon as
+one of its collections changes instead of waiting for the TTL. A write path
+bumps only after the write and everything derived from it (snapshots,
+rollups, status counts) is stored: a read between a bump and a derived write
+would cache the old counters under the new version.
+
+The same versions drive conditional GETs: @conditional (and @cached, which
+applies it) sends an ETag derived from the versions an endpoint depends on and
+answers a matching If-None-Match with 304 before the endpoint runs a query.
+
+Cache entries live in each API worker process, but the versions are shared:
+init_analytics_cache stores them in the `cache_versions` collection
+({_id: <collection>, version}), every bump increments them there and each
+cached or conditional request reads the ones it depends on (one _id lookup)
+before answering. A write through any worker therefore changes the ETag and
+invalidates cached entries in all of them. Without init_analytics_cache (a
+single process, e.g. scripts) the versions stay in memory. ETags also carry a
+time window, so a write that bypasses the API and does not bump is picked up
+within ETAG_MAX_AGE seconds.
+
+Settings (environment):
+    ANALYTICS_CACHE_TTL          seconds an entry stays fresh (default 30, 0 disables)
+    ANALYTICS_CACHE_MAX_ENTRIES  entries kept before LRU eviction (default 512)
+    ETAG_MAX_AGE                 seconds an ETag stays valid without a write (default 60)
+"""
+import functools
+import hashlib
+import inspect
+import os
+import time
+import uuid
+from collections import OrderedDict
+from fastapi import Request, Response
+from pymongo import ReturnDocument
+
+
+class AnalyticsCache:
+    """TTL + LRU cache invalidated by per-collection version counters"""
+
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._versions = {}
+        # Collection holding the shared versions, set by init_analytics_cache
+        self._store = None
+        self._stats = {"hits": 0, "misses": 0, "expirations": 0, "invalidations": 0, "evictions": 0}
+        self._endpoint_stats = {}
+
+    @property
+    def shared(self) -> bool:
+        return self._store is not None
+
+    def use_store(self, store):
+        """Keep the versions in a Mongo collection shared by every worker"""
+        self._store = store
+
+    def version(self, collection: str) -> int:
+        return self._versions.get(collection, 0)
+
+    async def bump(self, *collections: str):
+        """Record a write to the given collections, once it and its derived writes are stored"""
+        for collection in collections:
+            if self._store is None:
+                self._versions[collection] = self._versions.get(collection, 0) + 1
+                continue
+            doc = await self._store.find_one_and_update(
+                {"_id": collection}, {"$inc": {"version": 1}},
+                upsert=True, return_document=ReturnDocument.AFTER
+            )
+            self._versions[collection] = doc["version"]
+
+    async def refresh(self, collections) -> dict:
+        """Current versions of the given collections, read from the shared store if there is one"""
+        if self._store is not None and collections:
+            async for doc in self._store.find({"_id": {"$in": list(collections)}}):
+                self._versions[doc["_id"]] = doc["version"]
+        return self.versions(collections)
+
+    def _count(self, endpoint: str, outcome: str):
+        self._stats[outcome] += 1
+        endpoint_stats = self._endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0})
+        endpoint_stats["hits" if outcome == "hits" else "misses"] += 1
+
+    def get(self, key):
+        """Return (True, value) for a fresh entry, (False, None) otherwise"""
+        endpoint = key[0]
+        entry = self._entries.get(key)
+        if entry is None:
+            self._count(endpoint, "misses")
+            return False, None
+
+        expires_at, versions, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            self._count(endpoint, "misses")
+            return False, None
+        if any(self.version(c) != v for c, v in versions.items()):
+            del self._entries[key]
+            self._stats["invalidations"] += 1
+            self._count(endpoint, "misses")
+            return False, None
+
+        self._entries.move_to_end(key)
+        self._count(endpoint, "hits")
+        return True, value
+
+    def versions(self, collections):
+        """Current versions of the given collections, taken before computing a value"""
+        return {c: self.version(c) for c in collections}
+
+    def set(self, key, value, versions: dict):
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, versions, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups * 100, 1) if lookups else 0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "collection_versions": dict(self._versions),
+            "shared_versions": self.shared,
+            "endpoints": {name: dict(s) for name, s in sorted(self._endpoint_stats.items())}
+        }
+
+
+analytics_cache = AnalyticsCache(
+    ttl_seconds=float(os.environ.get("ANALYTICS_CACHE_TTL", 30)),
+    max_entries=int(os.environ.get("ANALYTICS_CACHE_MAX_ENTRIES", 512))
+)
+
+
+async def init_analytics_cache(db):
+    """Share the collection versions between workers through db.cache_versions"""
+    analytics_cache.use_store(db.cache_versions)
+
+
+ETAG_MAX_AGE = max(float(os.environ.get("ETAG_MAX_AGE", 60)), 1)
+
+# In-memory versions restart from zero with the process, so their tags must not outlive it
+_PROCESS_TAG = uuid.uuid4().hex
+
+
+def etag_for(key, versions: dict) -> str:
+    """Weak ETag for an endpoint key and the collection versions it was built from"""
+    window = int(time.time() // ETAG_MAX_AGE)
+    scope = "shared" if analytics_cache.shared else _PROCESS_TAG
+    raw = repr((scope, window, key, sorted(versions.items())))
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()[:24]}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" match
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional(*depends_on: str):
+    """Send an ETag and answer a matching If-None-Match with 304 Not Modified.
+
+    Place below the @router decorator. The tag covers the endpoint name, its
+    keyword arguments and the versions of depends_on, read before the
+    endpoint runs so a racing write changes the next tag.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, etag_request: Request, etag_response: Response, **kwargs):
+            key = (func.__name__, tuple(sorted(kwargs.items())))
+            etag = etag_for(key, await analytics_cache.refresh(depends_on))
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag_matches(etag_request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            value = await func(*args, **kwargs)
+            etag_response.headers.update(headers)
+            return value
+
+        # FastAPI reads the signature to inject the request and response
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("etag_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter("etag_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+        ])
+        return wrapper
+    return decorator
+
+
+def cached(*depends_on: str):
+    """Cache an endpoint's response until its TTL expires or a dependency is written.
+
+    Place below the @router decorator; the cache key is the endpoint name plus
+    its keyword arguments (path and query parameters). Cached endpoints are
+    also @conditional on the same collections, which refreshes their versions
+    before the lookup.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__name__, tuple(sorted(kwargs.items())))
+            hit, value = analytics_cache.get(key)
+            if hit:
+                return value
+            # Versions are taken first so a write racing the query invalidates the result
+            versions = analytics_cache.versions(depends_on)
+            value = await func(*args, **kwargs)
+            analytics_cache.set(key, value, versions)
+            return value
+        return conditional(*depends_on)(wrapper)
+    return decorator
@@ -0,0 +1,112 @@
+"""
+Pre-compressed catalog payloads.
+
+The /colleges and /courses lists only change when seed_data.py runs, so their
+JSON bodies are encoded and compressed (brotli and gzip) once by init_catalog
+at startup and served from memory with the Content-Encoding the client
+accepts. GZipMiddleware leaves responses that already carry a
+Content-Encoding alone.
+
+seed_data.py bumps the shared cache versions of the two collections (see
+cache.py). A request that sees a newer version than its payload was built
+from reloads it: one request per collection does the work behind a lock, the
+compression runs on the default executor, and the others wait for the lock
+and serve the new payload.
+"""
+import asyncio
+import gzip
+import hashlib
+import brotli
+import orjson
+from fastapi import Response
+from cache import analytics_cache, etag_matches
+
+CATALOG_COLLECTIONS = ("colleges", "courses")
+
+# Preferred first; identity is always acceptable
+CATALOG_ENCODINGS = ("br", "gzip")
+
+
+class CatalogPayload:
+    """A response body with its compressed variants and ETag"""
+
+    def __init__(self, body: bytes, version: int):
+        self.bodies = {
+            "br": brotli.compress(body, quality=11),
+            "gzip": gzip.compress(body, compresslevel=9),
+            "identity": body,
+        }
+        self.etag = f'W/"{hashlib.sha1(body).hexdigest()[:24]}"'
+        # Shared cache version of the collection the body was read at
+        self.version = version
+
+
+_payloads = {}
+_reload_locks = {name: asyncio.Lock() for name in CATALOG_COLLECTIONS}
+
+
+async def load_catalog(db, name: str) -> CatalogPayload:
+    """Read a catalog collection and compress its list response off the event loop"""
+    # Taken before the read, so a re-seed racing it triggers another reload
+    version = (await analytics_cache.refresh((name,)))[name]
+    docs = await getattr(db, name).find({}, {"_id": 0}).to_list(1000)
+    body = orjson.dumps({
+        "success": True,
+        name: docs,
+        "count": len(docs)
+    })
+    loop = asyncio.get_running_loop()
+    _payloads[name] = await loop.run_in_executor(None, CatalogPayload, body, version)
+    return _payloads[name]
+
+
+async def init_catalog(db):
+    for name in CATALOG_COLLECTIONS:
+        await load_catalog(db, name)
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Best of CATALOG_ENCODINGS allowed by an Accept-Encoding header, else identity"""
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for coding in CATALOG_ENCODINGS:
+        if weights.get(coding, weights.get("*", 0.0)) > 0:
+            return coding
+    return "identity"
+
+
+async def current_payload(db, name: str) -> CatalogPayload:
+    """The payload of a catalog collection, reloaded once per re-seed"""
+    version = (await analytics_cache.refresh((name,)))[name]
+    payload = _payloads.get(name)
+    if payload is not None and payload.version >= version:
+        return payload
+    async with _reload_locks[name]:
+        # Another request may have reloaded it while this one waited
+        payload = _payloads.get(name)
+        if payload is None or payload.version < version:
+            payload = await load_catalog(db, name)
+        return payload
+
+
+async def catalog_response(db, name: str, accept_encoding: str = None, if_none_match: str = None) -> Response:
+    """Serve a catalog list from memory, reloading it after a re-seed"""
+    payload = await current_payload(db, name)
+
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(if_none_match, payload.etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=payload.bodies[encoding], media_type="application/json", headers=headers)
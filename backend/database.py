@@ -1,14 +1,96 @@
+"""
+MongoDB client.
+
+Pool and connection settings come from the environment; unset ones keep the
+PyMongo defaults. Size the pool from the checkout waits and in-use peaks at
+/api/admin/perf/pool (pool_monitor in perf.py).
+
+    MONGO_MAX_POOL_SIZE                  connections per server (PyMongo default 100)
+    MONGO_MIN_POOL_SIZE                  connections kept open when idle (default 0)
+    MONGO_MAX_IDLE_TIME_MS               close connections idle this long (default never)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS          fail a checkout after waiting this long (default never)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS    wait for a usable server (default 30000)
+    MONGO_COMPRESSORS                    wire compression in order of preference,
+                                         e.g. "zstd,snappy,zlib" (default none); zstd
+                                         needs the zstandard package, snappy python-snappy
+
+An unknown compressor name fails startup; one whose package is not installed
+is dropped with a warning. /api/admin/perf/pool lists the compressors offered;
+the server picks the first of them it also supports for each connection.
+"""
 from motor.motor_asyncio import AsyncIOMotorClient
+import importlib.util
+import logging
 import os
 from dotenv import load_dotenv
 from pathlib import Path
+from perf import command_monitor, pool_monitor
+
+logger = logging.getLogger(__name__)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Client option -> environment variable
+CLIENT_INT_OPTIONS = {
+    "maxPoolSize": "MONGO_MAX_POOL_SIZE",
+    "minPoolSize": "MONGO_MIN_POOL_SIZE",
+    "maxIdleTimeMS": "MONGO_MAX_IDLE_TIME_MS",
+    "waitQueueTimeoutMS": "MONGO_WAIT_QUEUE_TIMEOUT_MS",
+    "serverSelectionTimeoutMS": "MONGO_SERVER_SELECTION_TIMEOUT_MS",
+}
+
+# Compressor -> module it needs
+COMPRESSOR_MODULES = {
+    "zstd": "zstandard",
+    "snappy": "snappy",
+    "zlib": "zlib",
+}
+
+
+def available_compressors(value: str) -> list:
+    """Compressors named in value whose module is installed.
+
+    Raises ValueError for a name PyMongo does not support.
+    """
+    compressors = []
+    for name in (part.strip().lower() for part in value.split(",")):
+        if not name:
+            continue
+        if name not in COMPRESSOR_MODULES:
+            raise ValueError(f"Unknown compressor in MONGO_COMPRESSORS: {name}. "
+                             f"Must be one of: {list(COMPRESSOR_MODULES)}")
+        if importlib.util.find_spec(COMPRESSOR_MODULES[name]) is None:
+            logger.warning(f"MONGO_COMPRESSORS: {name} needs the {COMPRESSOR_MODULES[name]} module, "
+                           f"which is not installed; not offering it")
+            continue
+        compressors.append(name)
+    return compressors
+
+
+def client_options() -> dict:
+    """Client options set in the environment"""
+    options = {
+        option: int(os.environ[variable])
+        for option, variable in CLIENT_INT_OPTIONS.items() if os.environ.get(variable)
+    }
+    compressors = available_compressors(os.environ.get("MONGO_COMPRESSORS", ""))
+    if compressors:
+        options["compressors"] = compressors
+    return options
+
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+CLIENT_OPTIONS = client_options()
+# Timestamps are BSON dates read back as aware UTC datetimes (timestamps.py);
+# the monitors feed the slow-query log and pool metrics (perf.py)
+client = AsyncIOMotorClient(
+    mongo_url,
+    tz_aware=True,
+    event_listeners=[command_monitor, pool_monitor],
+    **CLIENT_OPTIONS
+)
 db = client[os.environ['DB_NAME']]
 
 def get_database():
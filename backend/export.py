@@ -0,0 +1,122 @@
+"""
+Streaming data export.
+
+GET /admin/export/{collection} iterates a Motor cursor and yields CSV or
+NDJSON chunks into a StreamingResponse, so the worker holds one batch of
+documents at a time however many rows are exported.
+
+The filters are the ones used by bulk delete (consultant_id plus an inclusive
+start/end date), built by bulk_data_filter for both.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from models import StudentQuery, ConsultantReport, CallLog, Admission
+from pagination import PAGE_SORT
+from timeseries import created_at_range
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+# Export name (the bulk delete type) -> (collection, CSV columns)
+EXPORT_COLLECTIONS = {
+    "reports": ("consultant_reports", list(ConsultantReport.model_fields)),
+    "calls": ("call_logs", list(CallLog.model_fields)),
+    "admissions": ("admissions", list(Admission.model_fields)),
+    "queries": ("student_queries", list(StudentQuery.model_fields)),
+}
+
+# Consultant-owned collections that can be filtered by consultant_id
+CONSULTANT_COLLECTIONS = {"consultant_reports", "call_logs", "admissions"}
+
+# Documents encoded per yielded chunk
+EXPORT_BATCH_SIZE = 500
+
+
+def bulk_data_filter(collection_name: str, consultant_id: str = None, start_date: str = None, end_date: str = None):
+    """Filter shared by bulk delete and export; dates are YYYY-MM-DD and inclusive.
+
+    Raises ValueError for malformed dates.
+    """
+    query = {}
+    if consultant_id and collection_name in CONSULTANT_COLLECTIONS:
+        query["consultant_id"] = consultant_id
+    if start_date or end_date:
+        start = datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc) if start_date else None
+        end = datetime.fromisoformat(end_date).replace(tzinfo=timezone.utc) + timedelta(days=1) if end_date else None
+        query.update(created_at_range(start, end))
+    return query
+
+
+def _json_default(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+async def csv_chunks(cursor, columns):
+    """Yield a header then CSV rows, EXPORT_BATCH_SIZE documents per chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    rows = 0
+    async for doc in cursor:
+        writer.writerow([_cell(doc.get(column)) for column in columns])
+        rows += 1
+        if rows % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def ndjson_chunks(cursor):
+    """Yield one JSON document per line, EXPORT_BATCH_SIZE documents per chunk"""
+    lines = []
+    async for doc in cursor:
+        lines.append(json.dumps(doc, default=_json_default))
+        if len(lines) == EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_stream(
+    db,
+    name: str,
+    export_format: str,
+    consultant_id: str = None,
+    start_date: str = None,
+    end_date: str = None
+):
+    """(chunk generator, media type, file name) for an export.
+
+    Raises ValueError for an unknown collection or format or a malformed date.
+    """
+    if name not in EXPORT_COLLECTIONS:
+        raise ValueError(f"Invalid collection. Must be one of: {list(EXPORT_COLLECTIONS)}")
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid format. Must be one of: {list(EXPORT_FORMATS)}")
+
+    collection_name, columns = EXPORT_COLLECTIONS[name]
+    query = bulk_data_filter(collection_name, consultant_id, start_date, end_date)
+    cursor = getattr(db, collection_name).find(
+        query, {"_id": 0, "search_keys": 0}
+    ).sort(PAGE_SORT).batch_size(EXPORT_BATCH_SIZE)
+
+    media_type, extension = EXPORT_FORMATS[export_format]
+    chunks = csv_chunks(cursor, columns) if export_format == "csv" else ndjson_chunks(cursor)
+    filename = f"{name}-{datetime.now(timezone.utc).strftime('%Y-%m-%d')}.{extension}"
+    return chunks, media_type, filename
@@ -0,0 +1,158 @@
+"""
+Declarative index registry.
+
+INDEXES lists every index the API relies on, per collection. init_indexes
+creates them at startup; create_indexes is a no-op for an index that already
+exists with the same options, so it is safe on every start. An index that
+cannot be built (duplicate values under a unique index, or an existing index
+with the same keys and other options) is logged and skipped, and shows up as
+missing in the audit.
+
+audit_indexes compares the registry with the live indexes and reports the
+missing ones, those with no recorded use since the server started
+($indexStats) and the size of each.
+"""
+import logging
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+from pagination import PAGE_SORT
+from sync import SYNC_TOMBSTONE_DAYS
+
+logger = logging.getLogger(__name__)
+
+
+def _unique_id():
+    return IndexModel([("id", 1)], unique=True)
+
+
+INDEXES = {
+    "consultants": [
+        IndexModel([("user_id", 1)], unique=True),
+    ],
+    "consultant_reports": [
+        _unique_id(),
+        # Newest-first listings; their prefixes also serve (consultant_id, created_at) ranges
+        IndexModel(PAGE_SORT),
+        IndexModel([("consultant_id", 1), *PAGE_SORT]),
+        # Duplicate check on report submission and phone history (phones.py)
+        IndexModel([("phone_key", 1), *PAGE_SORT]),
+        # Admin and consultant reminder lists
+        IndexModel([("followup_completed", 1), ("next_followup_date", 1)]),
+        IndexModel([("consultant_id", 1), ("followup_completed", 1), ("next_followup_date", 1)]),
+        # Delta sync
+        IndexModel([("consultant_id", 1), ("updated_at", 1)]),
+    ],
+    "call_logs": [
+        _unique_id(),
+        IndexModel(PAGE_SORT),
+        IndexModel([("consultant_id", 1), *PAGE_SORT]),
+        IndexModel([("call_type", 1), *PAGE_SORT]),
+        IndexModel([("consultant_id", 1), ("call_type", 1), *PAGE_SORT]),
+        # Replacing the auto-logged call when a report is updated, and phone history
+        IndexModel([("phone_key", 1), *PAGE_SORT]),
+    ],
+    "admissions": [
+        _unique_id(),
+        IndexModel(PAGE_SORT),
+        IndexModel([("consultant_id", 1), *PAGE_SORT]),
+        IndexModel([("consultant_id", 1), ("updated_at", 1)]),
+    ],
+    "student_queries": [
+        _unique_id(),
+        # Inbox filters, each ending in the page sort order, and prefix search
+        IndexModel(PAGE_SORT),
+        IndexModel([("status", 1), *PAGE_SORT]),
+        IndexModel([("course", 1), *PAGE_SORT]),
+        IndexModel([("search_keys", 1)]),
+        IndexModel([("phone_key", 1), *PAGE_SORT]),
+    ],
+    "daily_rollups": [
+        IndexModel([("consultant_id", 1), ("date", 1), ("metric", 1)], unique=True),
+        IndexModel([("metric", 1), ("date", 1)]),
+    ],
+    "leaderboard_snapshots": [
+        IndexModel([("period", 1), ("bucket", 1), ("consultant_id", 1)], unique=True),
+    ],
+    "sync_tombstones": [
+        IndexModel([("consultant_id", 1), ("deleted_at", 1)]),
+        IndexModel([("deleted_at", 1)], expireAfterSeconds=SYNC_TOMBSTONE_DAYS * 86400),
+    ],
+}
+
+
+def _key_pattern(keys) -> tuple:
+    """((field, direction), ...) from an index key document or list; 1.0 and 1 compare equal"""
+    if hasattr(keys, "items"):
+        keys = keys.items()
+    return tuple((field, direction if isinstance(direction, str) else int(direction)) for field, direction in keys)
+
+
+def _signature(spec: dict) -> tuple:
+    """Keys plus the options that make two indexes on the same keys different"""
+    ttl = spec.get("expireAfterSeconds")
+    return _key_pattern(spec["key"]), bool(spec.get("unique")), None if ttl is None else int(ttl)
+
+
+async def init_indexes(db):
+    """Create every registered index, logging the ones that cannot be built"""
+    created, failed = 0, 0
+    for collection_name, models in INDEXES.items():
+        collection = getattr(db, collection_name)
+        for model in models:
+            try:
+                await collection.create_indexes([model])
+                created += 1
+            except OperationFailure as e:
+                failed += 1
+                logger.error(f"Could not create index {model.document['name']} on {collection_name}: {e}")
+    return {"indexes": created, "failed": failed}
+
+
+async def audit_indexes(db):
+    """Missing, unused and unregistered indexes with their sizes, per collection"""
+    existing_collections = set(await db.list_collection_names())
+    collections = sorted(
+        (set(INDEXES) | existing_collections) - {name for name in existing_collections if name.startswith("system.")}
+    )
+
+    report = {"collections": {}, "missing": [], "unused": [], "total_index_size_bytes": 0}
+    for collection_name in collections:
+        collection = getattr(db, collection_name)
+        registered = {_signature(model.document): model.document for model in INDEXES.get(collection_name, [])}
+
+        indexes, usage, sizes = {}, {}, {}
+        if collection_name in existing_collections:
+            indexes = await collection.index_information()
+            usage = {
+                stat["name"]: stat["accesses"]
+                async for stat in collection.aggregate([{"$indexStats": {}}])
+            }
+            stats = await collection.aggregate([{"$collStats": {"storageStats": {}}}]).to_list(1)
+            sizes = stats[0]["storageStats"].get("indexSizes", {}) if stats else {}
+
+        rows, present = [], set()
+        for name, info in indexes.items():
+            signature = _signature(info)
+            present.add(signature)
+            accesses = usage.get(name, {})
+            row = {
+                "name": name,
+                "keys": dict(_key_pattern(info["key"])),
+                "unique": bool(info.get("unique")),
+                "registered": signature in registered or name == "_id_",
+                "ops": accesses.get("ops", 0),
+                "since": accesses["since"].isoformat() if accesses.get("since") else None,
+                "size_bytes": sizes.get(name, 0),
+            }
+            rows.append(row)
+            report["total_index_size_bytes"] += row["size_bytes"]
+            if name != "_id_" and not row["ops"]:
+                report["unused"].append({"collection": collection_name, "name": name})
+
+        missing = [
+            {"name": spec["name"], "keys": dict(_key_pattern(spec["key"])), "unique": bool(spec.get("unique"))}
+            for signature, spec in registered.items() if signature not in present
+        ]
+        report["missing"].extend({"collection": collection_name, **index} for index in missing)
+        report["collections"][collection_name] = {"indexes": rows, "missing": missing}
+    return report
@@ -0,0 +1,349 @@
+"""
+Leaderboard engine.
+
+Per-consultant counters (reports, calls by type, admissions) are kept
+incrementally in the `leaderboard_snapshots` collection: one document per
+consultant, period (all/weekly/monthly) and bucket (the week start date or the
+month), updated with atomic $inc from every write path that changes them (see
+leaderboard_deltas_from_docs / leaderboard_deltas_for). GET /leaderboard reads
+the current buckets directly, and `rebuild_leaderboard_snapshots` recomputes
+everything from the raw collections with one grouped aggregation per
+collection, run concurrently.
+
+Rolling (7d/30d/90d) and custom date-range leaderboards have no snapshot bucket;
+they are summed from the daily rollups instead (see rollups.py).
+"""
+import asyncio
+import logging
+from datetime import datetime, date, timezone, timedelta
+from pymongo import UpdateOne, ReplaceOne, DeleteOne
+from timeseries import day_key_expr, day_key
+from rollups import date_range_filter
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = [
+    "total_reports",
+    "total_calls",
+    "successful_calls",
+    "failed_calls",
+    "attempted_calls",
+    "total_admissions",
+]
+
+
+def compute_badges(total_reports, total_calls, successful_calls, total_admissions, success_rate):
+    """Determine the badges earned for a set of counters"""
+    badges = []
+    if total_reports >= 50:
+        badges.append({"name": "Report Master", "icon": "file-text", "color": "#8b5cf6"})
+    elif total_reports >= 20:
+        badges.append({"name": "Active Reporter", "icon": "file-text", "color": "#3b82f6"})
+    if successful_calls >= 100:
+        badges.append({"name": "Call Champion", "icon": "phone", "color": "#22c55e"})
+    elif successful_calls >= 30:
+        badges.append({"name": "Steady Caller", "icon": "phone", "color": "#06b6d4"})
+    if success_rate >= 90 and total_calls >= 10:
+        badges.append({"name": "Sharpshooter", "icon": "target", "color": "#f59e0b"})
+    if total_admissions >= 10:
+        badges.append({"name": "Enrollment King", "icon": "crown", "color": "#f59e0b"})
+    elif total_admissions >= 3:
+        badges.append({"name": "Closer", "icon": "award", "color": "#ec4899"})
+    if total_calls >= 5 and total_calls == successful_calls:
+        badges.append({"name": "Perfect Streak", "icon": "zap", "color": "#eab308"})
+    return badges
+
+
+def build_leaderboard(consultants, counters):
+    """Score, rank and decorate consultants from precomputed counters.
+
+    Consultants are visited in the order given and sorted with a stable sort, so
+    ties keep the same relative order as the original per-consultant loop.
+    """
+    leaderboard = []
+    for c in consultants:
+        cid = c["user_id"]
+        row = counters.get(cid) or {field: 0 for field in COUNTER_FIELDS}
+
+        total_reports = row["total_reports"]
+        total_calls = row["total_calls"]
+        successful_calls = row["successful_calls"]
+        failed_calls = row["failed_calls"]
+        attempted_calls = row["attempted_calls"]
+        total_admissions = row["total_admissions"]
+
+        success_rate = round((successful_calls / total_calls * 100), 1) if total_calls > 0 else 0
+        score = (total_reports * 10) + (successful_calls * 5) + (total_admissions * 50) + (attempted_calls * 2)
+
+        leaderboard.append({
+            "consultant_id": cid,
+            "consultant_name": c["name"],
+            "total_reports": total_reports,
+            "total_calls": total_calls,
+            "successful_calls": successful_calls,
+            "failed_calls": failed_calls,
+            "attempted_calls": attempted_calls,
+            "total_admissions": total_admissions,
+            "success_rate": success_rate,
+            "score": score,
+            "badges": compute_badges(total_reports, total_calls, successful_calls, total_admissions, success_rate)
+        })
+
+    # Sort by score descending
+    leaderboard.sort(key=lambda x: x["score"], reverse=True)
+
+    # Assign ranks and medals
+    medals = ["gold", "silver", "bronze"]
+    for i, entry in enumerate(leaderboard):
+        entry["rank"] = i + 1
+        entry["medal"] = medals[i] if i < len(medals) else None
+
+    return leaderboard
+
+
+# ============ SNAPSHOTS ============
+
+SNAPSHOT_PERIODS = ["all", "weekly", "monthly"]
+
+# Counter fields produced by each raw collection
+COLLECTION_COUNTERS = {
+    "consultant_reports": ["total_reports"],
+    "call_logs": ["total_calls", "successful_calls", "failed_calls", "attempted_calls"],
+    "admissions": ["total_admissions"],
+}
+
+
+def snapshot_buckets(day: str) -> dict:
+    """Map a YYYY-MM-DD day to the bucket it belongs to for every period"""
+    buckets = {"all": "all"}
+    try:
+        d = date.fromisoformat(day)
+    except ValueError:
+        return buckets
+    buckets["weekly"] = (d - timedelta(days=d.weekday())).isoformat()
+    buckets["monthly"] = d.strftime("%Y-%m")
+    return buckets
+
+
+def current_bucket(period: str, now: datetime = None) -> str:
+    """Bucket holding the counters for the current period"""
+    today = (now or datetime.now(timezone.utc)).strftime("%Y-%m-%d")
+    return snapshot_buckets(today).get(period, "all")
+
+
+async def init_leaderboard_snapshots(db):
+    """Build snapshots on first start (indexes are created by init_indexes)"""
+    if await db.leaderboard_snapshots.estimated_document_count() == 0:
+        result = await rebuild_leaderboard_snapshots(db)
+        logger.info(f"Leaderboard snapshots built: {result['snapshot_count']} documents")
+
+
+def leaderboard_deltas_from_docs(collection_name: str, docs):
+    """Counters contributed by freshly written documents, grouped by snapshot key.
+
+    Pass the result to apply_leaderboard_deltas after the insert.
+    """
+    if collection_name not in COLLECTION_COUNTERS:
+        return {}
+    rows = []
+    for doc in docs:
+        row = {"_id": {"consultant_id": doc.get("consultant_id"), "day": day_key(doc.get("created_at"))}}
+        if collection_name == "call_logs":
+            call_type = doc.get("call_type")
+            row.update({
+                "total_calls": 1,
+                "successful_calls": int(call_type == "successful"),
+                "failed_calls": int(call_type == "failed"),
+                "attempted_calls": int(call_type == "attempted"),
+            })
+        else:
+            row[COLLECTION_COUNTERS[collection_name][0]] = 1
+        rows.append(row)
+    return _rollup_daily_counts(collection_name, rows)
+
+
+def _daily_counts_pipeline(collection_name: str, match: dict = None):
+    def count_type(call_type):
+        return {"$sum": {"$cond": [{"$eq": ["$call_type", call_type]}, 1, 0]}}
+
+    group = {"_id": {"consultant_id": "$consultant_id", "day": day_key_expr()}}
+    if collection_name == "call_logs":
+        group.update({
+            "total_calls": {"$sum": 1},
+            "successful_calls": count_type("successful"),
+            "failed_calls": count_type("failed"),
+            "attempted_calls": count_type("attempted"),
+        })
+    else:
+        group[COLLECTION_COUNTERS[collection_name][0]] = {"$sum": 1}
+
+    pipeline = []
+    if match:
+        pipeline.append({"$match": match})
+    pipeline.append({"$group": group})
+    return pipeline
+
+
+def _rollup_daily_counts(collection_name: str, rows, into: dict = None):
+    """Fold (consultant, day) rows into {(period, bucket, consultant_id): counters}"""
+    snapshots = {} if into is None else into
+    for row in rows:
+        cid = row["_id"].get("consultant_id")
+        if not cid:
+            continue
+        for period, bucket in snapshot_buckets(row["_id"].get("day") or "").items():
+            counters = snapshots.setdefault((period, bucket, cid), {field: 0 for field in COUNTER_FIELDS})
+            for field in COLLECTION_COUNTERS[collection_name]:
+                counters[field] += row[field]
+    return snapshots
+
+
+async def leaderboard_deltas_for(db, collection_name: str, query: dict):
+    """Counters held by the documents matching query, grouped by snapshot key.
+
+    Call this before a delete_many and pass the result to
+    apply_leaderboard_deltas afterwards with sign=-1.
+    """
+    if collection_name not in COLLECTION_COUNTERS:
+        return {}
+    collection = getattr(db, collection_name)
+    rows = await collection.aggregate(_daily_counts_pipeline(collection_name, query)).to_list(None)
+    return _rollup_daily_counts(collection_name, rows)
+
+
+async def apply_leaderboard_deltas(db, deltas: dict, sign: int = 1):
+    """$inc snapshot counters by precomputed deltas"""
+    now = datetime.now(timezone.utc)
+    operations = []
+    for (period, bucket, cid), counters in deltas.items():
+        inc = {field: sign * value for field, value in counters.items() if value}
+        if inc:
+            operations.append(UpdateOne(
+                {"period": period, "bucket": bucket, "consultant_id": cid},
+                {"$inc": inc, "$set": {"updated_at": now}},
+                upsert=True
+            ))
+    if operations:
+        await db.leaderboard_snapshots.bulk_write(operations, ordered=False)
+
+
+async def get_leaderboard_snapshot_counters(db, period: str = "all"):
+    """Read the current bucket of a period as {consultant_id: counters}"""
+    if period not in SNAPSHOT_PERIODS:
+        period = "all"
+    docs = await db.leaderboard_snapshots.find(
+        {"period": period, "bucket": current_bucket(period)},
+        {"_id": 0, "consultant_id": 1, **{field: 1 for field in COUNTER_FIELDS}}
+    ).to_list(None)
+    return {
+        doc["consultant_id"]: {field: doc.get(field, 0) for field in COUNTER_FIELDS}
+        for doc in docs
+    }
+
+
+# ============ ROLLING AND CUSTOM WINDOWS ============
+
+# Rolling periods -> number of days, today included
+ROLLING_PERIODS = {"7d": 7, "30d": 30, "90d": 90}
+
+# Leaderboard counter -> (rollup metric, rollup counter key)
+ROLLUP_COUNTERS = {
+    "total_reports": ("reports", "total"),
+    "total_calls": ("calls", "total"),
+    "successful_calls": ("calls", "successful"),
+    "failed_calls": ("calls", "failed"),
+    "attempted_calls": ("calls", "attempted"),
+    "total_admissions": ("admissions", "total"),
+}
+
+
+def rolling_window(period: str, now: datetime = None):
+    """(start_day, end_day) rollup dates for a rolling period; end_day is open"""
+    today = (now or datetime.now(timezone.utc)).date()
+    return (today - timedelta(days=ROLLING_PERIODS[period] - 1)).isoformat(), None
+
+
+async def get_range_leaderboard_counters(db, start_day: str = None, end_day: str = None):
+    """Counters for an arbitrary date range as {consultant_id: counters}.
+
+    Read from daily_rollups with one $group over the (metric, date) index, so
+    the cost follows the number of consultant-days in the range rather than the
+    raw call and report history. end_day is exclusive.
+    """
+    match = {
+        "metric": {"$in": sorted({metric for metric, _ in ROLLUP_COUNTERS.values()})},
+        **date_range_filter(start_day, end_day)
+    }
+
+    rows = await db.daily_rollups.aggregate([
+        {"$match": match},
+        {"$group": {
+            "_id": "$consultant_id",
+            **{
+                field: {"$sum": {"$cond": [
+                    {"$eq": ["$metric", metric]},
+                    {"$ifNull": [f"$counts.{key}", 0]},
+                    0
+                ]}}
+                for field, (metric, key) in ROLLUP_COUNTERS.items()
+            }
+        }}
+    ]).to_list(None)
+    return {row["_id"]: {field: row.get(field, 0) for field in COUNTER_FIELDS} for row in rows}
+
+
+async def rebuild_leaderboard_snapshots(db, dry_run: bool = False):
+    """Recompute every snapshot from the raw collections and report drift.
+
+    Returns the number of snapshot documents and a list of drifted counters
+    (expected vs stored). With dry_run the stored snapshots are left untouched.
+    """
+    results = await asyncio.gather(*[
+        getattr(db, name).aggregate(_daily_counts_pipeline(name)).to_list(None)
+        for name in COLLECTION_COUNTERS
+    ])
+    expected = {}
+    for name, rows in zip(COLLECTION_COUNTERS, results):
+        _rollup_daily_counts(name, rows, into=expected)
+
+    stored = {
+        (doc["period"], doc["bucket"], doc["consultant_id"]): doc
+        async for doc in db.leaderboard_snapshots.find({})
+    }
+
+    drift = []
+    for key in set(expected) | set(stored):
+        want = expected.get(key) or {field: 0 for field in COUNTER_FIELDS}
+        have = stored.get(key) or {}
+        for field in COUNTER_FIELDS:
+            if want[field] != have.get(field, 0):
+                period, bucket, cid = key
+                drift.append({
+                    "consultant_id": cid,
+                    "period": period,
+                    "bucket": bucket,
+                    "field": field,
+                    "expected": want[field],
+                    "stored": have.get(field, 0)
+                })
+
+    if not dry_run:
+        now = datetime.now(timezone.utc)
+        operations = [
+            ReplaceOne(
+                {"period": period, "bucket": bucket, "consultant_id": cid},
+                {"period": period, "bucket": bucket, "consultant_id": cid, **counters, "updated_at": now},
+                upsert=True
+            )
+            for (period, bucket, cid), counters in expected.items()
+        ]
+        operations += [DeleteOne({"_id": doc["_id"]}) for key, doc in stored.items() if key not in expected]
+        if operations:
+            await db.leaderboard_snapshots.bulk_write(operations, ordered=False)
+
+    return {
+        "snapshot_count": len(expected),
+        "drift_count": len(drift),
+        "drift": sorted(drift, key=lambda d: (d["period"], d["bucket"], d["consultant_id"], d["field"])),
+        "dry_run": dry_run
+    }
@@ -0,0 +1,107 @@
+"""
+Maintenance commands run against the configured database.
+
+Usage:
+    python maintenance.py rebuild-leaderboard            # recompute and overwrite leaderboard snapshots
+    python maintenance.py rebuild-leaderboard --dry-run  # only report drift
+    python maintenance.py rebuild-rollups                # recompute and overwrite daily rollups
+    python maintenance.py rebuild-rollups --dry-run      # only report drift
+    python maintenance.py migrate-timestamps             # convert ISO string timestamps, resuming from the checkpoint
+    python maintenance.py migrate-timestamps --dry-run   # only count what would be converted
+    python maintenance.py migrate-timestamps --restart   # ignore checkpoints and rescan everything
+    python maintenance.py migrate-timestamps --batch-size 1000 --collection call_logs
+
+Exits with status 1 when a command fails.
+"""
+import argparse
+import asyncio
+import sys
+
+from cache import analytics_cache, init_analytics_cache
+from database import db, client
+from leaderboard import rebuild_leaderboard_snapshots
+from rollups import rebuild_daily_rollups
+from timestamps import MIGRATION_BATCH_SIZE, migrate_timestamps
+
+
+async def rebuild_leaderboard(args):
+    print("Rebuilding leaderboard snapshots..." if not args.dry_run else "Checking leaderboard snapshots for drift...")
+    result = await rebuild_leaderboard_snapshots(db, dry_run=args.dry_run)
+
+    for d in result["drift"]:
+        print(f"  {d['period']:<8} {d['bucket']:<10} {d['consultant_id']:<20} "
+              f"{d['field']:<18} stored={d['stored']} expected={d['expected']}")
+
+    print(f"\n{result['drift_count']} drifted counters across {result['snapshot_count']} snapshots")
+    if not args.dry_run:
+        # Running API workers drop cached leaderboards and their ETags
+        await analytics_cache.bump("consultant_reports", "call_logs", "admissions")
+        print("✅ Leaderboard snapshots rebuilt successfully!")
+
+
+async def rebuild_rollups(args):
+    print("Rebuilding daily rollups..." if not args.dry_run else "Checking daily rollups for drift...")
+    result = await rebuild_daily_rollups(db, dry_run=args.dry_run)
+
+    for d in result["drift"]:
+        print(f"  {d['metric']:<10} {d['date']:<10} {str(d['consultant_id']):<20} "
+              f"{d['counter']:<24} stored={d['stored']} expected={d['expected']}")
+
+    print(f"\n{result['drift_count']} drifted counters across {result['rollup_count']} rollups")
+    if not args.dry_run:
+        await analytics_cache.bump("consultant_reports", "call_logs", "admissions")
+        print("✅ Daily rollups rebuilt successfully!")
+
+
+async def migrate(args):
+    print("Migrating timestamps to BSON dates..." if not args.dry_run else "Counting string timestamps...")
+    results = await migrate_timestamps(
+        db, batch_size=args.batch_size, dry_run=args.dry_run, restart=args.restart, collections=args.collections
+    )
+
+    for name, result in results.items():
+        print(f"  {name:<20} converted={result['converted']:<8} unparseable={result['unparseable']:<6} "
+              f"batches={result['batches']:<6} remaining={result['remaining']}")
+    if not args.dry_run:
+        await analytics_cache.bump(*[name for name, result in results.items() if result["converted"]])
+        print("✅ Timestamps migrated successfully!")
+
+
+async def run(args) -> int:
+    """Run the selected command; returns the process exit status"""
+    try:
+        await init_analytics_cache(db)
+        await args.handler(args)
+        return 0
+    except Exception as e:
+        print(f"❌ {args.command} failed: {str(e)}", file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    leaderboard = commands.add_parser("rebuild-leaderboard", help="Rebuild leaderboard snapshots from raw data")
+    leaderboard.add_argument("--dry-run", action="store_true", help="Report drift without writing")
+    leaderboard.set_defaults(handler=rebuild_leaderboard)
+
+    rollups = commands.add_parser("rebuild-rollups", help="Rebuild daily rollups from raw data")
+    rollups.add_argument("--dry-run", action="store_true", help="Report drift without writing")
+    rollups.set_defaults(handler=rebuild_rollups)
+
+    timestamps = commands.add_parser("migrate-timestamps", help="Convert ISO string timestamps to BSON dates")
+    timestamps.add_argument("--dry-run", action="store_true", help="Count without writing")
+    timestamps.add_argument("--restart", action="store_true", help="Ignore saved checkpoints")
+    timestamps.add_argument("--batch-size", type=int, default=MIGRATION_BATCH_SIZE, help="Documents per batch")
+    timestamps.add_argument("--collection", action="append", dest="collections",
+                            help="Only this collection (repeatable)")
+    timestamps.set_defaults(handler=migrate)
+
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
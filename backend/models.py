@@ -1,8 +1,14 @@
 from pydantic import BaseModel, Field, EmailStr
 from typing import List, Optional, Dict
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
+
+def utc_now() -> datetime:
+    """Timestamps are stored as timezone-aware UTC BSON dates"""
+    return datetime.now(timezone.utc)
+
+
 # Student Query Models
 class StudentQueryCreate(BaseModel):
     name: str
@@ -21,8 +27,9 @@ class StudentQuery(BaseModel):
     course: str
     message: str
     status: str = "new"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    phone_key: Optional[str] = None  # normalised phone, see phones.py
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 # Placement Stats Model
 class PlacementStats(BaseModel):
@@ -79,9 +86,13 @@ class ConsultantReport(BaseModel):
     interest_scope: str
     next_followup_date: Optional[str] = None
     followup_completed: bool = False
+    followup_status: Optional[str] = None  # "ignored" when dismissed from reminders
     other_remarks: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    source: str = "individual"  # individual, bulk
+    auto_reminder: bool = False  # created from an attempted call
+    phone_key: Optional[str] = None  # normalised contact_number, see phones.py
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 # Call Log Model for detailed tracking
 class CallLogCreate(BaseModel):
@@ -98,7 +109,22 @@ class CallLog(BaseModel):
     contact_number: str
     call_type: str
     remarks: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    phone_key: Optional[str] = None  # normalised contact_number, see phones.py
+    created_at: datetime = Field(default_factory=utc_now)
+
+# Student Admission Model
+class Admission(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    student_name: str
+    course: str
+    college: str
+    admission_date: str
+    consultant_id: str
+    consultant_name: str
+    payout_amount: float
+    payout_status: str = "PAYOUT NOT CREDITED YET"
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
 class Course(BaseModel):
     id: str
@@ -0,0 +1,105 @@
+"""
+Keyset (cursor) pagination.
+
+List endpoints page through a collection newest first, ordered by
+(created_at, id). A page is fetched with a range condition on that pair
+instead of skip(), so with the compound indexes ending in PAGE_SORT
+(registered in indexes.py) every page costs the same whether it is the first
+or the ten-thousandth.
+
+Cursors are opaque to clients: the created_at and id of the last document of
+a page, JSON encoded and base64url wrapped. created_at is a BSON date, but an
+ISO string may remain on documents the timestamp migration could not convert;
+MongoDB sorts dates before strings when descending, so a date cursor also lets
+every string timestamp through.
+"""
+import base64
+import json
+from datetime import datetime
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+PAGE_SORT = [("created_at", -1), ("id", -1)]
+
+# Always returned with a sparse fieldset: next_cursor is built from them
+CURSOR_FIELDS = ("id", "created_at")
+
+
+def encode_cursor(doc: dict) -> str:
+    """Cursor pointing just past doc"""
+    created_at = doc.get("created_at")
+    if isinstance(created_at, datetime):
+        key = ["d", created_at.isoformat(), doc.get("id")]
+    else:
+        key = ["s", created_at, doc.get("id")]
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Return (created_at, id) from a cursor; raises ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        kind, created_at, doc_id = json.loads(raw)
+        if kind == "d":
+            created_at = datetime.fromisoformat(created_at)
+        elif kind != "s":
+            raise ValueError(kind)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    return created_at, doc_id
+
+
+def keyset_filter(cursor: str):
+    """Filter selecting the documents that sort after the cursor"""
+    created_at, doc_id = decode_cursor(cursor)
+    conditions = [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "id": {"$lt": doc_id}},
+    ]
+    if isinstance(created_at, datetime):
+        conditions.append({"created_at": {"$type": "string"}})
+    return {"$or": conditions}
+
+
+def validate_page_size(limit: int) -> int:
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise ValueError(f"Invalid limit. Must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+
+def field_projection(fields: str, model, default: dict = None) -> dict:
+    """MongoDB projection for a comma-separated fields= parameter.
+
+    Only fields defined on the pydantic model are accepted; id and created_at
+    are always included. Without fields the default projection is returned.
+    Raises ValueError for unknown fields.
+    """
+    if not fields:
+        return default or {"_id": 0}
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in model.model_fields]
+    if unknown:
+        raise ValueError(f"Invalid fields: {', '.join(unknown)}. Must be from: {list(model.model_fields)}")
+    projection = {"_id": 0}
+    for name in [*CURSOR_FIELDS, *requested]:
+        projection[name] = 1
+    return projection
+
+
+async def paginate(collection, query: dict, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None, projection: dict = None):
+    """Fetch one page: returns (documents, next_cursor or None).
+
+    Raises ValueError for an invalid limit or cursor.
+    """
+    validate_page_size(limit)
+    if cursor:
+        query = {"$and": [query, keyset_filter(cursor)]} if query else keyset_filter(cursor)
+
+    docs = await collection.find(query, projection or {"_id": 0}).sort(PAGE_SORT).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1])
+    return docs, next_cursor
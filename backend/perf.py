@@ -0,0 +1,319 @@
+"""
+MongoDB command monitoring.
+
+command_monitor is a PyMongo CommandListener registered on the Motor client
+(database.py). It times every command and, through DbTimingMiddleware,
+charges the time to the route serving the request:
+
+- commands slower than SLOW_QUERY_MS are kept in a ring buffer with their
+  collection and filter shape (values replaced by "?"), newest last;
+- every request adds its total DB time to a histogram for its route
+  ("GET /api/admin/calls"), so the routes spending the most Mongo time stand
+  out. Commands outside a request (startup, backfills) count as "background".
+
+pool_monitor is a ConnectionPoolListener on the same client. Per server it
+tracks open and in-use connections (current and peak), checkouts, checkout
+failures by reason and a histogram of checkout wait times, the data needed
+to size the pool (MONGO_* settings in database.py).
+
+Motor runs PyMongo calls on an executor with a copy of the caller's context,
+so the request holder set by the middleware is visible to the listener.
+Figures are per worker process and reset on restart.
+
+Settings (environment):
+    SLOW_QUERY_MS      commands at or above this many ms are kept (default 100)
+    SLOW_QUERY_BUFFER  slow commands kept (default 200)
+"""
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pymongo import monitoring
+
+# Upper bounds (ms) of the per-request DB time histogram buckets; the last bucket is open
+DB_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Upper bounds (ms) of the connection checkout wait histogram buckets
+CHECKOUT_WAIT_BUCKETS_MS = (0.1, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Filter field of each command; aggregate, update and delete are handled separately
+_FILTER_FIELDS = {"find": "filter", "count": "query", "distinct": "query", "findAndModify": "query"}
+
+_current_request = contextvars.ContextVar("perf_current_request", default=None)
+
+
+def query_shape(value):
+    """A filter with every value replaced by "?" (operators and nesting kept)"""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = [query_shape(item) for item in value]
+        # $or/$and keep their branches; scalar lists ($in, $nin) collapse
+        return shapes if any(isinstance(shape, dict) for shape in shapes) else "?"
+    return "?"
+
+
+def command_shape(command_name: str, command: dict):
+    """Shape of the filter (or $match stages) a command runs"""
+    if command_name in _FILTER_FIELDS:
+        return query_shape(command.get(_FILTER_FIELDS[command_name]) or {})
+    if command_name == "aggregate":
+        return [
+            {stage: query_shape(body)} if stage == "$match" else stage
+            for step in command.get("pipeline", []) for stage, body in step.items()
+        ]
+    if command_name in ("update", "delete"):
+        ops = command.get(command_name + "s") or []
+        return query_shape(ops[0].get("q", {})) if ops else {}
+    return None
+
+
+def _histogram(buckets) -> dict:
+    return {**{f"<={upper}ms": 0 for upper in buckets}, f">{buckets[-1]}ms": 0}
+
+
+def _observe(histogram: dict, buckets, value_ms: float):
+    upper = next((upper for upper in buckets if value_ms <= upper), None)
+    histogram[f"<={upper}ms" if upper is not None else f">{buckets[-1]}ms"] += 1
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """Times commands, keeps the slow ones and aggregates DB time per route"""
+
+    def __init__(self, threshold_ms: float = 100, buffer_size: int = 200):
+        self.threshold_ms = threshold_ms
+        self.slow_queries = deque(maxlen=buffer_size)
+        self._routes = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        command_name = event.command_name
+        target = event.command.get("collection") if command_name == "getMore" else event.command.get(command_name)
+        if not isinstance(target, str):
+            return  # handshakes, pings and other database-level commands
+        self._pending[(event.connection_id, event.request_id)] = (
+            target, event.command, _current_request.get()
+        )
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed: bool):
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        collection, command, request = pending
+        duration_ms = event.duration_micros / 1000
+
+        entry = None
+        if duration_ms >= self.threshold_ms:
+            entry = {
+                "at": datetime.now(timezone.utc).isoformat(),
+                "command": event.command_name,
+                "collection": collection,
+                "shape": command_shape(event.command_name, command),
+                "duration_ms": round(duration_ms, 1),
+                "failed": failed,
+                "route": None if request is not None else "background",
+            }
+        with self._lock:
+            if request is not None:
+                request["db_ms"] += duration_ms
+                request["commands"] += 1
+                if entry:
+                    request["slow"].append(entry)
+            else:
+                self._add(self._route("background"), duration_ms, 1)
+            if entry:
+                self.slow_queries.append(entry)
+
+    def _route(self, route: str) -> dict:
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = {
+                "requests": 0,
+                "commands": 0,
+                "db_ms_total": 0.0,
+                "db_ms_max": 0.0,
+                "histogram": _histogram(DB_TIME_BUCKETS_MS),
+            }
+        return stats
+
+    def _add(self, stats: dict, db_ms: float, commands: int):
+        stats["requests"] += 1
+        stats["commands"] += commands
+        stats["db_ms_total"] += db_ms
+        stats["db_ms_max"] = max(stats["db_ms_max"], db_ms)
+        _observe(stats["histogram"], DB_TIME_BUCKETS_MS, db_ms)
+
+    def record_request(self, route: str, request: dict):
+        """Charge a finished request's DB time to its route"""
+        with self._lock:
+            for entry in request["slow"]:
+                entry["route"] = route
+            if request["commands"]:
+                self._add(self._route(route), request["db_ms"], request["commands"])
+
+    def stats(self):
+        with self._lock:
+            routes = {
+                route: {
+                    **stats,
+                    "db_ms_total": round(stats["db_ms_total"], 1),
+                    "db_ms_avg": round(stats["db_ms_total"] / stats["requests"], 2),
+                    "db_ms_max": round(stats["db_ms_max"], 1),
+                    "histogram": dict(stats["histogram"]),
+                }
+                for route, stats in sorted(self._routes.items(), key=lambda item: -item[1]["db_ms_total"])
+            }
+            return {
+                "threshold_ms": self.threshold_ms,
+                "buffer_size": self.slow_queries.maxlen,
+                "slow_queries": [dict(entry) for entry in reversed(self.slow_queries)],
+                "routes": routes,
+            }
+
+
+command_monitor = CommandMonitor(
+    threshold_ms=float(os.environ.get("SLOW_QUERY_MS", 100)),
+    buffer_size=int(os.environ.get("SLOW_QUERY_BUFFER", 200))
+)
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Connection counts and checkout wait times per server"""
+
+    def __init__(self):
+        self._pools = {}
+        # Checkout started and its outcome are published on the same thread
+        self._checkout = threading.local()
+        self._lock = threading.Lock()
+
+    def _pool(self, address) -> dict:
+        key = "%s:%s" % address
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = {
+                "open": 0,
+                "open_max": 0,
+                "in_use": 0,
+                "in_use_max": 0,
+                "checkouts": 0,
+                "checkout_failures": {},
+                "wait_ms_total": 0.0,
+                "wait_ms_max": 0.0,
+                "wait_histogram": _histogram(CHECKOUT_WAIT_BUCKETS_MS),
+                "cleared": 0,
+            }
+        return pool
+
+    def _waited_ms(self) -> float:
+        started = getattr(self._checkout, "started", None)
+        self._checkout.started = None
+        return (time.perf_counter() - started) * 1000 if started is not None else 0.0
+
+    def connection_check_out_started(self, event):
+        self._checkout.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        waited_ms = self._waited_ms()
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["checkouts"] += 1
+            pool["in_use"] += 1
+            pool["in_use_max"] = max(pool["in_use_max"], pool["in_use"])
+            pool["wait_ms_total"] += waited_ms
+            pool["wait_ms_max"] = max(pool["wait_ms_max"], waited_ms)
+            _observe(pool["wait_histogram"], CHECKOUT_WAIT_BUCKETS_MS, waited_ms)
+
+    def connection_check_out_failed(self, event):
+        waited_ms = self._waited_ms()
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["checkout_failures"][event.reason] = pool["checkout_failures"].get(event.reason, 0) + 1
+            pool["wait_ms_max"] = max(pool["wait_ms_max"], waited_ms)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["in_use"] = max(pool["in_use"] - 1, 0)
+
+    def connection_created(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["open"] += 1
+            pool["open_max"] = max(pool["open_max"], pool["open"])
+
+    def connection_closed(self, event):
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["open"] = max(pool["open"] - 1, 0)
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._pool(event.address)["cleared"] += 1
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                address: {
+                    **pool,
+                    "checkout_failures": dict(pool["checkout_failures"]),
+                    "wait_ms_total": round(pool["wait_ms_total"], 1),
+                    "wait_ms_avg": round(pool["wait_ms_total"] / pool["checkouts"], 3) if pool["checkouts"] else 0.0,
+                    "wait_ms_max": round(pool["wait_ms_max"], 1),
+                    "wait_histogram": dict(pool["wait_histogram"]),
+                }
+                for address, pool in self._pools.items()
+            }
+
+
+pool_monitor = PoolMonitor()
+
+
+def _route_label(scope) -> str:
+    """"METHOD /path/{template}" of the route that handled a request"""
+    app, endpoint = scope.get("app"), scope.get("endpoint")
+    paths = getattr(app, "_perf_route_paths", None)
+    if paths is None and app is not None:
+        paths = {route.endpoint: route.path for route in app.routes if hasattr(route, "endpoint")}
+        app._perf_route_paths = paths
+    path = (paths or {}).get(endpoint)
+    return f"{scope['method']} {path}" if path else "unmatched"
+
+
+class DbTimingMiddleware:
+    """ASGI middleware charging the MongoDB time of each request to its route"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request = {"db_ms": 0.0, "commands": 0, "slow": []}
+        token = _current_request.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_request.reset(token)
+            command_monitor.record_request(_route_label(scope), request)
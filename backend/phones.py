@@ -0,0 +1,150 @@
+"""
+Normalised phone keys.
+
+Reports and calls store the number as typed (`contact_number`), queries as
+`phone`, so "+91 98765 43210", "098765 43210" and "9876543210" never match.
+Every write also stores `phone_key`, an E.164-style form ("+919876543210"):
+national numbers get PHONE_COUNTRY_CODE (default 91), a trunk 0 or an
+international 00 prefix is dropped. Values that cannot be a phone number
+("N/A", fewer than 8 digits) get no key.
+
+phone_history answers "who has touched this number and when" with one query
+per collection on the (phone_key, created_at, id) indexes (see indexes.py),
+run concurrently. init_phone_keys backfills documents written before the key
+existed.
+"""
+import asyncio
+import os
+import re
+from datetime import datetime, timezone
+from pymongo import UpdateOne
+from pagination import PAGE_SORT
+from timestamps import parse_timestamp
+
+PHONE_COUNTRY_CODE = os.environ.get("PHONE_COUNTRY_CODE", "91")
+
+# Collection -> field holding the number as entered
+PHONE_FIELDS = {
+    "consultant_reports": "contact_number",
+    "call_logs": "contact_number",
+    "student_queries": "phone",
+}
+
+# Fields returned per collection by phone_history
+HISTORY_PROJECTIONS = {
+    "consultant_reports": ["id", "consultant_id", "consultant_name", "student_name", "contact_number",
+                           "interest_scope", "next_followup_date", "source", "created_at"],
+    "call_logs": ["id", "consultant_id", "consultant_name", "student_name", "contact_number",
+                  "call_type", "remarks", "created_at"],
+    "student_queries": ["id", "name", "phone", "email", "course", "status", "created_at"],
+}
+
+HISTORY_LIMIT = 200
+
+BACKFILL_BATCH_SIZE = 500
+
+# National significant numbers are 10 digits for the default country code
+_NATIONAL_DIGITS = 10
+
+
+def phone_key(number) -> str:
+    """E.164-style key for a phone number as entered; None if it cannot be one"""
+    if not isinstance(number, str):
+        return None
+    number = number.strip()
+    digits = re.sub(r"\D", "", number)
+    if number.startswith("+"):
+        key = digits
+    elif digits.startswith("00"):
+        key = digits[2:]
+    elif len(digits) == _NATIONAL_DIGITS + 1 and digits.startswith("0"):
+        key = PHONE_COUNTRY_CODE + digits[1:]
+    elif len(digits) == _NATIONAL_DIGITS:
+        key = PHONE_COUNTRY_CODE + digits
+    else:
+        key = digits
+    return f"+{key}" if 8 <= len(key) <= 15 else None
+
+
+def with_phone_key(collection_name: str, doc: dict) -> dict:
+    """Set phone_key on a document about to be written; returns the document"""
+    doc["phone_key"] = phone_key(doc.get(PHONE_FIELDS[collection_name]))
+    return doc
+
+
+def phone_match(number: str, field: str = "contact_number") -> dict:
+    """Filter matching a number by its key, or exactly when it has none"""
+    key = phone_key(number)
+    return {"phone_key": key} if key else {field: number}
+
+
+async def init_phone_keys(db, batch_size: int = BACKFILL_BATCH_SIZE):
+    """Backfill phone_key on documents written before it existed"""
+    updated = 0
+    for collection_name, field in PHONE_FIELDS.items():
+        collection = getattr(db, collection_name)
+        operations = []
+        async for doc in collection.find({"phone_key": {"$exists": False}}, {field: 1}):
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"phone_key": phone_key(doc.get(field))}}))
+            if len(operations) >= batch_size:
+                updated += (await collection.bulk_write(operations, ordered=False)).modified_count
+                operations = []
+        if operations:
+            updated += (await collection.bulk_write(operations, ordered=False)).modified_count
+    return updated
+
+
+def _contact_time(doc: dict) -> datetime:
+    created_at = doc.get("created_at")
+    return created_at if isinstance(created_at, datetime) else parse_timestamp(created_at)
+
+
+def _touched_by(reports: list, calls: list) -> list:
+    """Consultants who reported or called a number, most recent contact first"""
+    consultants = {}
+    for kind, docs in (("reports", reports), ("calls", calls)):
+        for doc in docs:
+            cid = doc.get("consultant_id")
+            entry = consultants.setdefault(cid, {
+                "consultant_id": cid,
+                "consultant_name": doc.get("consultant_name"),
+                "reports": 0,
+                "calls": 0,
+                "first_contact": None,
+                "last_contact": None,
+            })
+            entry[kind] += 1
+            contacted = _contact_time(doc)
+            if contacted is None:
+                continue
+            if entry["first_contact"] is None or contacted < entry["first_contact"]:
+                entry["first_contact"] = contacted
+            if entry["last_contact"] is None or contacted > entry["last_contact"]:
+                entry["last_contact"] = contacted
+    never = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(consultants.values(), key=lambda c: c["last_contact"] or never, reverse=True)
+
+
+async def phone_history(db, number: str, limit: int = HISTORY_LIMIT) -> dict:
+    """Reports, calls and queries for a number (newest first) and the consultants involved.
+
+    Raises ValueError if number cannot be a phone number.
+    """
+    key = phone_key(number)
+    if key is None:
+        raise ValueError("Invalid phone number")
+
+    async def find(collection_name):
+        projection = {"_id": 0, **{field: 1 for field in HISTORY_PROJECTIONS[collection_name]}}
+        return await getattr(db, collection_name).find(
+            {"phone_key": key}, projection
+        ).sort(PAGE_SORT).to_list(limit)
+
+    reports, calls, queries = await asyncio.gather(*[find(name) for name in PHONE_FIELDS])
+    return {
+        "phone_key": key,
+        "touched_by": _touched_by(reports, calls),
+        "reports": reports,
+        "calls": calls,
+        "queries": queries,
+    }
@@ -0,0 +1,117 @@
+"""
+Student query inbox.
+
+GET /queries filters by status, course and created_at range, searches by
+prefix on name, phone and email, and pages with the keyset cursors from
+pagination.py. Every filter has an index ending in the page sort order
+(see indexes.py).
+
+Prefix search reads `search_keys`, a lower-cased array stored on every query
+(full name, each name word, email and phone digits), so an anchored regex on
+it is an index range scan instead of a case-insensitive collection scan.
+
+Per-status totals are kept in the `query_status_counts` collection
+({"_id": status, "count": n}) and adjusted by every write path, so the inbox
+header never counts documents.
+"""
+import re
+from datetime import datetime
+from pymongo import UpdateOne, ReplaceOne
+from timeseries import created_at_range
+
+QUERY_STATUSES = ["new", "contacted", "closed"]
+
+# Characters that may appear in a phone number search besides digits
+_PHONE_CHARS = re.compile(r"^[\d\s+()-]+$")
+
+
+def search_keys(doc: dict) -> list:
+    """Lower-cased values a query can be found by"""
+    name = " ".join((doc.get("name") or "").lower().split())
+    keys = {name, *name.split(), (doc.get("email") or "").strip().lower()}
+    digits = re.sub(r"\D", "", doc.get("phone") or "")
+    keys.add(digits)
+    # Also index the national number so searches without +91 / 0 prefixes match
+    if len(digits) > 10:
+        keys.add(digits[-10:])
+    return sorted(k for k in keys if k)
+
+
+def search_term(q: str) -> str:
+    """Normalise a search box value the same way as search_keys"""
+    term = " ".join((q or "").lower().split())
+    if _PHONE_CHARS.match(term):
+        term = re.sub(r"\D", "", term)
+    return term
+
+
+def inbox_filter(
+    status: str = None,
+    course: str = None,
+    start: datetime = None,
+    end: datetime = None,
+    q: str = None
+) -> dict:
+    """MongoDB filter for the inbox; end is exclusive.
+
+    Raises ValueError for an unknown status.
+    """
+    query = {}
+    if status:
+        if status not in QUERY_STATUSES:
+            raise ValueError(f"Invalid status. Must be one of: {QUERY_STATUSES}")
+        query["status"] = status
+    if course:
+        query["course"] = course
+    query.update(created_at_range(start, end))
+    term = search_term(q)
+    if term:
+        query["search_keys"] = {"$regex": f"^{re.escape(term)}"}
+    return query
+
+
+async def adjust_status_counts(db, old_status: str = None, new_status: str = None):
+    """Move one query between status counters (either side may be None)"""
+    if old_status == new_status:
+        return
+    if old_status:
+        await db.query_status_counts.update_one({"_id": old_status}, {"$inc": {"count": -1}}, upsert=True)
+    if new_status:
+        await db.query_status_counts.update_one({"_id": new_status}, {"$inc": {"count": 1}}, upsert=True)
+
+
+async def get_status_counts(db) -> dict:
+    """{"total": n, "new": n, "contacted": n, "closed": n}"""
+    counts = {status: 0 for status in QUERY_STATUSES}
+    async for doc in db.query_status_counts.find({}):
+        counts[doc["_id"]] = doc.get("count", 0)
+    return {"total": sum(counts.values()), **counts}
+
+
+async def refresh_status_counts(db):
+    """Recompute the status counters from the queries (after bulk deletes)"""
+    rows = await db.student_queries.aggregate([
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+    ]).to_list(None)
+    counts = {status: 0 for status in QUERY_STATUSES}
+    counts.update({row["_id"]: row["count"] for row in rows if row["_id"]})
+    await db.query_status_counts.bulk_write([
+        ReplaceOne({"_id": status}, {"_id": status, "count": count}, upsert=True)
+        for status, count in counts.items()
+    ])
+    return counts
+
+
+async def init_query_inbox(db):
+    """Backfill search_keys and build the status counters"""
+    updates = [
+        UpdateOne({"_id": doc["_id"]}, {"$set": {"search_keys": search_keys(doc)}})
+        async for doc in db.student_queries.find(
+            {"search_keys": {"$exists": False}}, {"name": 1, "email": 1, "phone": 1}
+        )
+    ]
+    if updates:
+        await db.student_queries.bulk_write(updates, ordered=False)
+
+    if updates or not await db.query_status_counts.count_documents({}):
+        await refresh_status_counts(db)
@@ -0,0 +1,466 @@
+"""
+Daily rollups.
+
+Pre-aggregated counters kept in the `daily_rollups` collection, one document per
+(consultant_id, date, metric):
+
+    {"consultant_id": "AK007", "date": "2026-10-18", "metric": "calls",
+     "consultant_name": "ARKAJYOTI PAL",
+     "counts": {"total": 12, "successful": 7, "failed": 3, "attempted": 2}}
+
+Metrics are "calls" (by call_type), "reports" (by interest_scope) and
+"admissions" (count and payout_total). Every write path bumps them with $inc,
+so analytics read a number of documents proportional to the days in the
+window rather than to the raw call and report history.
+"""
+import asyncio
+import logging
+from datetime import datetime, date, timezone
+from pymongo import UpdateOne, ReplaceOne, DeleteOne
+from timeseries import (
+    LABEL_FORMATS, validate_series,
+    day_key_expr, day_key, bucket_starts, bucket_start, next_bucket
+)
+
+logger = logging.getLogger(__name__)
+
+# Raw collection -> (metric, field whose value becomes a counter key)
+ROLLUP_SOURCES = {
+    "call_logs": ("calls", "call_type"),
+    "consultant_reports": ("reports", "interest_scope"),
+    "admissions": ("admissions", None),
+}
+
+
+def counter_key(value) -> str:
+    """Make a field value safe to use as a key under counts"""
+    key = str(value).replace(".", "_")
+    return key.lstrip("$") or "_"
+
+
+def _empty_delta(consultant_name=None):
+    return {"consultant_name": consultant_name, "counts": {}}
+
+
+def _add_counts(delta: dict, counts: dict):
+    for key, value in counts.items():
+        delta["counts"][key] = delta["counts"].get(key, 0) + value
+
+
+def _document_counts(collection_name: str, doc: dict):
+    _, key_field = ROLLUP_SOURCES[collection_name]
+    counts = {"total": 1}
+    if key_field and doc.get(key_field):
+        counts[counter_key(doc[key_field])] = 1
+    if collection_name == "admissions":
+        counts["payout_total"] = doc.get("payout_amount") or 0
+    return counts
+
+
+def rollup_deltas_from_docs(collection_name: str, docs):
+    """Counters contributed by freshly written documents, keyed by rollup"""
+    metric, _ = ROLLUP_SOURCES[collection_name]
+    deltas = {}
+    for doc in docs:
+        key = (doc.get("consultant_id"), day_key(doc.get("created_at")), metric)
+        delta = deltas.setdefault(key, _empty_delta(doc.get("consultant_name")))
+        _add_counts(delta, _document_counts(collection_name, doc))
+    return deltas
+
+
+def _raw_rollup_pipeline(collection_name: str, match: dict = None):
+    _, key_field = ROLLUP_SOURCES[collection_name]
+    group_id = {"consultant_id": "$consultant_id", "day": day_key_expr()}
+    if key_field:
+        group_id["key"] = f"${key_field}"
+    group = {
+        "_id": group_id,
+        "count": {"$sum": 1},
+        "consultant_name": {"$last": "$consultant_name"},
+    }
+    if collection_name == "admissions":
+        group["payout_total"] = {"$sum": {"$ifNull": ["$payout_amount", 0]}}
+
+    pipeline = []
+    if match:
+        pipeline.append({"$match": match})
+    pipeline.append({"$group": group})
+    return pipeline
+
+
+def _fold_raw_rows(collection_name: str, rows, into: dict = None):
+    metric, _ = ROLLUP_SOURCES[collection_name]
+    deltas = {} if into is None else into
+    for row in rows:
+        key = (row["_id"].get("consultant_id"), row["_id"].get("day") or "", metric)
+        delta = deltas.setdefault(key, _empty_delta(row.get("consultant_name")))
+        counts = {"total": row["count"]}
+        if row["_id"].get("key"):
+            counts[counter_key(row["_id"]["key"])] = row["count"]
+        if collection_name == "admissions":
+            counts["payout_total"] = row["payout_total"]
+        _add_counts(delta, counts)
+    return deltas
+
+
+async def rollup_deltas_for(db, collection_name: str, query: dict):
+    """Counters held by the documents matching query, keyed by rollup.
+
+    Call this before a delete and pass the result to apply_rollup_deltas
+    afterwards with sign=-1.
+    """
+    if collection_name not in ROLLUP_SOURCES:
+        return {}
+    collection = getattr(db, collection_name)
+    rows = await collection.aggregate(_raw_rollup_pipeline(collection_name, query)).to_list(None)
+    return _fold_raw_rows(collection_name, rows)
+
+
+async def apply_rollup_deltas(db, deltas: dict, sign: int = 1):
+    """$inc rollup counters by precomputed deltas"""
+    now = datetime.now(timezone.utc)
+    operations = []
+    for (cid, day, metric), delta in deltas.items():
+        inc = {f"counts.{key}": sign * value for key, value in delta["counts"].items() if value}
+        if not inc:
+            continue
+        update = {"$inc": inc, "$set": {"updated_at": now}}
+        if delta.get("consultant_name"):
+            update["$set"]["consultant_name"] = delta["consultant_name"]
+        operations.append(UpdateOne({"consultant_id": cid, "date": day, "metric": metric}, update, upsert=True))
+    if operations:
+        await db.daily_rollups.bulk_write(operations, ordered=False)
+
+
+async def record_payout_change(db, admission: dict, new_amount: float):
+    """Shift payout_total when an admission's payout_amount is edited"""
+    change = (new_amount or 0) - (admission.get("payout_amount") or 0)
+    if change:
+        key = (admission.get("consultant_id"), day_key(admission.get("created_at")), "admissions")
+        await apply_rollup_deltas(db, {key: {"consultant_name": None, "counts": {"payout_total": change}}})
+
+
+async def init_daily_rollups(db):
+    """Backfill the rollups on first start (indexes are created by init_indexes)"""
+    if await db.daily_rollups.estimated_document_count() == 0:
+        result = await rebuild_daily_rollups(db)
+        logger.info(f"Daily rollups backfilled: {result['rollup_count']} documents")
+
+
+async def rebuild_daily_rollups(db, dry_run: bool = False):
+    """Recompute every rollup from the raw collections and report drift.
+
+    Returns the number of rollup documents and the drifted counters
+    (expected vs stored). With dry_run the stored rollups are left untouched.
+    """
+    results = await asyncio.gather(*[
+        getattr(db, name).aggregate(_raw_rollup_pipeline(name)).to_list(None)
+        for name in ROLLUP_SOURCES
+    ])
+    expected = {}
+    for name, rows in zip(ROLLUP_SOURCES, results):
+        _fold_raw_rows(name, rows, into=expected)
+
+    stored = {
+        (doc.get("consultant_id"), doc.get("date"), doc.get("metric")): doc
+        async for doc in db.daily_rollups.find({})
+    }
+
+    drift = []
+    for key in set(expected) | set(stored):
+        want = (expected.get(key) or {}).get("counts", {})
+        have = (stored.get(key) or {}).get("counts", {})
+        for counter in set(want) | set(have):
+            if round(want.get(counter, 0), 2) != round(have.get(counter, 0), 2):
+                cid, day, metric = key
+                drift.append({
+                    "consultant_id": cid,
+                    "date": day,
+                    "metric": metric,
+                    "counter": counter,
+                    "expected": want.get(counter, 0),
+                    "stored": have.get(counter, 0)
+                })
+
+    if not dry_run:
+        now = datetime.now(timezone.utc)
+        operations = [
+            ReplaceOne(
+                {"consultant_id": cid, "date": day, "metric": metric},
+                {
+                    "consultant_id": cid,
+                    "date": day,
+                    "metric": metric,
+                    "consultant_name": delta["consultant_name"],
+                    "counts": delta["counts"],
+                    "updated_at": now
+                },
+                upsert=True
+            )
+            for (cid, day, metric), delta in expected.items()
+        ]
+        operations += [DeleteOne({"_id": doc["_id"]}) for key, doc in stored.items() if key not in expected]
+        if operations:
+            await db.daily_rollups.bulk_write(operations, ordered=False)
+
+    return {
+        "rollup_count": len(expected),
+        "drift_count": len(drift),
+        "drift": sorted(drift, key=lambda d: (d["metric"], d["date"], str(d["consultant_id"]), d["counter"])),
+        "dry_run": dry_run
+    }
+
+
+# ============ READS ============
+
+def _sum_counts_stages(group_id: dict):
+    """Stages summing every key under counts, grouped by group_id plus the key"""
+    return [
+        {"$project": {"metric": 1, "date": 1, "consultant_id": 1, "counts": {"$objectToArray": "$counts"}}},
+        {"$unwind": "$counts"},
+        {"$group": {"_id": {**group_id, "key": "$counts.k"}, "value": {"$sum": "$counts.v"}}}
+    ]
+
+
+def date_range_filter(start_day: str = None, end_day: str = None):
+    """Filter on the rollup date; end_day is exclusive"""
+    cond = {}
+    if start_day:
+        cond["$gte"] = start_day
+    if end_day:
+        cond["$lt"] = end_day
+    return {"date": cond} if cond else {}
+
+
+def window_facets(windows: dict):
+    """$facet branches summing counters per metric: "total" plus one per window"""
+    stages = _sum_counts_stages({"metric": "$metric"})
+    facets = {"total": stages}
+    for name, (start_day, end_day) in windows.items():
+        facets[name] = [{"$match": date_range_filter(start_day, end_day)}] + stages
+    return facets
+
+
+def series_facet(metrics, starts, granularity: str):
+    """$facet branch summing counters per metric and date over the bucket range"""
+    return [
+        {"$match": {
+            "metric": {"$in": list(metrics)},
+            **date_range_filter(starts[0].isoformat(), next_bucket(starts[-1], granularity).isoformat())
+        }}
+    ] + _sum_counts_stages({"metric": "$metric", "date": "$date"})
+
+
+def fold_window_totals(rows, into: dict = None):
+    """{metric: {counter: value}} from window facet rows"""
+    totals = {} if into is None else into
+    for row in rows:
+        totals.setdefault(row["_id"]["metric"], {})[row["_id"]["key"]] = row["value"]
+    return totals
+
+
+def fold_series(rows, metric: str, starts, granularity: str):
+    """Buckets (oldest first) for one metric from series facet rows:
+        [{"start": date, "label": "Oct 18", "counts": {counter: value}}]
+    """
+    buckets = {start: {} for start in starts}
+    for row in rows:
+        if row["_id"].get("metric", metric) != metric:
+            continue
+        try:
+            d = date.fromisoformat(row["_id"]["date"])
+        except (TypeError, ValueError):
+            continue
+        counts = buckets.get(bucket_start(d, granularity))
+        if counts is None:
+            continue
+        key = row["_id"]["key"]
+        counts[key] = counts.get(key, 0) + row["value"]
+
+    return [
+        {"start": start, "label": start.strftime(LABEL_FORMATS[granularity]), "counts": counts}
+        for start, counts in buckets.items()
+    ]
+
+
+async def rollup_facets(db, facets: dict, consultant_id: str = None, metrics=None):
+    """Run several facet branches over daily_rollups in a single aggregation"""
+    match = {}
+    if consultant_id:
+        match["consultant_id"] = consultant_id
+    if metrics:
+        match["metric"] = {"$in": list(metrics)}
+
+    pipeline = []
+    if match:
+        pipeline.append({"$match": match})
+    pipeline.append({"$facet": facets})
+    result = await db.daily_rollups.aggregate(pipeline).to_list(1)
+    return result[0] if result else {name: [] for name in facets}
+
+
+async def rollup_window_totals(db, windows: dict, consultant_id: str = None, metrics=None):
+    """Sum counters per metric over several day windows in one $facet.
+
+    windows maps a name to (start_day, end_day) YYYY-MM-DD strings (end
+    exclusive, either may be None). A "total" window over all dates is always
+    included. Returns {window: {metric: {counter: value}}}.
+    """
+    result = await rollup_facets(db, window_facets(windows), consultant_id, metrics)
+    return {name: fold_window_totals(rows) for name, rows in result.items()}
+
+
+# Sortable consultant performance counters -> (metric, counter key)
+PERFORMANCE_COUNTERS = {
+    "reports": ("reports", "total"),
+    "calls": ("calls", "total"),
+    "successful_calls": ("calls", "successful"),
+    "admissions": ("admissions", "total"),
+}
+
+
+async def rollup_consultant_ranking(
+    db,
+    sort_by: str = "reports",
+    limit: int = 10,
+    start_day: str = None,
+    end_day: str = None
+):
+    """Top consultants by one of PERFORMANCE_COUNTERS, keyed by consultant_id.
+
+    The rollups already hold reports, calls and admissions side by side, so a
+    single $group over the date range yields every counter per consultant and
+    the sort and limit run in the database. Consultants with nothing for the
+    sort counter are left out. Each row also carries the last rollup
+    consultant_name as a fallback display name.
+    """
+    if sort_by not in PERFORMANCE_COUNTERS:
+        raise ValueError(f"Invalid sort_by. Must be one of: {list(PERFORMANCE_COUNTERS)}")
+    if limit < 1:
+        raise ValueError("Invalid limit. Must be at least 1")
+
+    sums = {
+        name: {"$sum": {"$cond": [
+            {"$eq": ["$metric", metric]},
+            {"$ifNull": [f"$counts.{key}", 0]},
+            0
+        ]}}
+        for name, (metric, key) in PERFORMANCE_COUNTERS.items()
+    }
+    rows = await db.daily_rollups.aggregate([
+        {"$match": {
+            "metric": {"$in": sorted({metric for metric, _ in PERFORMANCE_COUNTERS.values()})},
+            **date_range_filter(start_day, end_day)
+        }},
+        {"$group": {"_id": "$consultant_id", "consultant_name": {"$last": "$consultant_name"}, **sums}},
+        {"$match": {sort_by: {"$gt": 0}}},
+        {"$sort": {sort_by: -1, "_id": 1}},
+        {"$limit": limit}
+    ]).to_list(None)
+
+    return [
+        {"consultant_id": row["_id"], "consultant_name": row.get("consultant_name"),
+         **{name: row.get(name, 0) for name in PERFORMANCE_COUNTERS}}
+        for row in rows
+    ]
+
+
+async def rollup_counters_by_consultant(db, metric: str, start_day: str = None, end_day: str = None):
+    """Sum every counter of one metric per consultant with a single $group.
+
+    Returns {consultant_id: {"consultant_name": last rollup name, "counts": {counter: value}}}.
+    """
+    rows = await db.daily_rollups.aggregate([
+        {"$match": {"metric": metric, **date_range_filter(start_day, end_day)}},
+        {"$project": {"consultant_id": 1, "consultant_name": 1, "counts": {"$objectToArray": "$counts"}}},
+        {"$unwind": "$counts"},
+        {"$group": {
+            "_id": {"consultant_id": "$consultant_id", "key": "$counts.k"},
+            "value": {"$sum": "$counts.v"},
+            "consultant_name": {"$last": "$consultant_name"}
+        }}
+    ]).to_list(None)
+
+    totals = {}
+    for row in rows:
+        entry = totals.setdefault(row["_id"]["consultant_id"], {"consultant_name": None, "counts": {}})
+        entry["counts"][row["_id"]["key"]] = row["value"]
+        if row.get("consultant_name"):
+            entry["consultant_name"] = row["consultant_name"]
+    return totals
+
+
+async def rollup_call_stats(db, consultant_id: str = None):
+    """Call counters per consultant: {consultant_id: {consultant_name, total_calls, ...}}
+
+    Calls with a type other than successful or failed count as attempted.
+    """
+    match = {"metric": "calls"}
+    if consultant_id:
+        match["consultant_id"] = consultant_id
+    rows = await db.daily_rollups.aggregate([
+        {"$match": match},
+        {"$group": {
+            "_id": "$consultant_id",
+            "consultant_name": {"$last": "$consultant_name"},
+            "total_calls": {"$sum": {"$ifNull": ["$counts.total", 0]}},
+            "successful_calls": {"$sum": {"$ifNull": ["$counts.successful", 0]}},
+            "failed_calls": {"$sum": {"$ifNull": ["$counts.failed", 0]}}
+        }},
+        {"$match": {"total_calls": {"$gt": 0}}}
+    ]).to_list(None)
+
+    return {
+        row["_id"]: {
+            "consultant_name": row.get("consultant_name"),
+            "total_calls": row["total_calls"],
+            "successful_calls": row["successful_calls"],
+            "failed_calls": row["failed_calls"],
+            "attempted_calls": row["total_calls"] - row["successful_calls"] - row["failed_calls"]
+        }
+        for row in rows
+    }
+
+
+async def rollup_series(
+    db,
+    metric: str,
+    days: int = 14,
+    granularity: str = "day",
+    consultant_id: str = None,
+    now: datetime = None
+):
+    """Counters of one metric per day, week or month bucket, from the daily rollups.
+
+    Returns one entry per bucket, oldest first:
+        {"start": date, "label": "Oct 18", "counts": {counter: value}}
+    """
+    validate_series(days, granularity)
+    starts = bucket_starts(days, granularity, now)
+    result = await rollup_facets(db, {"series": series_facet([metric], starts, granularity)}, consultant_id)
+    return fold_series(result["series"], metric, starts, granularity)
+
+
+async def rollup_dashboard(db, windows: dict, series: dict, consultant_id: str = None, now: datetime = None):
+    """Window totals and several time series in a single $facet.
+
+    series maps a name to (metric, days, granularity). Returns
+        {"totals": {window: {metric: {counter: value}}},
+         "series": {name: [buckets]}}.
+    """
+    facets = window_facets(windows)
+    series_starts = {}
+    for name, (metric, days, granularity) in series.items():
+        validate_series(days, granularity)
+        starts = bucket_starts(days, granularity, now)
+        series_starts[name] = starts
+        facets[f"series_{name}"] = series_facet([metric], starts, granularity)
+
+    result = await rollup_facets(db, facets, consultant_id)
+    return {
+        "totals": {name: fold_window_totals(result.get(name, [])) for name in ["total", *windows]},
+        "series": {
+            name: fold_series(result.get(f"series_{name}", []), metric, series_starts[name], granularity)
+            for name, (metric, days, granularity) in series.items()
+        }
+    }
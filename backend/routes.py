@@ -1,7 +1,10 @@
-from fastapi import APIRouter, HTTPException, Body
-from models import StudentQuery, StudentQueryCreate, College, Course, ConsultantReport, ConsultantReportCreate
+from fastapi import APIRouter, HTTPException, Body, Request
+from fastapi.responses import StreamingResponse
+from models import StudentQuery, StudentQueryCreate, College, Course, ConsultantReport, ConsultantReportCreate, CallLog, Admission
 from typing import List
+import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from consultants import (
@@ -11,13 +14,74 @@ from consultants import (
     add_consultant_async, update_consultant_async, delete_consultant_async,
     init_consultants_db
 )
+from analytics import (
+    standard_windows, parse_window_bound, day_bound, day_windows, windowed_counts,
+    call_distribution, interest_distribution, consultant_overview, reports_trend, admissions_trend, daily_calls,
+    admin_overview, consultant_performance, SUMMARY_COUNTERS
+)
+from timeseries import days_for_months, created_at_range
+from cache import analytics_cache, cached, conditional
+from leaderboard import (
+    ROLLING_PERIODS, build_leaderboard, get_leaderboard_snapshot_counters, rolling_window,
+    get_range_leaderboard_counters, leaderboard_deltas_from_docs,
+    leaderboard_deltas_for, apply_leaderboard_deltas, rebuild_leaderboard_snapshots
+)
+from rollups import (
+    rollup_deltas_from_docs, rollup_deltas_for, apply_rollup_deltas, record_payout_change,
+    rebuild_daily_rollups, rollup_window_totals, rollup_consultant_ranking, rollup_series, rollup_dashboard,
+    rollup_call_stats, rollup_counters_by_consultant
+)
+from pagination import DEFAULT_PAGE_SIZE, paginate, field_projection
+from export import bulk_data_filter, export_stream
+from query_inbox import (
+    search_keys, inbox_filter, adjust_status_counts, get_status_counts, refresh_status_counts
+)
+from sync import record_tombstones, parse_watermark, sync_changes
+from catalog import catalog_response
+from indexes import audit_indexes
+from perf import command_monitor, pool_monitor
+from phones import with_phone_key, phone_match, phone_history
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 # Import db from database module
-from database import db
+from database import db, client, CLIENT_OPTIONS
+
+# search_keys is an index helper, not part of the query document
+QUERY_PROJECTION = {"_id": 0, "search_keys": 0}
+
+
+async def _track_inserted(collection_name: str, docs: list):
+    """Fold newly inserted documents into leaderboard snapshots and daily rollups"""
+    if not docs:
+        return
+    await asyncio.gather(
+        apply_leaderboard_deltas(db, leaderboard_deltas_from_docs(collection_name, docs)),
+        apply_rollup_deltas(db, rollup_deltas_from_docs(collection_name, docs))
+    )
+    # Only once the derived counters are written, or a read in between caches them stale
+    await analytics_cache.bump(collection_name)
+
+
+async def _delete_tracked(collection_name: str, query: dict, many: bool = True):
+    """Delete documents, take their counters out of snapshots and rollups and leave sync tombstones"""
+    collection = getattr(db, collection_name)
+    leaderboard_deltas, rollup_deltas, deleted_docs = await asyncio.gather(
+        leaderboard_deltas_for(db, collection_name, query),
+        rollup_deltas_for(db, collection_name, query),
+        collection.find(query, {"_id": 0, "id": 1, "consultant_id": 1}).to_list(None if many else 1)
+    )
+    result = await (collection.delete_many(query) if many else collection.delete_one(query))
+    if result.deleted_count:
+        await asyncio.gather(
+            apply_leaderboard_deltas(db, leaderboard_deltas, sign=-1),
+            apply_rollup_deltas(db, rollup_deltas, sign=-1),
+            record_tombstones(db, collection_name, deleted_docs)
+        )
+        await analytics_cache.bump(collection_name)
+    return result
 
 # Student Query Endpoints
 @router.post("/queries", response_model=dict)
@@ -25,9 +89,14 @@ async def create_query(query_data: StudentQueryCreate):
     try:
         query_dict = query_data.dict()
         query_obj = StudentQuery(**query_dict)
+        query_doc = query_obj.dict()
+        query_doc["search_keys"] = search_keys(query_doc)
+        with_phone_key("student_queries", query_doc)
         
         # Insert into database
-        result = await db.student_queries.insert_one(query_obj.dict())
+        result = await db.student_queries.insert_one(query_doc)
+        await adjust_status_counts(db, new_status=query_obj.status)
+        await analytics_cache.bump("student_queries")
         
         logger.info(f"Query created successfully: {query_obj.id}")
         
@@ -41,22 +110,67 @@ async def create_query(query_data: StudentQueryCreate):
         raise HTTPException(status_code=500, detail="Failed to submit query")
 
 @router.get("/queries", response_model=dict)
-async def get_all_queries():
+@conditional("student_queries")
+async def get_all_queries(
+    status: str = None,
+    course: str = None,
+    since: str = None,
+    until: str = None,
+    q: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None,
+    fields: str = None
+):
+    """Get one page of student queries, newest first
+
+    Filters by status, course and a since/until created_at range (ISO date or
+    datetime); q matches the start of the name (or any word of it), email or
+    phone number. total counts every query matching the filters and
+    status_counts the whole inbox. fields (comma-separated) limits the
+    returned query fields.
+    """
     try:
-        queries = await db.student_queries.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+        try:
+            start = parse_window_bound(since) if since else None
+            end = parse_window_bound(until, end=True) if until else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid since/until date. Use ISO format (YYYY-MM-DD)")
+        
+        try:
+            query = inbox_filter(status=status, course=course, start=start, end=end, q=q)
+            projection = field_projection(fields, StudentQuery, QUERY_PROJECTION)
+            (queries, next_cursor), status_counts = await asyncio.gather(
+                paginate(db.student_queries, query, limit, cursor, projection=projection),
+                get_status_counts(db)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # The counters answer unfiltered and status-only requests without counting
+        if set(query) <= {"status"}:
+            total = status_counts[status] if status else status_counts["total"]
+        else:
+            total = await db.student_queries.count_documents(query)
+        
         return {
             "success": True,
             "queries": queries,
-            "count": len(queries)
+            "count": len(queries),
+            "total": total,
+            "status_counts": status_counts,
+            "next_cursor": next_cursor
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching queries: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch queries")
 
 @router.get("/queries/{query_id}", response_model=dict)
+@conditional("student_queries")
 async def get_query(query_id: str):
     try:
-        query = await db.student_queries.find_one({"id": query_id}, {"_id": 0})
+        query = await db.student_queries.find_one({"id": query_id}, QUERY_PROJECTION)
         if not query:
             raise HTTPException(status_code=404, detail="Query not found")
         
@@ -79,19 +193,22 @@ async def update_query_status(query_id: str, status: str):
         if status not in valid_statuses:
             raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
         
-        # Update the query
-        result = await db.student_queries.update_one(
+        # Update the query, keeping the before-image to move it between status counters
+        previous = await db.student_queries.find_one_and_update(
             {"id": query_id},
             {
                 "$set": {
                     "status": status,
-                    "updated_at": datetime.utcnow()
+                    "updated_at": datetime.now(timezone.utc)
                 }
-            }
+            },
+            projection={"_id": 0, "status": 1}
         )
         
-        if result.matched_count == 0:
+        if previous is None:
             raise HTTPException(status_code=404, detail="Query not found")
+        await adjust_status_counts(db, previous.get("status"), status)
+        await analytics_cache.bump("student_queries")
         
         logger.info(f"Query {query_id} status updated to {status}")
         
@@ -111,10 +228,12 @@ async def update_query_status(query_id: str, status: str):
 @router.delete("/queries/{query_id}", response_model=dict)
 async def delete_query(query_id: str):
     try:
-        result = await db.student_queries.delete_one({"id": query_id})
+        deleted = await db.student_queries.find_one_and_delete({"id": query_id}, projection={"_id": 0, "status": 1})
         
-        if result.deleted_count == 0:
+        if deleted is None:
             raise HTTPException(status_code=404, detail="Query not found")
+        await adjust_status_counts(db, old_status=deleted.get("status"))
+        await analytics_cache.bump("student_queries")
         
         logger.info(f"Query {query_id} deleted successfully")
         
@@ -154,10 +273,10 @@ async def create_consultant_report(report_data: ConsultantReportCreate, consulta
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
         
-        # Check for duplicate report with same phone number for this consultant
+        # Check for duplicate report with same phone number (any formatting) for this consultant
         existing_report = await db.consultant_reports.find_one({
             "consultant_id": consultant_id,
-            "contact_number": report_data.contact_number
+            **phone_match(report_data.contact_number)
         })
         
         if existing_report and not update_existing:
@@ -171,11 +290,11 @@ async def create_consultant_report(report_data: ConsultantReportCreate, consulta
         
         if existing_report and update_existing:
             # Delete the old report and its associated call log
-            await db.consultant_reports.delete_one({"id": existing_report.get("id")})
+            await _delete_tracked("consultant_reports", {"id": existing_report.get("id")}, many=False)
             # Also update the call log - mark old one as updated
-            await db.call_logs.delete_many({
+            await _delete_tracked("call_logs", {
                 "consultant_id": consultant_id,
-                "contact_number": report_data.contact_number,
+                **phone_match(report_data.contact_number),
                 "call_type": "successful"
             })
             logger.info(f"Deleted existing report for phone {report_data.contact_number}")
@@ -189,7 +308,8 @@ async def create_consultant_report(report_data: ConsultantReportCreate, consulta
         report_obj = ConsultantReport(**report_dict)
         
         # Insert into database
-        result = await db.consultant_reports.insert_one(report_obj.dict())
+        report_doc = with_phone_key("consultant_reports", report_obj.dict())
+        result = await db.consultant_reports.insert_one(report_doc)
         
         # Auto-log as a successful call when a detailed report is submitted
         call_log = {
@@ -200,9 +320,11 @@ async def create_consultant_report(report_data: ConsultantReportCreate, consulta
             "contact_number": report_data.contact_number,
             "call_type": "successful",
             "remarks": f"Detailed report submitted - {report_data.career_interest or 'General counselling'}",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
-        await db.call_logs.insert_one(call_log)
+        await db.call_logs.insert_one(with_phone_key("call_logs", call_log))
+        await _track_inserted("consultant_reports", [report_doc])
+        await _track_inserted("call_logs", [call_log])
         
         action = "updated" if (existing_report and update_existing) else "created"
         logger.info(f"Consultant report {action} by {consultant_name}: {report_obj.id}")
@@ -220,37 +342,53 @@ async def create_consultant_report(report_data: ConsultantReportCreate, consulta
 
 # Check for duplicate report
 @router.get("/consultant/reports/check-duplicate", response_model=dict)
+@conditional("consultant_reports", "call_logs", "consultants")
 async def check_duplicate_report(consultant_id: str, contact_number: str):
+    """Whether this consultant already reported the number (in any formatting),
+    and which other consultants have reported or called it"""
     try:
         existing_report = await db.consultant_reports.find_one({
             "consultant_id": consultant_id,
-            "contact_number": contact_number
+            **phone_match(contact_number)
         })
-        
+
+        try:
+            touched_by = (await phone_history(db, contact_number, limit=50))["touched_by"]
+        except ValueError:
+            touched_by = []
+        other_consultants = [c for c in touched_by if c["consultant_id"] != consultant_id]
+
         if existing_report:
             return {
                 "exists": True,
                 "student_name": existing_report.get("student_name"),
                 "report_id": existing_report.get("id"),
-                "created_at": existing_report.get("created_at")
+                "created_at": existing_report.get("created_at"),
+                "other_consultants": other_consultants
             }
-        return {"exists": False}
+        return {"exists": False, "other_consultants": other_consultants}
     except Exception as e:
         logger.error(f"Error checking duplicate: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to check duplicate")
 
 @router.get("/consultant/reports/{consultant_id}", response_model=dict)
-async def get_consultant_reports(consultant_id: str):
+@conditional("consultant_reports", "consultants")
+async def get_consultant_reports(consultant_id: str, fields: str = None):
     try:
         # Verify consultant exists
         consultant_name = await get_consultant_name_async(consultant_id)
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
         
+        try:
+            projection = field_projection(fields, ConsultantReport)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
         # Fetch reports for this consultant only
         reports = await db.consultant_reports.find(
             {"consultant_id": consultant_id}, 
-            {"_id": 0}
+            projection
         ).sort("created_at", -1).to_list(1000)
         
         return {
@@ -269,7 +407,7 @@ async def get_consultant_reports(consultant_id: str):
 @router.delete("/consultant/reports/{report_id}", response_model=dict)
 async def delete_consultant_report(report_id: str):
     try:
-        result = await db.consultant_reports.delete_one({"id": report_id})
+        result = await _delete_tracked("consultant_reports", {"id": report_id}, many=False)
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Report not found")
@@ -288,44 +426,117 @@ async def delete_consultant_report(report_id: str):
         raise HTTPException(status_code=500, detail="Failed to delete report")
 
 # Admin: Get all consultant reports
-@router.get("/admin/consultant-reports", response_model=dict)
-async def get_all_consultant_reports():
+@router.get("/admin/consultant-reports/summary", response_model=dict)
+@cached("consultant_reports", "consultants")
+async def get_consultant_reports_summary():
+    """Get report counts per consultant with interest-scope breakdowns
+
+    Totals come from daily rollups, so the Reports tab header costs the same
+    regardless of history size; the reports themselves are loaded per page
+    from /admin/consultant-reports.
+    """
     try:
-        reports = await db.consultant_reports.find({}, {"_id": 0}).sort("created_at", -1).to_list(10000)
+        windows = standard_windows()
+        window_totals, by_consultant, consultants = await asyncio.gather(
+            rollup_window_totals(db, day_windows({"today": windows["today"], "month": windows["month"]}), metrics=["reports"]),
+            rollup_counters_by_consultant(db, "reports"),
+            get_all_consultants_async()
+        )
+        names = {c["user_id"]: c["name"] for c in consultants}
         
-        # Group by consultant
-        reports_by_consultant = {}
-        for report in reports:
-            consultant_name = report.get("consultant_name", "Unknown")
-            if consultant_name not in reports_by_consultant:
-                reports_by_consultant[consultant_name] = []
-            reports_by_consultant[consultant_name].append(report)
+        summary = []
+        for cid, entry in by_consultant.items():
+            count = entry["counts"].get("total", 0)
+            if not count:
+                continue
+            summary.append({
+                "consultant_id": cid,
+                "consultant_name": names.get(cid) or entry["consultant_name"] or cid,
+                "count": count,
+                "interest_scope": {
+                    scope: n for scope, n in entry["counts"].items()
+                    if scope not in SUMMARY_COUNTERS and n
+                }
+            })
+        summary.sort(key=lambda item: (-item["count"], item["consultant_name"]))
+        
+        def count(window):
+            return window_totals.get(window, {}).get("reports", {}).get("total", 0)
+        
+        return {
+            "success": True,
+            "total_count": count("total"),
+            "today_count": count("today"),
+            "month_count": count("month"),
+            "consultants": summary
+        }
+    except Exception as e:
+        logger.error(f"Error fetching consultant reports summary: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to fetch consultant reports summary")
+
+
+@router.get("/admin/consultant-reports", response_model=dict)
+@conditional("consultant_reports")
+async def get_all_consultant_reports(
+    consultant_id: str = None,
+    since: str = None,
+    until: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None,
+    fields: str = None
+):
+    """Get one page of consultant reports, newest first
+
+    Optionally filtered by consultant and a since/until created_at range
+    (ISO date or datetime); fields (comma-separated) limits the returned
+    report fields. Per-consultant totals are served by
+    /admin/consultant-reports/summary.
+    """
+    try:
+        query = {}
+        if consultant_id:
+            query["consultant_id"] = consultant_id
+        try:
+            if since or until:
+                query.update(created_at_range(
+                    parse_window_bound(since) if since else None,
+                    parse_window_bound(until, end=True) if until else None
+                ))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid since/until date. Use ISO format (YYYY-MM-DD)")
+        
+        try:
+            projection = field_projection(fields, ConsultantReport)
+            reports, next_cursor = await paginate(db.consultant_reports, query, limit, cursor, projection)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         return {
             "success": True,
             "reports": reports,
-            "reports_by_consultant": reports_by_consultant,
-            "total_count": len(reports)
+            "count": len(reports),
+            "next_cursor": next_cursor
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching all consultant reports: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch consultant reports")
 
 # College Endpoints
 @router.get("/colleges", response_model=dict)
-async def get_all_colleges():
+async def get_all_colleges(request: Request):
+    """List colleges from the pre-compressed in-memory catalog"""
     try:
-        colleges = await db.colleges.find({}, {"_id": 0}).to_list(1000)
-        return {
-            "success": True,
-            "colleges": colleges,
-            "count": len(colleges)
-        }
+        return await catalog_response(
+            db, "colleges", request.headers.get("accept-encoding"), request.headers.get("if-none-match")
+        )
     except Exception as e:
         logger.error(f"Error fetching colleges: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch colleges")
 
 @router.get("/colleges/{college_id}", response_model=dict)
+@conditional("colleges")
 async def get_college(college_id: str):
     try:
         college = await db.colleges.find_one({"id": college_id}, {"_id": 0})
@@ -344,19 +555,18 @@ async def get_college(college_id: str):
 
 # Course Endpoints
 @router.get("/courses", response_model=dict)
-async def get_all_courses():
+async def get_all_courses(request: Request):
+    """List courses from the pre-compressed in-memory catalog"""
     try:
-        courses = await db.courses.find({}, {"_id": 0}).to_list(1000)
-        return {
-            "success": True,
-            "courses": courses,
-            "count": len(courses)
-        }
+        return await catalog_response(
+            db, "courses", request.headers.get("accept-encoding"), request.headers.get("if-none-match")
+        )
     except Exception as e:
         logger.error(f"Error fetching courses: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch courses")
 
 @router.get("/courses/{course_id}", response_model=dict)
+@conditional("courses")
 async def get_course(course_id: str):
     try:
         # Try to find by id or name
@@ -383,6 +593,7 @@ async def get_course(course_id: str):
 # ==================== Consultant Management (Admin) ====================
 
 @router.get("/admin/consultants", response_model=dict)
+@conditional("consultants")
 async def get_consultants():
     """Get all consultants for admin management"""
     try:
@@ -403,6 +614,7 @@ async def create_consultant(user_id: str, name: str, password: str):
         result = await add_consultant_async(user_id, name, password)
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
+        await analytics_cache.bump("consultants")
         logger.info(f"Consultant {user_id} added permanently to database")
         return result
     except HTTPException:
@@ -418,6 +630,7 @@ async def modify_consultant(user_id: str, new_user_id: str = None, password: str
         result = await update_consultant_async(user_id, new_user_id, password, name)
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
+        await analytics_cache.bump("consultants")
         logger.info(f"Consultant {user_id} updated in database")
         return result
     except HTTPException:
@@ -433,6 +646,7 @@ async def remove_consultant(user_id: str):
         result = await delete_consultant_async(user_id)
         if not result["success"]:
             raise HTTPException(status_code=404, detail=result["message"])
+        await analytics_cache.bump("consultants")
         logger.info(f"Consultant {user_id} permanently deleted from database")
         return result
     except HTTPException:
@@ -470,11 +684,12 @@ async def create_admission(
             "consultant_name": consultant_name,
             "payout_amount": payout_amount,
             "payout_status": payout_status,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         }
         
         await db.admissions.insert_one(admission)
+        await _track_inserted("admissions", [admission])
         logger.info(f"Admission recorded for student {student_name} by consultant {consultant_name}")
         
         return {
@@ -487,15 +702,23 @@ async def create_admission(
         raise HTTPException(status_code=500, detail="Failed to record admission")
 
 @router.get("/admin/admissions", response_model=dict)
-async def get_all_admissions():
-    """Get all student admissions for admin"""
+@conditional("admissions")
+async def get_all_admissions(fields: str = None):
+    """Get all student admissions for admin; fields (comma-separated) limits the returned fields"""
     try:
-        admissions = await db.admissions.find({}, {"_id": 0}).sort("created_at", -1).to_list(10000)
+        try:
+            projection = field_projection(fields, Admission)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        admissions = await db.admissions.find({}, projection).sort("created_at", -1).to_list(10000)
         return {
             "success": True,
             "admissions": admissions,
             "count": len(admissions)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching admissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch admissions")
@@ -514,7 +737,7 @@ async def update_admission(
     try:
         from datetime import datetime
         
-        update_data = {"updated_at": datetime.utcnow()}
+        update_data = {"updated_at": datetime.now(timezone.utc)}
         if student_name:
             update_data["student_name"] = student_name
         if course:
@@ -528,14 +751,19 @@ async def update_admission(
         if payout_status:
             update_data["payout_status"] = payout_status
         
-        result = await db.admissions.update_one(
+        previous = await db.admissions.find_one_and_update(
             {"id": admission_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"_id": 0, "consultant_id": 1, "created_at": 1, "payout_amount": 1}
         )
         
-        if result.modified_count == 0:
+        if not previous:
             raise HTTPException(status_code=404, detail="Admission not found")
         
+        if payout_amount is not None:
+            await record_payout_change(db, previous, payout_amount)
+        await analytics_cache.bump("admissions")
+        
         logger.info(f"Admission {admission_id} updated")
         return {"success": True, "message": "Admission updated successfully"}
     except HTTPException:
@@ -548,7 +776,7 @@ async def update_admission(
 async def delete_admission(admission_id: str):
     """Delete an admission record"""
     try:
-        result = await db.admissions.delete_one({"id": admission_id})
+        result = await _delete_tracked("admissions", {"id": admission_id}, many=False)
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Admission not found")
@@ -562,12 +790,18 @@ async def delete_admission(admission_id: str):
         raise HTTPException(status_code=500, detail="Failed to delete admission")
 
 @router.get("/consultant/admissions/{consultant_id}", response_model=dict)
-async def get_consultant_admissions(consultant_id: str):
-    """Get admissions for a specific consultant"""
+@conditional("admissions")
+async def get_consultant_admissions(consultant_id: str, fields: str = None):
+    """Get admissions for a specific consultant; fields (comma-separated) limits the returned fields"""
     try:
+        try:
+            projection = field_projection(fields, Admission)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
         admissions = await db.admissions.find(
             {"consultant_id": consultant_id}, 
-            {"_id": 0}
+            projection
         ).sort("created_at", -1).to_list(10000)
         
         return {
@@ -575,6 +809,8 @@ async def get_consultant_admissions(consultant_id: str):
             "admissions": admissions,
             "count": len(admissions)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching consultant admissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch admissions")
@@ -609,10 +845,10 @@ async def log_call(
             "student_name": student_name.strip() if student_name else "N/A",
             "contact_number": contact_number.strip() if contact_number else "N/A",
             "remarks": remarks.strip() if remarks else "",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc)
         }
         
-        await db.call_logs.insert_one(call_log)
+        await db.call_logs.insert_one(with_phone_key("call_logs", call_log))
         
         # AUTO-REMINDER: For attempted calls, create a follow-up reminder 3 days later
         if call_type == "attempted":
@@ -634,11 +870,14 @@ async def log_call(
                 "next_followup_date": reminder_date,
                 "followup_completed": False,
                 "auto_reminder": True,
-                "created_at": datetime.now(timezone.utc).isoformat()
+                "created_at": datetime.now(timezone.utc)
             }
-            await db.consultant_reports.insert_one(auto_reminder)
+            await db.consultant_reports.insert_one(with_phone_key("consultant_reports", auto_reminder))
+            await _track_inserted("consultant_reports", [auto_reminder])
             logger.info(f"Auto-reminder created for attempted call by {consultant_name} -> {reminder_date}")
         
+        await _track_inserted("call_logs", [call_log])
+        
         logger.info(f"Call logged by {consultant_name}: {call_type}")
         return {"success": True, "message": "Call logged successfully", "call_id": call_log["id"]}
     except HTTPException:
@@ -648,35 +887,48 @@ async def log_call(
         raise HTTPException(status_code=500, detail="Failed to log call")
 
 @router.get("/consultant/calls/{consultant_id}", response_model=dict)
-async def get_consultant_calls(consultant_id: str):
-    """Get call stats for a specific consultant"""
+@conditional("call_logs", "consultants")
+async def get_consultant_calls(
+    consultant_id: str,
+    stats_only: bool = False,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None,
+    fields: str = None
+):
+    """Get call stats and one page of calls (newest first) for a specific consultant
+
+    Stats cover all calls; pass next_cursor back as cursor to fetch the next page.
+    With stats_only the call list is skipped (see /consultant/calls/details).
+    fields (comma-separated) limits the returned call fields.
+    """
     try:
         consultant_name = await get_consultant_name_async(consultant_id)
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
         
-        calls = await db.call_logs.find(
-            {"consultant_id": consultant_id}, 
-            {"_id": 0}
-        ).sort("created_at", -1).to_list(10000)
-        
-        # Calculate stats
-        total_calls = len(calls)
-        successful_calls = len([c for c in calls if c.get("call_type") == "successful"])
-        failed_calls = len([c for c in calls if c.get("call_type") == "failed"])
-        attempted_calls = len([c for c in calls if c.get("call_type") == "attempted"])
-        
-        return {
+        try:
+            tasks = [rollup_call_stats(db, consultant_id)]
+            if not stats_only:
+                projection = field_projection(fields, CallLog)
+                tasks.append(paginate(db.call_logs, {"consultant_id": consultant_id}, limit, cursor, projection))
+            stats, *page = await asyncio.gather(*tasks)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        stats = stats.get(consultant_id, {})
+        response = {
             "success": True,
             "consultant_name": consultant_name,
-            "calls": calls,
             "stats": {
-                "total_calls": total_calls,
-                "successful_calls": successful_calls,
-                "failed_calls": failed_calls,
-                "attempted_calls": attempted_calls
+                "total_calls": stats.get("total_calls", 0),
+                "successful_calls": stats.get("successful_calls", 0),
+                "failed_calls": stats.get("failed_calls", 0),
+                "attempted_calls": stats.get("attempted_calls", 0)
             }
         }
+        if page:
+            response["calls"], response["next_cursor"] = page[0]
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -684,47 +936,38 @@ async def get_consultant_calls(consultant_id: str):
         raise HTTPException(status_code=500, detail="Failed to fetch calls")
 
 @router.get("/admin/calls", response_model=dict)
-async def get_all_calls():
-    """Get all call stats for admin view"""
+@cached("call_logs")
+async def get_all_calls(stats_only: bool = False, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None, fields: str = None):
+    """Get all call stats and one page of calls (newest first) for admin view
+
+    Per-consultant stats come from one $group over the daily call rollups, so
+    the cost no longer follows the call history. With stats_only the call list
+    is skipped; the list itself is paginated by /admin/calls/details.
+    """
     try:
-        calls = await db.call_logs.find({}, {"_id": 0}).sort("created_at", -1).to_list(10000)
-        
-        # Group by consultant
-        consultant_stats = {}
-        for call in calls:
-            cid = call.get("consultant_id")
-            if cid not in consultant_stats:
-                consultant_stats[cid] = {
-                    "consultant_name": call.get("consultant_name"),
-                    "total_calls": 0,
-                    "successful_calls": 0,
-                    "failed_calls": 0,
-                    "attempted_calls": 0
-                }
-            consultant_stats[cid]["total_calls"] += 1
-            call_type = call.get("call_type", "attempted")
-            if call_type == "successful":
-                consultant_stats[cid]["successful_calls"] += 1
-            elif call_type == "failed":
-                consultant_stats[cid]["failed_calls"] += 1
-            else:
-                consultant_stats[cid]["attempted_calls"] += 1
-        
-        total_calls = len(calls)
-        total_successful = len([c for c in calls if c.get("call_type") == "successful"])
-        total_failed = len([c for c in calls if c.get("call_type") == "failed"])
+        try:
+            tasks = [rollup_call_stats(db)]
+            if not stats_only:
+                tasks.append(paginate(db.call_logs, {}, limit, cursor, field_projection(fields, CallLog)))
+            consultant_stats, *page = await asyncio.gather(*tasks)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        overall_stats = {
+            field: sum(s[field] for s in consultant_stats.values())
+            for field in ["total_calls", "successful_calls", "failed_calls", "attempted_calls"]
+        }
         
-        return {
+        response = {
             "success": True,
-            "calls": calls,
             "consultant_stats": consultant_stats,
-            "overall_stats": {
-                "total_calls": total_calls,
-                "successful_calls": total_successful,
-                "failed_calls": total_failed,
-                "attempted_calls": total_calls - total_successful - total_failed
-            }
+            "overall_stats": overall_stats
         }
+        if page:
+            response["calls"], response["next_cursor"] = page[0]
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching all calls: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch calls")
@@ -742,7 +985,7 @@ async def delete_consultant_calls(consultant_id: str, password: str):
             raise HTTPException(status_code=401, detail="Invalid admin password")
         
         # Delete all calls for this consultant
-        result = await db.call_logs.delete_many({"consultant_id": consultant_id})
+        result = await _delete_tracked("call_logs", {"consultant_id": consultant_id})
         
         logger.info(f"Deleted {result.deleted_count} call logs for consultant {consultant_id}")
         
@@ -780,13 +1023,6 @@ async def bulk_delete_data(
             "admissions": 0
         }
         
-        # Build filter
-        date_filter = {}
-        if start_date:
-            date_filter["$gte"] = start_date
-        if end_date:
-            date_filter["$lte"] = end_date + "T23:59:59"
-        
         # Delete based on type
         collections_to_delete = []
         if delete_type == "reports" or delete_type == "all":
@@ -799,19 +1035,15 @@ async def bulk_delete_data(
             collections_to_delete.append(("admissions", "admissions"))
         
         for collection_name, key in collections_to_delete:
-            collection = getattr(db, collection_name)
-            query = {}
-            
-            if consultant_id and collection_name in ["consultant_reports", "call_logs", "admissions"]:
-                query["consultant_id"] = consultant_id
-            
-            if date_filter and collection_name != "student_queries":
-                query["created_at"] = date_filter
-            elif date_filter and collection_name == "student_queries":
-                query["timestamp"] = date_filter
+            try:
+                query = bulk_data_filter(collection_name, consultant_id, start_date, end_date)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid start/end date. Use YYYY-MM-DD")
             
-            result = await collection.delete_many(query)
+            result = await _delete_tracked(collection_name, query)
             deleted_counts[key] = result.deleted_count
+            if collection_name == "student_queries" and result.deleted_count:
+                await refresh_status_counts(db)
         
         total_deleted = sum(deleted_counts.values())
         logger.info(f"Bulk delete performed: {deleted_counts}")
@@ -827,6 +1059,35 @@ async def bulk_delete_data(
         logger.error(f"Error in bulk delete: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to perform bulk delete")
 
+@router.get("/admin/export/{collection}")
+async def export_data(
+    collection: str,  # reports, calls, queries, admissions
+    format: str = "csv",  # csv, ndjson
+    consultant_id: str = None,
+    start_date: str = None,
+    end_date: str = None
+):
+    """Stream a collection as CSV or NDJSON, filtered like bulk delete"""
+    try:
+        try:
+            chunks, media_type, filename = export_stream(
+                db, collection, format, consultant_id=consultant_id, start_date=start_date, end_date=end_date
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        logger.info(f"Export started: {collection} as {format}")
+        return StreamingResponse(
+            chunks,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error exporting {collection}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to export data")
+
 @router.post("/admin/verify-password", response_model=dict)
 async def verify_admin_password(password: str):
     """Verify admin password for sensitive operations"""
@@ -838,8 +1099,18 @@ async def verify_admin_password(password: str):
 # ============ DETAILED CALL STATS ENDPOINTS ============
 
 @router.get("/admin/calls/details", response_model=dict)
-async def get_admin_call_details(consultant_id: str = None, call_type: str = None):
-    """Get detailed call list for admin - filterable by consultant and call type"""
+@conditional("call_logs")
+async def get_admin_call_details(
+    consultant_id: str = None,
+    call_type: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None,
+    fields: str = None
+):
+    """Get detailed call list for admin - filterable by consultant and call type, paginated
+
+    fields (comma-separated) limits the returned call fields.
+    """
     try:
         query = {}
         if consultant_id:
@@ -847,21 +1118,37 @@ async def get_admin_call_details(consultant_id: str = None, call_type: str = Non
         if call_type:
             query["call_type"] = call_type
         
-        calls = await db.call_logs.find(query, {"_id": 0}).sort("created_at", -1).to_list(10000)
+        try:
+            calls, next_cursor = await paginate(db.call_logs, query, limit, cursor, field_projection(fields, CallLog))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         return {
             "success": True,
             "calls": calls,
-            "count": len(calls)
+            "count": len(calls),
+            "next_cursor": next_cursor
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching call details: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch call details")
 
 
 @router.get("/consultant/calls/details/{consultant_id}", response_model=dict)
-async def get_consultant_call_details(consultant_id: str, call_type: str = None):
-    """Get detailed call list for a specific consultant"""
+@conditional("call_logs", "consultants")
+async def get_consultant_call_details(
+    consultant_id: str,
+    call_type: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None,
+    fields: str = None
+):
+    """Get detailed call list for a specific consultant, paginated
+
+    fields (comma-separated) limits the returned call fields.
+    """
     try:
         consultant_name = await get_consultant_name_async(consultant_id)
         if not consultant_name:
@@ -871,13 +1158,17 @@ async def get_consultant_call_details(consultant_id: str, call_type: str = None)
         if call_type:
             query["call_type"] = call_type
         
-        calls = await db.call_logs.find(query, {"_id": 0}).sort("created_at", -1).to_list(10000)
+        try:
+            calls, next_cursor = await paginate(db.call_logs, query, limit, cursor, field_projection(fields, CallLog))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         return {
             "success": True,
             "consultant_name": consultant_name,
             "calls": calls,
-            "count": len(calls)
+            "count": len(calls),
+            "next_cursor": next_cursor
         }
     except HTTPException:
         raise
@@ -886,9 +1177,39 @@ async def get_consultant_call_details(consultant_id: str, call_type: str = None)
         raise HTTPException(status_code=500, detail="Failed to fetch call details")
 
 
+# ============ DELTA SYNC ENDPOINT ============
+
+@router.get("/consultant/sync/{consultant_id}", response_model=dict)
+async def sync_consultant_dashboard(consultant_id: str, since: str = None):
+    """Reports, calls, admissions and reminders changed since a watermark
+
+    Each section lists upserted documents and deleted ids; send the returned
+    watermark as since on the next call. reset=True means the changes are not
+    available (no or expired watermark, or too many) and lists must be reloaded.
+    """
+    try:
+        consultant_name = await get_consultant_name_async(consultant_id)
+        if not consultant_name:
+            raise HTTPException(status_code=401, detail="Unauthorized")
+        
+        try:
+            watermark = parse_watermark(since) if since else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid since watermark")
+        
+        changes = await sync_changes(db, consultant_id, watermark)
+        return {"success": True, **changes}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error syncing consultant dashboard: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to sync dashboard")
+
+
 # ============ REMINDERS ENDPOINTS ============
 
 @router.get("/consultant/reminders/{consultant_id}", response_model=dict)
+@conditional("consultant_reports", "consultants")
 async def get_consultant_reminders(consultant_id: str):
     """Get all upcoming follow-up reminders for a consultant"""
     try:
@@ -940,6 +1261,7 @@ async def get_consultant_reminders(consultant_id: str):
 
 
 @router.get("/admin/reminders", response_model=dict)
+@conditional("consultant_reports")
 async def get_all_reminders():
     """Get all upcoming follow-up reminders for admin view"""
     try:
@@ -998,6 +1320,7 @@ async def mark_reminder_complete(report_id: str, consultant_id: str):
         
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Report not found")
+        await analytics_cache.bump("consultant_reports")
         
         return {"success": True, "message": "Reminder marked as complete"}
     except HTTPException:
@@ -1026,6 +1349,7 @@ async def ignore_reminder(report_id: str, consultant_id: str):
         
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Report not found")
+        await analytics_cache.bump("consultant_reports")
         
         return {"success": True, "message": "Reminder ignored"}
     except HTTPException:
@@ -1051,6 +1375,7 @@ async def admin_delete_reminder(report_id: str):
         
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Report not found")
+        await analytics_cache.bump("consultant_reports")
         
         return {"success": True, "message": "Reminder deleted successfully"}
     except HTTPException:
@@ -1063,6 +1388,7 @@ async def admin_delete_reminder(report_id: str):
 # ============ CSV BULK UPLOAD ENDPOINTS ============
 
 @router.get("/consultant/sample-csv", response_model=dict)
+@conditional()
 async def get_sample_csv():
     """Get sample CSV format for bulk upload"""
     sample_data = [
@@ -1125,6 +1451,8 @@ async def upload_bulk_reports(consultant_id: str, reports: list = Body(...)):
         
         success_count = 0
         errors = []
+        inserted_reports = []
+        inserted_calls = []
         
         for idx, report_data in enumerate(reports):
             row_num = idx + 1
@@ -1156,11 +1484,12 @@ async def upload_bulk_reports(consultant_id: str, reports: list = Body(...)):
                     "followup_completed": False,
                     "other_remarks": report_data.get("other_remarks", "").strip(),
                     "source": "bulk",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "updated_at": datetime.now(timezone.utc).isoformat()
+                    "created_at": datetime.now(timezone.utc),
+                    "updated_at": datetime.now(timezone.utc)
                 }
                 
-                await db.consultant_reports.insert_one(report_obj)
+                await db.consultant_reports.insert_one(with_phone_key("consultant_reports", report_obj))
+                inserted_reports.append(report_obj)
                 
                 # Auto-log successful call
                 call_log = {
@@ -1171,14 +1500,18 @@ async def upload_bulk_reports(consultant_id: str, reports: list = Body(...)):
                     "contact_number": report_obj["contact_number"],
                     "call_type": "successful",
                     "remarks": f"Bulk upload - {report_obj['career_interest']}",
-                    "created_at": datetime.now(timezone.utc).isoformat()
+                    "created_at": datetime.now(timezone.utc)
                 }
-                await db.call_logs.insert_one(call_log)
+                await db.call_logs.insert_one(with_phone_key("call_logs", call_log))
+                inserted_calls.append(call_log)
                 
                 success_count += 1
             except Exception as e:
                 errors.append(f"Row {row_num}: Failed to save - {str(e)}")
         
+        await _track_inserted("consultant_reports", inserted_reports)
+        await _track_inserted("call_logs", inserted_calls)
+        
         return {
             "success": True,
             "message": f"Successfully uploaded {success_count} reports",
@@ -1197,75 +1530,57 @@ async def upload_bulk_reports(consultant_id: str, reports: list = Body(...)):
 # ============ ANALYTICS ENDPOINTS ============
 
 @router.get("/admin/analytics/overview", response_model=dict)
-async def get_analytics_overview():
-    """Get overview analytics for admin dashboard"""
+@cached("consultant_reports", "call_logs", "admissions", "student_queries")
+async def get_analytics_overview(since: str = None, until: str = None):
+    """Get overview analytics for admin dashboard
+
+    Optional since/until (ISO date or datetime) add a custom window that is
+    counted in the same pass as the today/week/month windows. Report, call and
+    admission windows are read from daily rollups and are therefore day-aligned.
+    """
     try:
-        from datetime import timedelta
-        
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        this_week_start = today - timedelta(days=today.weekday())
-        this_month_start = today.replace(day=1)
-        
-        # Total counts
-        total_reports = await db.consultant_reports.count_documents({})
-        total_calls = await db.call_logs.count_documents({})
-        total_admissions = await db.admissions.count_documents({})
-        total_queries = await db.student_queries.count_documents({})
-        
-        # Today's counts
-        today_iso = today.isoformat()
-        today_reports = await db.consultant_reports.count_documents({
-            "created_at": {"$gte": today_iso}
-        })
-        today_calls = await db.call_logs.count_documents({
-            "created_at": {"$gte": today_iso}
-        })
-        
-        # This week
-        week_iso = this_week_start.isoformat()
-        week_reports = await db.consultant_reports.count_documents({
-            "created_at": {"$gte": week_iso}
-        })
+        windows = standard_windows()
+        if since or until:
+            try:
+                windows["custom"] = (
+                    parse_window_bound(since) if since else None,
+                    parse_window_bound(until, end=True) if until else None
+                )
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid since/until date. Use ISO format (YYYY-MM-DD)")
+        
+        rollup_totals, query_counts = await asyncio.gather(
+            rollup_window_totals(db, day_windows(windows)),
+            windowed_counts(db, {"queries": "student_queries"}, windows)
+        )
         
-        # This month
-        month_iso = this_month_start.isoformat()
-        month_admissions = await db.admissions.count_documents({
-            "created_at": {"$gte": month_iso}
-        })
+        overview, window_counts = admin_overview(rollup_totals, query_counts["queries"])
         
-        return {
+        response = {
             "success": True,
-            "overview": {
-                "total_reports": total_reports,
-                "total_calls": total_calls,
-                "total_admissions": total_admissions,
-                "total_queries": total_queries,
-                "today_reports": today_reports,
-                "today_calls": today_calls,
-                "week_reports": week_reports,
-                "month_admissions": month_admissions
-            }
+            "overview": overview,
+            "windows": {window: window_counts[window] for window in ["today", "week", "month"]}
         }
+        if "custom" in window_counts:
+            response["window"] = {"since": since, "until": until, **window_counts["custom"]}
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching analytics overview: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch analytics")
 
 
 @router.get("/admin/analytics/call-distribution", response_model=dict)
+@cached("call_logs")
 async def get_call_distribution():
     """Get call type distribution for pie chart"""
     try:
-        successful = await db.call_logs.count_documents({"call_type": "successful"})
-        failed = await db.call_logs.count_documents({"call_type": "failed"})
-        attempted = await db.call_logs.count_documents({"call_type": "attempted"})
+        totals = await rollup_window_totals(db, {}, metrics=["calls"])
         
         return {
             "success": True,
-            "distribution": [
-                {"name": "Successful", "value": successful, "color": "#22c55e"},
-                {"name": "Failed", "value": failed, "color": "#ef4444"},
-                {"name": "Attempted", "value": attempted, "color": "#eab308"}
-            ]
+            "distribution": call_distribution(totals.get("total", {}).get("calls", {}))
         }
     except Exception as e:
         logger.error(f"Error fetching call distribution: {str(e)}")
@@ -1273,32 +1588,12 @@ async def get_call_distribution():
 
 
 @router.get("/admin/analytics/interest-scope", response_model=dict)
+@cached("consultant_reports")
 async def get_interest_scope_distribution():
     """Get interest scope distribution for pie chart"""
     try:
-        pipeline = [
-            {"$group": {"_id": "$interest_scope", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}}
-        ]
-        results = await db.consultant_reports.aggregate(pipeline).to_list(100)
-        
-        colors = {
-            "ACTIVELY INTERESTED": "#22c55e",
-            "LESS INTERESTED": "#f97316",
-            "RECALLING NEEDED": "#eab308",
-            "DROPOUT THIS YEAR": "#ef4444",
-            "ALREADY COLLEGE SELECTED": "#3b82f6",
-            "NOT INTERESTED": "#6b7280"
-        }
-        
-        distribution = [
-            {
-                "name": r["_id"] or "Unknown",
-                "value": r["count"],
-                "color": colors.get(r["_id"], "#8b5cf6")
-            }
-            for r in results if r["_id"]
-        ]
+        totals = await rollup_window_totals(db, {}, metrics=["reports"])
+        distribution = interest_distribution(totals.get("total", {}).get("reports", {}))
         
         return {"success": True, "distribution": distribution}
     except Exception as e:
@@ -1307,105 +1602,240 @@ async def get_interest_scope_distribution():
 
 
 @router.get("/admin/analytics/reports-trend", response_model=dict)
-async def get_reports_trend():
-    """Get daily reports trend for last 14 days"""
+@cached("consultant_reports")
+async def get_reports_trend(days: int = 14, granularity: str = "day", consultant_id: str = None):
+    """Get reports trend (daily for the last 14 days by default)"""
     try:
-        from datetime import timedelta
-        
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        trend_data = []
-        
-        for i in range(13, -1, -1):
-            date = today - timedelta(days=i)
-            next_date = date + timedelta(days=1)
-            
-            count = await db.consultant_reports.count_documents({
-                "created_at": {"$gte": date.isoformat(), "$lt": next_date.isoformat()}
-            })
-            
-            trend_data.append({
-                "date": date.strftime("%b %d"),
-                "reports": count
-            })
+        series = await rollup_series(
+            db, "reports", days=days, granularity=granularity, consultant_id=consultant_id
+        )
+        trend_data = reports_trend(series)
         
-        return {"success": True, "trend": trend_data}
+        return {"success": True, "trend": trend_data, "granularity": granularity}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching reports trend: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch reports trend")
 
 
 @router.get("/admin/analytics/consultant-performance", response_model=dict)
-async def get_consultant_performance():
-    """Get consultant performance comparison"""
+@cached("consultant_reports", "call_logs", "admissions", "consultants")
+async def get_consultant_performance(
+    limit: int = 10,
+    sort_by: str = "reports",
+    since: str = None,
+    until: str = None
+):
+    """Get consultant performance comparison
+
+    Consultants are ranked by sort_by (reports, calls, successful_calls or
+    admissions) and identified by consultant_id, so renamed consultants keep
+    their history. Optional since/until (ISO date) restrict the day-aligned
+    window.
+    """
     try:
-        # Get reports by consultant
-        reports_pipeline = [
-            {"$group": {"_id": "$consultant_name", "reports": {"$sum": 1}}},
-            {"$sort": {"reports": -1}},
-            {"$limit": 10}
-        ]
-        reports_results = await db.consultant_reports.aggregate(reports_pipeline).to_list(10)
-        
-        # Get calls by consultant
-        calls_pipeline = [
-            {"$group": {"_id": "$consultant_name", "calls": {"$sum": 1}}},
-            {"$sort": {"calls": -1}}
-        ]
-        calls_results = await db.call_logs.aggregate(calls_pipeline).to_list(100)
-        calls_map = {r["_id"]: r["calls"] for r in calls_results}
-        
-        performance = []
-        for r in reports_results:
-            name = r["_id"]
-            if name:
-                short_name = name.split()[0] if name else "Unknown"
-                performance.append({
-                    "name": short_name,
-                    "fullName": name,
-                    "reports": r["reports"],
-                    "calls": calls_map.get(name, 0)
-                })
-        
-        return {"success": True, "performance": performance}
+        try:
+            start_day = day_bound(parse_window_bound(since)) if since else None
+            end_day = day_bound(parse_window_bound(until, end=True), end=True) if until else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid since/until date. Use ISO format (YYYY-MM-DD)")
+        
+        try:
+            ranking, consultants = await asyncio.gather(
+                rollup_consultant_ranking(db, sort_by=sort_by, limit=limit, start_day=start_day, end_day=end_day),
+                get_all_consultants_async()
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        names = {c["user_id"]: c["name"] for c in consultants}
+        return {
+            "success": True,
+            "performance": consultant_performance(ranking, names),
+            "sort_by": sort_by,
+            "limit": limit
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching consultant performance: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch consultant performance")
 
 
+@router.post("/admin/analytics/rollups/rebuild", response_model=dict)
+async def rebuild_rollups(password: str, dry_run: bool = False):
+    """Recompute daily rollups from raw data and report any drift"""
+    try:
+        if password != ADMIN_PASSWORD:
+            raise HTTPException(status_code=401, detail="Invalid admin password")
+
+        result = await rebuild_daily_rollups(db, dry_run=dry_run)
+        if not dry_run:
+            await analytics_cache.bump("consultant_reports", "call_logs", "admissions")
+        logger.info(f"Daily rollups rebuilt: {result['drift_count']} drifted counters (dry_run={dry_run})")
+
+        return {"success": True, **result}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error rebuilding daily rollups: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to rebuild daily rollups")
+
+
+@router.get("/admin/analytics/cache", response_model=dict)
+async def get_analytics_cache_stats():
+    """Get hit/miss statistics for the analytics cache"""
+    return {"success": True, "cache": analytics_cache.stats()}
+
+
+@router.get("/admin/phone-lookup", response_model=dict)
+@conditional("consultant_reports", "call_logs", "student_queries")
+async def lookup_phone(number: str):
+    """Who has touched a phone number and when
+
+    The number may be in any formatting ("+91 98765 43210", "098765 43210",
+    "9876543210"); it is matched by its normalised phone_key across reports,
+    calls and student queries, newest first, with a per-consultant summary.
+    """
+    try:
+        try:
+            history = await phone_history(db, number)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"success": True, **history}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error looking up phone number: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to look up phone number")
+
+
+@router.get("/admin/indexes", response_model=dict)
+async def get_index_audit():
+    """Audit indexes against the registry in indexes.py
+
+    Lists missing registered indexes, indexes with no use since the server
+    started, and the size of every index.
+    """
+    try:
+        return {"success": True, **await audit_indexes(db)}
+    except Exception as e:
+        logger.error(f"Error auditing indexes: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to audit indexes")
+
+
+@router.get("/admin/perf/slow-queries", response_model=dict)
+async def get_slow_queries():
+    """Slow MongoDB commands and per-route DB time histograms (see perf.py)
+
+    Figures cover this worker process since it started.
+    """
+    try:
+        return {"success": True, **command_monitor.stats()}
+    except Exception as e:
+        logger.error(f"Error fetching slow queries: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to fetch slow queries")
+
+
+@router.get("/admin/perf/pool", response_model=dict)
+async def get_pool_stats():
+    """Connection pool settings with in-use counts and checkout waits per server
+
+    settings.compressors are the ones offered to the server (see database.py).
+    Figures cover this worker process since it started (see perf.py).
+    """
+    try:
+        pool_options = client.options.pool_options
+        return {
+            "success": True,
+            "settings": {
+                "max_pool_size": pool_options.max_pool_size,
+                "min_pool_size": pool_options.min_pool_size,
+                "max_idle_time_ms": None if pool_options.max_idle_time_seconds is None
+                else int(pool_options.max_idle_time_seconds * 1000),
+                "wait_queue_timeout_ms": None if pool_options.wait_queue_timeout is None
+                else int(pool_options.wait_queue_timeout * 1000),
+                "server_selection_timeout_ms": int(client.options.server_selection_timeout * 1000),
+                "compressors": CLIENT_OPTIONS.get("compressors", []),
+            },
+            "pools": pool_monitor.stats()
+        }
+    except Exception as e:
+        logger.error(f"Error fetching pool stats: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to fetch pool stats")
+
+
+@router.get("/admin/analytics/bundle", response_model=dict)
+@cached("consultant_reports", "call_logs", "admissions", "student_queries", "consultants")
+async def get_admin_analytics_bundle():
+    """Get every admin analytics chart in one response
+
+    The overview, call-distribution, interest-scope, reports-trend and
+    monthly-admissions charts share one $facet over daily rollups; query counts
+    and consultant performance run concurrently with it. timings_ms reports
+    how long each of those three sections took.
+    """
+    try:
+        timings = {}
+
+        async def timed(section, coroutine):
+            started = time.perf_counter()
+            try:
+                return await coroutine
+            finally:
+                timings[section] = round((time.perf_counter() - started) * 1000, 1)
+
+        started = time.perf_counter()
+        windows = standard_windows()
+        dashboard, query_counts, ranking, consultants = await asyncio.gather(
+            timed("rollups", rollup_dashboard(
+                db,
+                day_windows(windows),
+                series={
+                    "reports_trend": ("reports", 14, "day"),
+                    "monthly_admissions": ("admissions", days_for_months(6), "month")
+                }
+            )),
+            timed("queries", windowed_counts(db, {"queries": "student_queries"}, windows)),
+            timed("consultant_performance", rollup_consultant_ranking(db)),
+            get_all_consultants_async()
+        )
+        totals = dashboard["totals"]
+        overview, window_counts = admin_overview(totals, query_counts["queries"])
+        names = {c["user_id"]: c["name"] for c in consultants}
+        timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+
+        return {
+            "success": True,
+            "overview": overview,
+            "windows": window_counts,
+            "call_distribution": call_distribution(totals.get("total", {}).get("calls", {})),
+            "interest_scope": interest_distribution(totals.get("total", {}).get("reports", {})),
+            "reports_trend": reports_trend(dashboard["series"]["reports_trend"]),
+            "consultant_performance": consultant_performance(ranking, names),
+            "monthly_admissions": admissions_trend(dashboard["series"]["monthly_admissions"]),
+            "timings_ms": timings
+        }
+    except Exception as e:
+        logger.error(f"Error fetching admin analytics bundle: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to fetch analytics")
+
+
 # ============ CONSULTANT ANALYTICS ENDPOINTS ============
 
 @router.get("/consultant/analytics/overview/{consultant_id}", response_model=dict)
+@cached("consultant_reports", "call_logs", "admissions", "consultants")
 async def get_consultant_analytics_overview(consultant_id: str):
     """Get analytics overview for a specific consultant"""
     try:
-        from datetime import timedelta
         consultant_name = await get_consultant_name_async(consultant_id)
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        today_iso = today.isoformat()
-        week_start = (today - timedelta(days=today.weekday())).isoformat()
-        month_start = today.replace(day=1).isoformat()
+        totals = await rollup_window_totals(db, day_windows(standard_windows()), consultant_id=consultant_id)
 
-        total_reports = await db.consultant_reports.count_documents({"consultant_id": consultant_id})
-        total_calls = await db.call_logs.count_documents({"consultant_id": consultant_id})
-        total_admissions = await db.admissions.count_documents({"consultant_id": consultant_id})
-        today_reports = await db.consultant_reports.count_documents({"consultant_id": consultant_id, "created_at": {"$gte": today_iso}})
-        today_calls = await db.call_logs.count_documents({"consultant_id": consultant_id, "created_at": {"$gte": today_iso}})
-        week_reports = await db.consultant_reports.count_documents({"consultant_id": consultant_id, "created_at": {"$gte": week_start}})
-
-        return {
-            "success": True,
-            "overview": {
-                "total_reports": total_reports,
-                "total_calls": total_calls,
-                "total_admissions": total_admissions,
-                "today_reports": today_reports,
-                "today_calls": today_calls,
-                "week_reports": week_reports
-            }
-        }
+        return {"success": True, "overview": consultant_overview(totals)}
     except HTTPException:
         raise
     except Exception as e:
@@ -1414,6 +1844,7 @@ async def get_consultant_analytics_overview(consultant_id: str):
 
 
 @router.get("/consultant/analytics/call-distribution/{consultant_id}", response_model=dict)
+@cached("call_logs", "consultants")
 async def get_consultant_call_distribution(consultant_id: str):
     """Get call type distribution for a specific consultant"""
     try:
@@ -1421,17 +1852,11 @@ async def get_consultant_call_distribution(consultant_id: str):
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        successful = await db.call_logs.count_documents({"consultant_id": consultant_id, "call_type": "successful"})
-        failed = await db.call_logs.count_documents({"consultant_id": consultant_id, "call_type": "failed"})
-        attempted = await db.call_logs.count_documents({"consultant_id": consultant_id, "call_type": "attempted"})
+        totals = await rollup_window_totals(db, {}, consultant_id=consultant_id, metrics=["calls"])
 
         return {
             "success": True,
-            "distribution": [
-                {"name": "Successful", "value": successful, "color": "#22c55e"},
-                {"name": "Failed", "value": failed, "color": "#ef4444"},
-                {"name": "Attempted", "value": attempted, "color": "#eab308"}
-            ]
+            "distribution": call_distribution(totals.get("total", {}).get("calls", {}))
         }
     except HTTPException:
         raise
@@ -1441,6 +1866,7 @@ async def get_consultant_call_distribution(consultant_id: str):
 
 
 @router.get("/consultant/analytics/interest-scope/{consultant_id}", response_model=dict)
+@cached("consultant_reports", "consultants")
 async def get_consultant_interest_scope(consultant_id: str):
     """Get interest scope distribution for a specific consultant"""
     try:
@@ -1448,26 +1874,8 @@ async def get_consultant_interest_scope(consultant_id: str):
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        pipeline = [
-            {"$match": {"consultant_id": consultant_id}},
-            {"$group": {"_id": "$interest_scope", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}}
-        ]
-        results = await db.consultant_reports.aggregate(pipeline).to_list(100)
-
-        colors = {
-            "ACTIVELY INTERESTED": "#22c55e",
-            "LESS INTERESTED": "#f97316",
-            "RECALLING NEEDED": "#eab308",
-            "DROPOUT THIS YEAR": "#ef4444",
-            "ALREADY COLLEGE SELECTED": "#3b82f6",
-            "NOT INTERESTED": "#6b7280"
-        }
-
-        distribution = [
-            {"name": r["_id"] or "Unknown", "value": r["count"], "color": colors.get(r["_id"], "#8b5cf6")}
-            for r in results if r["_id"]
-        ]
+        totals = await rollup_window_totals(db, {}, consultant_id=consultant_id, metrics=["reports"])
+        distribution = interest_distribution(totals.get("total", {}).get("reports", {}))
 
         return {"success": True, "distribution": distribution}
     except HTTPException:
@@ -1478,101 +1886,109 @@ async def get_consultant_interest_scope(consultant_id: str):
 
 
 @router.get("/consultant/analytics/reports-trend/{consultant_id}", response_model=dict)
-async def get_consultant_reports_trend(consultant_id: str):
-    """Get daily reports trend for a specific consultant (last 14 days)"""
+@cached("consultant_reports", "consultants")
+async def get_consultant_reports_trend(consultant_id: str, days: int = 14, granularity: str = "day"):
+    """Get reports trend for a specific consultant (daily for the last 14 days by default)"""
     try:
-        from datetime import timedelta
         consultant_name = await get_consultant_name_async(consultant_id)
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        trend_data = []
-
-        for i in range(13, -1, -1):
-            date = today - timedelta(days=i)
-            next_date = date + timedelta(days=1)
-            count = await db.consultant_reports.count_documents({
-                "consultant_id": consultant_id,
-                "created_at": {"$gte": date.isoformat(), "$lt": next_date.isoformat()}
-            })
-            trend_data.append({"date": date.strftime("%b %d"), "reports": count})
+        series = await rollup_series(
+            db, "reports", days=days, granularity=granularity, consultant_id=consultant_id
+        )
+        trend_data = reports_trend(series)
 
-        return {"success": True, "trend": trend_data}
+        return {"success": True, "trend": trend_data, "granularity": granularity}
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching consultant reports trend: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch reports trend")
 
 
 @router.get("/consultant/analytics/daily-calls/{consultant_id}", response_model=dict)
-async def get_consultant_daily_calls(consultant_id: str):
-    """Get daily call stats for a specific consultant (last 14 days)"""
+@cached("call_logs", "consultants")
+async def get_consultant_daily_calls(consultant_id: str, days: int = 14, granularity: str = "day"):
+    """Get call stats per call type for a specific consultant (daily for the last 14 days by default)"""
     try:
-        from datetime import timedelta
         consultant_name = await get_consultant_name_async(consultant_id)
         if not consultant_name:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        trend_data = []
-
-        for i in range(13, -1, -1):
-            date = today - timedelta(days=i)
-            next_date = date + timedelta(days=1)
-            date_filter = {"consultant_id": consultant_id, "created_at": {"$gte": date.isoformat(), "$lt": next_date.isoformat()}}
-            successful = await db.call_logs.count_documents({**date_filter, "call_type": "successful"})
-            failed = await db.call_logs.count_documents({**date_filter, "call_type": "failed"})
-            attempted = await db.call_logs.count_documents({**date_filter, "call_type": "attempted"})
-            trend_data.append({
-                "date": date.strftime("%b %d"),
-                "successful": successful,
-                "failed": failed,
-                "attempted": attempted
-            })
+        series = await rollup_series(
+            db, "calls", days=days, granularity=granularity, consultant_id=consultant_id
+        )
+        trend_data = daily_calls(series)
 
-        return {"success": True, "trend": trend_data}
+        return {"success": True, "trend": trend_data, "granularity": granularity}
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching consultant daily calls: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch daily calls")
 
 
+@router.get("/consultant/analytics/bundle/{consultant_id}", response_model=dict)
+@cached("consultant_reports", "call_logs", "admissions", "consultants")
+async def get_consultant_analytics_bundle(consultant_id: str, days: int = 14, granularity: str = "day"):
+    """Get every consultant analytics chart in one response
+
+    Combines overview, call-distribution, interest-scope, reports-trend and
+    daily-calls, computed with a single $facet over the consultant's rollups.
+    """
+    try:
+        consultant_name = await get_consultant_name_async(consultant_id)
+        if not consultant_name:
+            raise HTTPException(status_code=401, detail="Unauthorized")
+
+        dashboard = await rollup_dashboard(
+            db,
+            day_windows(standard_windows()),
+            series={"reports": ("reports", days, granularity), "calls": ("calls", days, granularity)},
+            consultant_id=consultant_id
+        )
+        totals = dashboard["totals"]
+
+        return {
+            "success": True,
+            "consultant_name": consultant_name,
+            "granularity": granularity,
+            "overview": consultant_overview(totals),
+            "call_distribution": call_distribution(totals.get("total", {}).get("calls", {})),
+            "interest_scope": interest_distribution(totals.get("total", {}).get("reports", {})),
+            "reports_trend": reports_trend(dashboard["series"]["reports"]),
+            "daily_calls": daily_calls(dashboard["series"]["calls"])
+        }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error fetching consultant analytics bundle: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to fetch analytics")
+
+
 @router.get("/admin/analytics/monthly-admissions", response_model=dict)
-async def get_monthly_admissions():
-    """Get monthly admissions for the last 6 months"""
+@cached("admissions")
+async def get_monthly_admissions(days: int = None, granularity: str = "month", consultant_id: str = None):
+    """Get admissions trend (monthly for the last 6 months by default)"""
     try:
-        from datetime import timedelta
-        
-        today = datetime.now(timezone.utc)
-        monthly_data = []
-        
-        for i in range(5, -1, -1):
-            # Calculate month start and end
-            month = today.month - i
-            year = today.year
-            while month <= 0:
-                month += 12
-                year -= 1
-            
-            month_start = datetime(year, month, 1, tzinfo=timezone.utc)
-            if month == 12:
-                month_end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
-            else:
-                month_end = datetime(year, month + 1, 1, tzinfo=timezone.utc)
-            
-            count = await db.admissions.count_documents({
-                "created_at": {"$gte": month_start.isoformat(), "$lt": month_end.isoformat()}
-            })
-            
-            monthly_data.append({
-                "month": month_start.strftime("%b"),
-                "admissions": count
-            })
+        series = await rollup_series(
+            db, "admissions",
+            days=days or days_for_months(6),
+            granularity=granularity,
+            consultant_id=consultant_id
+        )
+        monthly_data = admissions_trend(series)
         
-        return {"success": True, "monthly": monthly_data}
+        return {"success": True, "monthly": monthly_data, "granularity": granularity}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching monthly admissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch monthly admissions")
@@ -1581,89 +1997,63 @@ async def get_monthly_admissions():
 # ============ LEADERBOARD ENDPOINTS ============
 
 @router.get("/leaderboard", response_model=dict)
-async def get_leaderboard(period: str = "all"):
-    """Get consultant leaderboard with rankings and badges"""
+@cached("consultant_reports", "call_logs", "admissions", "consultants")
+async def get_leaderboard(period: str = "all", since: str = None, until: str = None):
+    """Get consultant leaderboard with rankings and badges
+
+    period is all, weekly or monthly (calendar buckets read from snapshots) or a
+    rolling 7d, 30d or 90d window. since/until (ISO date) select a custom range
+    and override period; rolling and custom windows are summed from daily
+    rollups and are day-aligned.
+    """
     try:
-        from datetime import timedelta
-        consultants = await get_all_consultants_async()
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-
-        date_filter = {}
-        if period == "weekly":
-            start = (today - timedelta(days=today.weekday())).isoformat()
-            date_filter = {"created_at": {"$gte": start}}
-        elif period == "monthly":
-            start = today.replace(day=1).isoformat()
-            date_filter = {"created_at": {"$gte": start}}
-
-        leaderboard = []
-        for c in consultants:
-            cid = c["user_id"]
-            cname = c["name"]
-
-            report_filter = {"consultant_id": cid, **date_filter}
-            call_filter = {"consultant_id": cid, **date_filter}
-
-            total_reports = await db.consultant_reports.count_documents(report_filter)
-            total_calls = await db.call_logs.count_documents(call_filter)
-            successful_calls = await db.call_logs.count_documents({**call_filter, "call_type": "successful"})
-            failed_calls = await db.call_logs.count_documents({**call_filter, "call_type": "failed"})
-            attempted_calls = await db.call_logs.count_documents({**call_filter, "call_type": "attempted"})
-            total_admissions = await db.admissions.count_documents({"consultant_id": cid, **date_filter})
-
-            success_rate = round((successful_calls / total_calls * 100), 1) if total_calls > 0 else 0
-            score = (total_reports * 10) + (successful_calls * 5) + (total_admissions * 50) + (attempted_calls * 2)
-
-            # Determine badges
-            badges = []
-            if total_reports >= 50:
-                badges.append({"name": "Report Master", "icon": "file-text", "color": "#8b5cf6"})
-            elif total_reports >= 20:
-                badges.append({"name": "Active Reporter", "icon": "file-text", "color": "#3b82f6"})
-            if successful_calls >= 100:
-                badges.append({"name": "Call Champion", "icon": "phone", "color": "#22c55e"})
-            elif successful_calls >= 30:
-                badges.append({"name": "Steady Caller", "icon": "phone", "color": "#06b6d4"})
-            if success_rate >= 90 and total_calls >= 10:
-                badges.append({"name": "Sharpshooter", "icon": "target", "color": "#f59e0b"})
-            if total_admissions >= 10:
-                badges.append({"name": "Enrollment King", "icon": "crown", "color": "#f59e0b"})
-            elif total_admissions >= 3:
-                badges.append({"name": "Closer", "icon": "award", "color": "#ec4899"})
-            if total_calls >= 5 and total_calls == successful_calls:
-                badges.append({"name": "Perfect Streak", "icon": "zap", "color": "#eab308"})
-
-            leaderboard.append({
-                "consultant_id": cid,
-                "consultant_name": cname,
-                "total_reports": total_reports,
-                "total_calls": total_calls,
-                "successful_calls": successful_calls,
-                "failed_calls": failed_calls,
-                "attempted_calls": attempted_calls,
-                "total_admissions": total_admissions,
-                "success_rate": success_rate,
-                "score": score,
-                "badges": badges
-            })
-
-        # Sort by score descending
-        leaderboard.sort(key=lambda x: x["score"], reverse=True)
-
-        # Assign ranks and medals
-        for i, entry in enumerate(leaderboard):
-            entry["rank"] = i + 1
-            if i == 0:
-                entry["medal"] = "gold"
-            elif i == 1:
-                entry["medal"] = "silver"
-            elif i == 2:
-                entry["medal"] = "bronze"
-            else:
-                entry["medal"] = None
-
-        return {"success": True, "leaderboard": leaderboard, "period": period}
+        window = None
+        if since or until:
+            try:
+                window = (
+                    day_bound(parse_window_bound(since)) if since else None,
+                    day_bound(parse_window_bound(until, end=True), end=True) if until else None
+                )
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid since/until date. Use ISO format (YYYY-MM-DD)")
+            period = "custom"
+        elif period in ROLLING_PERIODS:
+            window = rolling_window(period)
+
+        if window:
+            counters = get_range_leaderboard_counters(db, *window)
+        else:
+            counters = get_leaderboard_snapshot_counters(db, period)
+        consultants, counters = await asyncio.gather(get_all_consultants_async(), counters)
+        leaderboard = build_leaderboard(consultants, counters)
+
+        response = {"success": True, "leaderboard": leaderboard, "period": period}
+        if window:
+            response["start"], response["end"] = window
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching leaderboard: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch leaderboard")
 
+
+@router.post("/admin/leaderboard/rebuild", response_model=dict)
+async def rebuild_leaderboard(password: str, dry_run: bool = False):
+    """Recompute leaderboard snapshots from raw data and report any drift"""
+    try:
+        if password != ADMIN_PASSWORD:
+            raise HTTPException(status_code=401, detail="Invalid admin password")
+
+        result = await rebuild_leaderboard_snapshots(db, dry_run=dry_run)
+        if not dry_run:
+            await analytics_cache.bump("consultant_reports", "call_logs", "admissions")
+        logger.info(f"Leaderboard snapshots rebuilt: {result['drift_count']} drifted counters (dry_run={dry_run})")
+
+        return {"success": True, **result}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error rebuilding leaderboard: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to rebuild leaderboard")
+
@@ -3,6 +3,7 @@ import os
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 from pathlib import Path
+from cache import analytics_cache, init_analytics_cache
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -302,6 +303,10 @@ async def seed_database():
         result = await db.courses.insert_many(courses_data)
         print(f"✅ Inserted {len(result.inserted_ids)} courses")
         
+        # Running API workers reload their pre-compressed catalog payloads (catalog.py)
+        await init_analytics_cache(db)
+        await analytics_cache.bump("colleges", "courses")
+        
         print("\n✅ Database seeding completed successfully!")
         
     except Exception as e:
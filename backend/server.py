@@ -1,6 +1,8 @@
 from fastapi import FastAPI, APIRouter
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 import os
 import logging
 from pathlib import Path
@@ -17,8 +19,20 @@ from routes import router as api_routes
 # Import consultants initialization
 from consultants import init_consultants_db
 
-# Create the main app without a prefix
-app = FastAPI()
+# Import index registry, leaderboard snapshot and daily rollup initialization
+from indexes import init_indexes
+from leaderboard import init_leaderboard_snapshots
+from rollups import init_daily_rollups
+from query_inbox import init_query_inbox
+from catalog import init_catalog
+from phones import init_phone_keys
+from timestamps import init_timestamps
+from cache import init_analytics_cache
+from perf import DbTimingMiddleware
+
+# Create the main app without a prefix; orjson encodes the large list
+# responses in a fraction of the time taken by the stdlib json module
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -34,6 +48,17 @@ api_router.include_router(api_routes)
 # Include the router in the main app
 app.include_router(api_router)
 
+# Charge MongoDB command time to the route serving each request (perf.py)
+app.add_middleware(DbTimingMiddleware)
+
+# Compress bodies above GZIP_MINIMUM_SIZE bytes; the catalog lists arrive
+# pre-compressed and are passed through
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.environ.get("GZIP_MINIMUM_SIZE", 1024)),
+    compresslevel=int(os.environ.get("GZIP_COMPRESS_LEVEL", 6)),
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -55,6 +80,22 @@ async def startup_event():
     # Initialize consultants collection in MongoDB
     await init_consultants_db(db)
     logger.info("Consultants database initialized")
+    result = await init_indexes(db)
+    logger.info(f"Indexes initialized: {result['indexes']} in place, {result['failed']} failed")
+    await init_analytics_cache(db)
+    logger.info("Analytics cache versions shared through cache_versions")
+    pending = await init_timestamps(db)
+    logger.info(f"Timestamps checked: {len(pending)} collections with string timestamps")
+    await init_leaderboard_snapshots(db)
+    logger.info("Leaderboard snapshots initialized")
+    await init_daily_rollups(db)
+    logger.info("Daily rollups initialized")
+    await init_query_inbox(db)
+    logger.info("Query inbox initialized")
+    backfilled = await init_phone_keys(db)
+    logger.info(f"Phone keys initialized: {backfilled} backfilled")
+    await init_catalog(db)
+    logger.info("Catalog payloads loaded")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
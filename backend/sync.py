@@ -0,0 +1,106 @@
+"""
+Delta sync for consultant dashboards.
+
+GET /consultant/sync/{consultant_id}?since=<watermark> returns the reports,
+calls and admissions of one consultant created or updated since the
+watermark, plus the ids deleted since then, and a new watermark to send next
+time. Reminders are reports with a pending follow-up, so their changes are
+derived from the changed reports.
+
+Deletes leave a tombstone in `sync_tombstones` ({collection, id,
+consultant_id, deleted_at}), expired by a TTL index (see indexes.py) after
+SYNC_TOMBSTONE_DAYS. A watermark older than that, or a diff larger than
+SYNC_MAX_CHANGES, answers reset=True and the client reloads its lists.
+
+Timestamps are compared as BSON dates with created_at_range. Each sync
+re-reads SYNC_OVERLAP before the watermark so a write whose timestamp was
+taken just before it is not missed; clients apply upserts by id, so repeats
+are harmless.
+"""
+from datetime import datetime, timedelta, timezone
+from timeseries import created_at_range
+
+# Sync section -> collection
+SYNC_COLLECTIONS = {
+    "reports": "consultant_reports",
+    "calls": "call_logs",
+    "admissions": "admissions",
+}
+
+SYNC_TOMBSTONE_DAYS = 7
+SYNC_MAX_CHANGES = 1000
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+async def record_tombstones(db, collection_name: str, docs: list):
+    """Remember deleted documents of a synced collection"""
+    if collection_name not in SYNC_COLLECTIONS.values() or not docs:
+        return
+    deleted_at = datetime.now(timezone.utc)
+    await db.sync_tombstones.insert_many([
+        {
+            "collection": collection_name,
+            "id": doc.get("id"),
+            "consultant_id": doc.get("consultant_id"),
+            "deleted_at": deleted_at
+        }
+        for doc in docs
+    ])
+
+
+def parse_watermark(since: str) -> datetime:
+    """Watermark from its ISO form (naive values are UTC); raises ValueError if malformed"""
+    watermark = datetime.fromisoformat(since.replace("Z", "+00:00"))
+    if watermark.tzinfo is None:
+        watermark = watermark.replace(tzinfo=timezone.utc)
+    return watermark
+
+
+def is_pending_reminder(report: dict) -> bool:
+    """Whether a report shows up in the reminders list"""
+    return bool(report.get("next_followup_date")) and report.get("followup_completed") is not True
+
+
+def _changed_since(consultant_id: str, start: datetime) -> dict:
+    return {
+        "consultant_id": consultant_id,
+        "$or": [created_at_range(start), created_at_range(start, field="updated_at")]
+    }
+
+
+async def sync_changes(db, consultant_id: str, since: datetime = None, now: datetime = None) -> dict:
+    """Changes to a consultant's documents since a watermark.
+
+    Without since (or when it is too old or the diff too large) only a new
+    watermark is returned with reset=True.
+    """
+    now = now or datetime.now(timezone.utc)
+    response = {"watermark": now.isoformat(), "reset": True}
+    if since is None or since < now - timedelta(days=SYNC_TOMBSTONE_DAYS):
+        return response
+
+    start = since - SYNC_OVERLAP
+    for section, collection_name in SYNC_COLLECTIONS.items():
+        upserted = await getattr(db, collection_name).find(
+            _changed_since(consultant_id, start), {"_id": 0}
+        ).to_list(SYNC_MAX_CHANGES + 1)
+        deleted = await db.sync_tombstones.find(
+            {"collection": collection_name, "consultant_id": consultant_id, "deleted_at": {"$gte": start}},
+            {"_id": 0, "id": 1}
+        ).to_list(SYNC_MAX_CHANGES + 1)
+        if len(upserted) > SYNC_MAX_CHANGES or len(deleted) > SYNC_MAX_CHANGES:
+            return response
+        # A document deleted and re-created within the window is current again
+        live = {doc.get("id") for doc in upserted}
+        response[section] = {
+            "upserted": upserted,
+            "deleted": [t["id"] for t in deleted if t["id"] not in live]
+        }
+
+    reports = response["reports"]
+    response["reminders"] = {
+        "upserted": [r for r in reports["upserted"] if is_pending_reminder(r)],
+        "deleted": reports["deleted"] + [r.get("id") for r in reports["upserted"] if not is_pending_reminder(r)]
+    }
+    response["reset"] = False
+    return response
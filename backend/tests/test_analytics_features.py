@@ -1,12 +1,15 @@
 """
 Test suite for Admin and Consultant Analytics endpoints in Edu Advisor app.
 Tests for:
-- Admin Analytics: overview, call-distribution, interest-scope, reports-trend, consultant-performance, monthly-admissions
-- Consultant Analytics: overview, call-distribution, interest-scope, reports-trend, daily-calls
+- Admin Analytics: overview (with windows), call-distribution, interest-scope, reports-trend, consultant-performance, monthly-admissions, bundle
+- Consultant Analytics: overview, call-distribution, interest-scope, reports-trend, daily-calls, bundle
+- Daily rollups: write-path updates and rebuild
+- Analytics cache: hit/miss stats and write invalidation
 """
 import pytest
 import requests
 import os
+import uuid
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
@@ -44,6 +47,43 @@ class TestAdminAnalyticsEndpoints:
         
         print(f"Admin Overview: Reports={overview['total_reports']}, Calls={overview['total_calls']}, Admissions={overview['total_admissions']}, Queries={overview['total_queries']}")
 
+    def test_admin_analytics_overview_windows(self):
+        """Test GET /api/admin/analytics/overview - today/week/month windows come back in one pass"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/overview")
+        assert response.status_code == 200
+        
+        data = response.json()
+        windows = data["windows"]
+        for window in ["today", "week", "month"]:
+            for name in ["reports", "calls", "admissions", "queries"]:
+                assert isinstance(windows[window][name], int), f"{window}.{name} should be an integer"
+        
+        overview = data["overview"]
+        assert windows["today"]["reports"] == overview["today_reports"]
+        assert windows["week"]["reports"] == overview["week_reports"]
+        assert windows["month"]["admissions"] == overview["month_admissions"]
+        assert windows["today"]["reports"] <= windows["week"]["reports"]
+        assert windows["today"]["reports"] <= windows["month"]["reports"]
+
+    def test_admin_analytics_overview_custom_window(self):
+        """Test GET /api/admin/analytics/overview?since=&until= - custom window counts"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/analytics/overview",
+            params={"since": "2020-01-01", "until": "2099-12-31"}
+        )
+        assert response.status_code == 200
+        
+        data = response.json()
+        window = data["window"]
+        assert window["since"] == "2020-01-01"
+        for name in ["reports", "calls", "admissions", "queries"]:
+            assert window[name] <= data["overview"][f"total_{name}"]
+
+    def test_admin_analytics_overview_invalid_window(self):
+        """Test GET /api/admin/analytics/overview with a malformed date - should return 400"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/overview", params={"since": "not-a-date"})
+        assert response.status_code == 400
+
     def test_admin_call_distribution(self):
         """Test GET /api/admin/analytics/call-distribution - should return pie chart data"""
         response = requests.get(f"{BASE_URL}/api/admin/analytics/call-distribution")
@@ -111,6 +151,26 @@ class TestAdminAnalyticsEndpoints:
         
         print(f"Admin Reports Trend: {len(trend)} days")
 
+    def test_admin_reports_trend_weekly(self):
+        """Test GET /api/admin/analytics/reports-trend?granularity=week - weekly buckets"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/analytics/reports-trend",
+            params={"days": 28, "granularity": "week"}
+        )
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["granularity"] == "week"
+        trend = data["trend"]
+        assert 4 <= len(trend) <= 5, f"28 days should span 4-5 weeks, got {len(trend)}"
+        starts = [item["start"] for item in trend]
+        assert starts == sorted(starts), "Buckets should be oldest first"
+
+    def test_admin_reports_trend_invalid_granularity(self):
+        """Test GET /api/admin/analytics/reports-trend with an unknown granularity - should return 400"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/reports-trend", params={"granularity": "hour"})
+        assert response.status_code == 400
+
     def test_admin_consultant_performance(self):
         """Test GET /api/admin/analytics/consultant-performance - should return bar chart data"""
         response = requests.get(f"{BASE_URL}/api/admin/analytics/consultant-performance")
@@ -132,6 +192,36 @@ class TestAdminAnalyticsEndpoints:
         
         print(f"Admin Consultant Performance: {len(performance)} consultants")
 
+    @pytest.mark.parametrize("sort_by", ["reports", "calls", "successful_calls", "admissions"])
+    def test_admin_consultant_performance_sorted(self, sort_by):
+        """Test consultant-performance with sort_by and limit - ranked by consultant_id"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/analytics/consultant-performance",
+            params={"sort_by": sort_by, "limit": 3}
+        )
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+        performance = response.json()["performance"]
+        assert len(performance) <= 3
+        values = [item[sort_by] for item in performance]
+        assert values == sorted(values, reverse=True), f"Performance should be sorted by {sort_by}"
+        assert len({item["consultant_id"] for item in performance}) == len(performance)
+
+    def test_admin_consultant_performance_window(self):
+        """Test consultant-performance with a since/until window and invalid parameters"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/analytics/consultant-performance",
+            params={"since": "2020-01-01", "until": "2020-01-31"}
+        )
+        assert response.status_code == 200
+        assert response.json()["performance"] == [], "No activity expected in a 2020 window"
+
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/consultant-performance", params={"sort_by": "score"})
+        assert response.status_code == 400
+
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/consultant-performance", params={"since": "yesterday"})
+        assert response.status_code == 400
+
     def test_admin_monthly_admissions(self):
         """Test GET /api/admin/analytics/monthly-admissions - should return 6-month bar chart data"""
         response = requests.get(f"{BASE_URL}/api/admin/analytics/monthly-admissions")
@@ -258,6 +348,161 @@ class TestConsultantAnalyticsEndpoints:
         print(f"Consultant Daily Calls: {len(trend)} days")
 
 
+class TestConsultantAnalyticsBundle:
+    """Test the one-shot consultant analytics bundle"""
+
+    def test_consultant_bundle(self):
+        """Test GET /api/consultant/analytics/bundle/{consultant_id} - all five charts in one response"""
+        response = requests.get(f"{BASE_URL}/api/consultant/analytics/bundle/{CONSULTANT_ID}")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        
+        data = response.json()
+        assert data.get("success") is True
+        for key in ["overview", "call_distribution", "interest_scope", "reports_trend", "daily_calls"]:
+            assert key in data, f"Bundle should contain {key}"
+        assert len(data["reports_trend"]) == 14
+        assert len(data["daily_calls"]) == 14
+
+    def test_consultant_bundle_matches_single_endpoints(self):
+        """Bundle payloads should equal the individual analytics endpoints"""
+        bundle = requests.get(f"{BASE_URL}/api/consultant/analytics/bundle/{CONSULTANT_ID}").json()
+        
+        overview = requests.get(f"{BASE_URL}/api/consultant/analytics/overview/{CONSULTANT_ID}").json()
+        calls = requests.get(f"{BASE_URL}/api/consultant/analytics/call-distribution/{CONSULTANT_ID}").json()
+        daily = requests.get(f"{BASE_URL}/api/consultant/analytics/daily-calls/{CONSULTANT_ID}").json()
+        
+        assert bundle["overview"] == overview["overview"]
+        assert bundle["call_distribution"] == calls["distribution"]
+        assert bundle["daily_calls"] == daily["trend"]
+
+    def test_consultant_bundle_unauthorized(self):
+        """Test bundle with an unknown consultant - should return 401"""
+        response = requests.get(f"{BASE_URL}/api/consultant/analytics/bundle/INVALID_USER")
+        assert response.status_code == 401
+
+
+class TestAdminAnalyticsBundle:
+    """Test the one-shot admin analytics bundle"""
+
+    def test_admin_bundle(self):
+        """Test GET /api/admin/analytics/bundle - all six charts plus section timings"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/bundle")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        
+        data = response.json()
+        assert data.get("success") is True
+        for key in ["overview", "call_distribution", "interest_scope", "reports_trend",
+                    "consultant_performance", "monthly_admissions"]:
+            assert key in data, f"Bundle should contain {key}"
+        assert len(data["reports_trend"]) == 14
+        assert len(data["consultant_performance"]) <= 10
+        for section in ["rollups", "queries", "consultant_performance", "total"]:
+            assert section in data["timings_ms"], f"timings_ms should contain {section}"
+        print(f"Admin bundle timings: {data['timings_ms']}")
+
+    def test_admin_bundle_matches_single_endpoints(self):
+        """Bundle payloads should equal the individual admin analytics endpoints"""
+        bundle = requests.get(f"{BASE_URL}/api/admin/analytics/bundle").json()
+        
+        overview = requests.get(f"{BASE_URL}/api/admin/analytics/overview").json()
+        calls = requests.get(f"{BASE_URL}/api/admin/analytics/call-distribution").json()
+        performance = requests.get(f"{BASE_URL}/api/admin/analytics/consultant-performance").json()
+        monthly = requests.get(f"{BASE_URL}/api/admin/analytics/monthly-admissions").json()
+        
+        assert bundle["overview"] == overview["overview"]
+        assert bundle["call_distribution"] == calls["distribution"]
+        assert bundle["consultant_performance"] == performance["performance"]
+        assert bundle["monthly_admissions"] == monthly["monthly"]
+
+
+class TestDailyRollups:
+    """Test analytics served from daily rollups"""
+
+    def test_logged_call_updates_consultant_analytics(self):
+        """Logging a call should show up in today's consultant analytics immediately"""
+        before = requests.get(f"{BASE_URL}/api/consultant/analytics/overview/{CONSULTANT_ID}").json()["overview"]
+        
+        response = requests.post(
+            f"{BASE_URL}/api/consultant/calls",
+            params={
+                "consultant_id": CONSULTANT_ID,
+                "call_type": "failed",
+                "contact_number": f"7777{uuid.uuid4().hex[:6]}",
+                "student_name": "TEST_Rollup_Student"
+            }
+        )
+        assert response.status_code == 200
+        
+        after = requests.get(f"{BASE_URL}/api/consultant/analytics/overview/{CONSULTANT_ID}").json()["overview"]
+        assert after["total_calls"] == before["total_calls"] + 1
+        assert after["today_calls"] == before["today_calls"] + 1
+
+    def test_rollup_rebuild_requires_admin_password(self):
+        """Test POST /api/admin/analytics/rollups/rebuild with a wrong password - should return 401"""
+        response = requests.post(f"{BASE_URL}/api/admin/analytics/rollups/rebuild", params={"password": "wrong"})
+        assert response.status_code == 401
+
+    def test_rollup_rebuild_reports_no_drift(self):
+        """After a rebuild, a dry-run rebuild should report zero drift"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/analytics/rollups/rebuild", params={"password": ADMIN_PASSWORD}
+        )
+        assert response.status_code == 200
+        
+        response = requests.post(
+            f"{BASE_URL}/api/admin/analytics/rollups/rebuild",
+            params={"password": ADMIN_PASSWORD, "dry_run": True}
+        )
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["dry_run"] is True
+        assert data["drift_count"] == 0, f"Unexpected drift: {data['drift'][:5]}"
+        print(f"Daily rollups: {data['rollup_count']}")
+
+
+class TestAnalyticsCache:
+    """Test the analytics cache and its stats endpoint"""
+
+    def test_cache_stats_endpoint(self):
+        """Test GET /api/admin/analytics/cache - should report hit/miss stats"""
+        response = requests.get(f"{BASE_URL}/api/admin/analytics/cache")
+        assert response.status_code == 200
+        
+        cache = response.json()["cache"]
+        for field in ["hits", "misses", "hit_rate", "entries", "evictions", "invalidations", "ttl_seconds"]:
+            assert field in cache, f"Cache stats should have {field}"
+
+    def test_repeated_request_is_a_hit(self):
+        """Requesting the same analytics twice should count a cache hit"""
+        requests.get(f"{BASE_URL}/api/admin/analytics/interest-scope")
+        before = requests.get(f"{BASE_URL}/api/admin/analytics/cache").json()["cache"]
+        
+        requests.get(f"{BASE_URL}/api/admin/analytics/interest-scope")
+        after = requests.get(f"{BASE_URL}/api/admin/analytics/cache").json()["cache"]
+        
+        if after["ttl_seconds"] > 0:
+            assert after["hits"] == before["hits"] + 1
+
+    def test_write_invalidates_cached_analytics(self):
+        """A logged call must be visible even if call distribution was cached"""
+        first = requests.get(f"{BASE_URL}/api/consultant/analytics/call-distribution/{CONSULTANT_ID}").json()
+        failed_before = next(d["value"] for d in first["distribution"] if d["name"] == "Failed")
+        
+        requests.post(
+            f"{BASE_URL}/api/consultant/calls",
+            params={
+                "consultant_id": CONSULTANT_ID,
+                "call_type": "failed",
+                "contact_number": f"6666{uuid.uuid4().hex[:6]}"
+            }
+        )
+        
+        second = requests.get(f"{BASE_URL}/api/consultant/analytics/call-distribution/{CONSULTANT_ID}").json()
+        failed_after = next(d["value"] for d in second["distribution"] if d["name"] == "Failed")
+        assert failed_after == failed_before + 1
+
+
 class TestCSVBulkUploadWarningBanner:
     """Test CSV Bulk Upload sample CSV endpoint"""
 
@@ -170,6 +170,85 @@ class TestGetCallStats:
         assert "consultant_stats" in data
         print(f"✓ Admin call stats retrieved: {data['overall_stats']}")
 
+    def test_admin_call_stats_only(self):
+        """Stats-only mode should skip the call list and keep totals consistent"""
+        response = requests.get(f"{BASE_URL}/api/admin/calls", params={"stats_only": True})
+        assert response.status_code == 200
+        data = response.json()
+        assert "calls" not in data
+        for field in ["total_calls", "successful_calls", "failed_calls", "attempted_calls"]:
+            assert data["overall_stats"][field] == sum(s[field] for s in data["consultant_stats"].values())
+
+        response = requests.get(f"{BASE_URL}/api/consultant/calls/{CONSULTANT_ID}", params={"stats_only": True})
+        assert response.status_code == 200
+        assert "calls" not in response.json()
+        assert "stats" in response.json()
+
+
+class TestCallPagination:
+    """Test keyset pagination of call listings"""
+
+    def test_pages_do_not_overlap(self):
+        """Walking next_cursor should return disjoint pages in newest-first order"""
+        url = f"{BASE_URL}/api/consultant/calls/details/{CONSULTANT_ID}"
+        first = requests.get(url, params={"limit": 2}).json()
+        assert first.get("success") == True
+        assert len(first["calls"]) <= 2
+        if not first["next_cursor"]:
+            pytest.skip("Not enough calls to paginate")
+
+        second = requests.get(url, params={"limit": 2, "cursor": first["next_cursor"]}).json()
+        first_ids = {c["id"] for c in first["calls"]}
+        assert not first_ids & {c["id"] for c in second["calls"]}, "Pages should not overlap"
+
+        both = requests.get(url, params={"limit": 4}).json()
+        assert [c["id"] for c in both["calls"]] == [c["id"] for c in first["calls"] + second["calls"]]
+        print(f"✓ Paginated {len(first['calls']) + len(second['calls'])} calls")
+
+    def test_stats_cover_all_calls(self):
+        """Stats should count every call even when only one page is returned"""
+        response = requests.get(f"{BASE_URL}/api/consultant/calls/{CONSULTANT_ID}", params={"limit": 1})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["calls"]) <= 1
+        assert data["stats"]["total_calls"] >= len(data["calls"])
+        if data["next_cursor"]:
+            assert data["stats"]["total_calls"] > 1
+
+    def test_admin_call_details_paginated(self):
+        """Admin call details should honour limit and return next_cursor"""
+        response = requests.get(f"{BASE_URL}/api/admin/calls/details", params={"limit": 5})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == len(data["calls"]) <= 5
+        assert "next_cursor" in data
+
+    def test_invalid_cursor_and_limit(self):
+        """Malformed cursors and out-of-range limits should return 400"""
+        response = requests.get(f"{BASE_URL}/api/admin/calls", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        response = requests.get(f"{BASE_URL}/api/admin/calls/details", params={"limit": 0})
+        assert response.status_code == 400
+
+    def test_sparse_fieldset(self):
+        """fields= should return only the requested fields plus id and created_at"""
+        url = f"{BASE_URL}/api/consultant/calls/details/{CONSULTANT_ID}"
+        data = requests.get(url, params={"limit": 3, "fields": "call_type,student_name"}).json()
+        for call in data["calls"]:
+            assert set(call) <= {"id", "created_at", "call_type", "student_name"}
+            assert "remarks" not in call
+
+        if data["next_cursor"]:
+            second = requests.get(url, params={"limit": 3, "fields": "call_type", "cursor": data["next_cursor"]})
+            assert second.status_code == 200
+
+    def test_unknown_fields_rejected(self):
+        """Fields not defined on the model should return 400"""
+        response = requests.get(f"{BASE_URL}/api/admin/calls/details", params={"fields": "call_type,password"})
+        assert response.status_code == 400
+        response = requests.get(f"{BASE_URL}/api/admin/admissions", params={"fields": "remarks"})
+        assert response.status_code == 400
+
 
 class TestAdminDeleteCallStats:
     """Test admin ability to delete call statistics for a consultant"""
@@ -0,0 +1,74 @@
+"""
+Test suite for response compression in Edu Advisor app.
+Tests for:
+- gzip compression of large responses and none for small ones
+- Pre-compressed /colleges and /courses payloads (brotli, gzip, identity)
+- ETag revalidation of the catalog payloads
+"""
+import gzip
+import json
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+def raw_get(path, accept_encoding, **headers):
+    """GET without letting requests decode the body"""
+    response = requests.get(
+        f"{BASE_URL}{path}",
+        headers={"Accept-Encoding": accept_encoding, **headers},
+        stream=True
+    )
+    return response, response.raw.read(decode_content=False)
+
+
+class TestResponseCompression:
+    """Test GZipMiddleware on dynamic responses"""
+
+    def test_large_response_gzipped(self):
+        """Large list responses should be gzip encoded"""
+        response, body = raw_get("/api/admin/calls/details?limit=200", "gzip")
+        assert response.status_code == 200
+        if response.headers.get("Content-Encoding") != "gzip":
+            pytest.skip("Response below the compression threshold")
+        assert "Accept-Encoding" in response.headers.get("Vary", "")
+        assert json.loads(gzip.decompress(body))["success"] is True
+
+    def test_small_response_not_compressed(self):
+        """Responses under the threshold should be sent as is"""
+        response, body = raw_get("/api/", "gzip")
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(body)["message"]
+
+
+class TestCatalogPayloads:
+    """Test pre-compressed /colleges and /courses"""
+
+    @pytest.mark.parametrize("path", ["/api/colleges", "/api/courses"])
+    def test_gzip_payload(self, path):
+        """Clients accepting only gzip should get the gzip payload"""
+        response, body = raw_get(path, "gzip")
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        data = json.loads(gzip.decompress(body))
+        assert data["success"] is True
+        assert data["count"] == len(data[path.rsplit("/", 1)[1]])
+
+    def test_brotli_preferred(self):
+        """Clients accepting brotli should get it; br;q=0 should fall back to gzip"""
+        response, _ = raw_get("/api/colleges", "gzip, deflate, br")
+        assert response.headers["Content-Encoding"] == "br"
+        response, _ = raw_get("/api/colleges", "gzip, br;q=0")
+        assert response.headers["Content-Encoding"] == "gzip"
+
+    def test_identity_and_etag(self):
+        """Without compression the JSON is sent plain, and its ETag revalidates"""
+        response, body = raw_get("/api/courses", "identity")
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(body)["success"] is True
+
+        revalidated, _ = raw_get("/api/courses", "identity", **{"If-None-Match": response.headers["ETag"]})
+        assert revalidated.status_code == 304
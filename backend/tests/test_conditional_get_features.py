@@ -0,0 +1,70 @@
+"""
+Test suite for conditional GET support in Edu Advisor app.
+Tests for:
+- ETag and Cache-Control headers on list and analytics endpoints
+- 304 Not Modified for a matching If-None-Match
+- A new ETag after a write to a collection the endpoint depends on
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestConditionalGet:
+    """Test ETag / If-None-Match handling"""
+
+    @pytest.mark.parametrize("path", [
+        "/api/admin/consultants",
+        "/api/admin/admissions",
+        "/api/admin/calls/details",
+        "/api/admin/analytics/bundle",
+        "/api/leaderboard",
+    ])
+    def test_matching_etag_returns_304(self, path):
+        """Repeating a request with its ETag should return an empty 304"""
+        first = requests.get(f"{BASE_URL}{path}")
+        assert first.status_code == 200
+        etag = first.headers.get("ETag")
+        assert etag, f"{path} should send an ETag"
+        assert first.headers.get("Cache-Control") == "no-cache"
+
+        second = requests.get(f"{BASE_URL}{path}", headers={"If-None-Match": etag})
+        assert second.status_code == 304, f"Expected 304, got {second.status_code}"
+        assert second.content == b""
+        assert second.headers.get("ETag") == etag
+
+    def test_etag_depends_on_parameters(self):
+        """A different page size should not match the first response's ETag"""
+        first = requests.get(f"{BASE_URL}/api/queries", params={"limit": 5})
+        second = requests.get(
+            f"{BASE_URL}/api/queries",
+            params={"limit": 6},
+            headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == 200
+
+    def test_write_changes_etag(self):
+        """Creating a query should invalidate the inbox ETag"""
+        first = requests.get(f"{BASE_URL}/api/queries", params={"limit": 5})
+        etag = first.headers["ETag"]
+
+        response = requests.post(f"{BASE_URL}/api/queries", json={
+            "name": "TEST_Etag Student",
+            "phone": "+91 9000000000",
+            "email": "test_etag@example.com",
+            "current_institution": "TEST School",
+            "course": "TEST_COURSE",
+            "message": "ETag test"
+        })
+        assert response.status_code == 200
+        query_id = response.json()["query_id"]
+
+        try:
+            after = requests.get(f"{BASE_URL}/api/queries", params={"limit": 5}, headers={"If-None-Match": etag})
+            assert after.status_code == 200
+            assert after.headers["ETag"] != etag
+            assert query_id in {q["id"] for q in after.json()["queries"]}
+        finally:
+            requests.delete(f"{BASE_URL}/api/queries/{query_id}")
@@ -0,0 +1,66 @@
+"""
+Test suite for streaming data export in Edu Advisor app.
+Tests for:
+- GET /api/admin/export/{collection} as CSV and NDJSON
+- consultant_id and start/end date filters shared with bulk delete
+- Validation of collection, format and dates
+"""
+import csv
+import io
+import json
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+CONSULTANT_ID = "PRIYAMPATRA"
+
+
+class TestStreamingExport:
+    """Test GET /api/admin/export/{collection}"""
+
+    @pytest.mark.parametrize("collection", ["reports", "calls", "admissions", "queries"])
+    def test_csv_export(self, collection):
+        """CSV export should stream a header row plus one row per document"""
+        response = requests.get(f"{BASE_URL}/api/admin/export/{collection}", stream=True)
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers.get("content-disposition", "")
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert "id" in rows[0], "Header should include id"
+        print(f"Exported {len(rows) - 1} {collection}")
+
+    def test_ndjson_export_filtered_by_consultant(self):
+        """NDJSON export should honour the consultant_id filter"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/export/calls",
+            params={"format": "ndjson", "consultant_id": CONSULTANT_ID},
+            stream=True
+        )
+        assert response.status_code == 200
+        for line in response.iter_lines():
+            if line:
+                assert json.loads(line)["consultant_id"] == CONSULTANT_ID
+
+    def test_date_filtered_export(self):
+        """A date range with no activity should export only the header"""
+        response = requests.get(
+            f"{BASE_URL}/api/admin/export/reports",
+            params={"start_date": "2020-01-01", "end_date": "2020-01-31"}
+        )
+        assert response.status_code == 200
+        assert len(list(csv.reader(io.StringIO(response.text)))) == 1
+
+    @pytest.mark.parametrize("params", [
+        {"collection": "colleges"},
+        {"collection": "calls", "format": "xlsx"},
+        {"collection": "calls", "start_date": "last-week"},
+    ])
+    def test_invalid_export(self, params):
+        """Unknown collections, formats and malformed dates should return 400"""
+        collection = params.pop("collection")
+        response = requests.get(f"{BASE_URL}/api/admin/export/{collection}", params=params)
+        assert response.status_code == 400
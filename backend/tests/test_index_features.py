@@ -0,0 +1,38 @@
+"""
+Test suite for the index registry in Edu Advisor app.
+Tests for:
+- GET /api/admin/indexes audit structure
+- Registered indexes present after startup
+"""
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestIndexAudit:
+    """Test GET /api/admin/indexes"""
+
+    def test_audit_structure(self):
+        """Audit should list indexes per collection with usage and size"""
+        response = requests.get(f"{BASE_URL}/api/admin/indexes")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+        data = response.json()
+        assert data.get("success") is True
+        for key in ["collections", "missing", "unused", "total_index_size_bytes"]:
+            assert key in data, f"Audit should return {key}"
+        for index in data["collections"]["call_logs"]["indexes"]:
+            for key in ["name", "keys", "unique", "registered", "ops", "size_bytes"]:
+                assert key in index
+
+    def test_registered_indexes_created(self):
+        """Startup should have created the unique id and lookup indexes"""
+        data = requests.get(f"{BASE_URL}/api/admin/indexes").json()
+        reports = {ix["name"]: ix for ix in data["collections"]["consultant_reports"]["indexes"]}
+        assert reports["id_1"]["unique"] is True
+        assert "consultant_id_1_contact_number_1" in reports
+        assert "followup_completed_1_next_followup_date_1" in reports
+        consultants = {ix["name"]: ix for ix in data["collections"]["consultants"]["indexes"]}
+        assert consultants["user_id_1"]["unique"] is True
+        print(f"Missing indexes: {data['missing']}")
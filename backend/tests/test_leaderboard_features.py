@@ -0,0 +1,153 @@
+"""
+Test suite for the consultant Leaderboard in Edu Advisor app.
+Tests for:
+- GET /api/leaderboard for all, weekly and monthly periods
+- Rolling 7d/30d/90d and custom since/until windows
+- Ranking, medals, scores and badges consistency
+- Incremental snapshot updates and POST /api/admin/leaderboard/rebuild
+"""
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+CONSULTANT_ID = "PRIYAMPATRA"
+ADMIN_PASSWORD = "EDUadvisors@souvikCEO2026"
+
+
+def get_entry(period="all"):
+    response = requests.get(f"{BASE_URL}/api/leaderboard?period={period}")
+    assert response.status_code == 200
+    return next(e for e in response.json()["leaderboard"] if e["consultant_id"] == CONSULTANT_ID)
+
+
+def expected_score(entry):
+    return (entry["total_reports"] * 10) + (entry["successful_calls"] * 5) + \
+        (entry["total_admissions"] * 50) + (entry["attempted_calls"] * 2)
+
+
+class TestLeaderboardEndpoint:
+    """Test GET /api/leaderboard"""
+
+    @pytest.mark.parametrize("period", ["all", "weekly", "monthly", "7d", "30d", "90d"])
+    def test_leaderboard_structure(self, period):
+        """Leaderboard should return one ranked entry per consultant"""
+        response = requests.get(f"{BASE_URL}/api/leaderboard?period={period}")
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+        data = response.json()
+        assert data.get("success") is True
+        assert data.get("period") == period
+
+        leaderboard = data["leaderboard"]
+        assert isinstance(leaderboard, list)
+        assert any(e["consultant_id"] == CONSULTANT_ID for e in leaderboard), "Known consultant should be listed"
+
+        for entry in leaderboard:
+            for field in ["consultant_id", "consultant_name", "total_reports", "total_calls",
+                          "successful_calls", "failed_calls", "attempted_calls", "total_admissions",
+                          "success_rate", "score", "badges", "rank", "medal"]:
+                assert field in entry, f"Entry should have {field}"
+
+        print(f"Leaderboard ({period}): {len(leaderboard)} consultants")
+
+    def test_leaderboard_ranks_and_medals(self):
+        """Ranks should be sequential by descending score with medals for the top 3"""
+        response = requests.get(f"{BASE_URL}/api/leaderboard?period=all")
+        assert response.status_code == 200
+
+        leaderboard = response.json()["leaderboard"]
+        scores = [e["score"] for e in leaderboard]
+        assert scores == sorted(scores, reverse=True), "Leaderboard should be sorted by score"
+
+        for i, entry in enumerate(leaderboard):
+            assert entry["rank"] == i + 1
+            assert entry["medal"] == (["gold", "silver", "bronze"][i] if i < 3 else None)
+
+    def test_leaderboard_scores_match_counters(self):
+        """Score and call counters should be internally consistent"""
+        response = requests.get(f"{BASE_URL}/api/leaderboard?period=all")
+        assert response.status_code == 200
+
+        for entry in response.json()["leaderboard"]:
+            assert entry["score"] == expected_score(entry)
+            assert entry["successful_calls"] + entry["failed_calls"] + entry["attempted_calls"] <= entry["total_calls"]
+
+
+class TestLeaderboardWindows:
+    """Test rolling and custom leaderboard windows"""
+
+    def test_rolling_windows_are_nested(self):
+        """A longer rolling window should never have smaller counters than a shorter one"""
+        short, long = get_entry("7d"), get_entry("90d")
+        everything = get_entry("all")
+        for field in ["total_reports", "total_calls", "total_admissions"]:
+            assert short[field] <= long[field] <= everything[field], f"{field} should grow with the window"
+
+    def test_custom_window(self):
+        """since/until should return a custom period with its day range"""
+        response = requests.get(
+            f"{BASE_URL}/api/leaderboard", params={"since": "2020-01-01", "until": "2020-03-31"}
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["period"] == "custom"
+        assert data["start"] == "2020-01-01"
+        assert data["end"] == "2020-04-01"
+        assert all(e["score"] == 0 for e in data["leaderboard"]), "No activity expected in a 2020 window"
+
+    def test_custom_window_invalid_date(self):
+        """Malformed since/until should return 400"""
+        response = requests.get(f"{BASE_URL}/api/leaderboard", params={"since": "last-quarter"})
+        assert response.status_code == 400
+
+
+class TestLeaderboardSnapshots:
+    """Test incrementally maintained leaderboard snapshots"""
+
+    @pytest.mark.parametrize("period", ["all", "weekly", "monthly"])
+    def test_logged_call_updates_snapshot(self, period):
+        """Logging a failed call should bump total_calls and failed_calls immediately"""
+        before = get_entry(period)
+
+        response = requests.post(
+            f"{BASE_URL}/api/consultant/calls",
+            params={
+                "consultant_id": CONSULTANT_ID,
+                "call_type": "failed",
+                "contact_number": f"8888{uuid.uuid4().hex[:6]}",
+                "student_name": "TEST_Leaderboard_Student"
+            }
+        )
+        assert response.status_code == 200
+
+        after = get_entry(period)
+        assert after["total_calls"] == before["total_calls"] + 1
+        assert after["failed_calls"] == before["failed_calls"] + 1
+
+    def test_rebuild_requires_admin_password(self):
+        """Rebuild should reject an invalid admin password"""
+        response = requests.post(f"{BASE_URL}/api/admin/leaderboard/rebuild", params={"password": "wrong"})
+        assert response.status_code == 401
+
+    def test_rebuild_reports_no_drift(self):
+        """After a rebuild, a dry-run rebuild should report zero drift"""
+        response = requests.post(
+            f"{BASE_URL}/api/admin/leaderboard/rebuild", params={"password": ADMIN_PASSWORD}
+        )
+        assert response.status_code == 200
+        assert response.json().get("success") is True
+
+        response = requests.post(
+            f"{BASE_URL}/api/admin/leaderboard/rebuild", params={"password": ADMIN_PASSWORD, "dry_run": True}
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["dry_run"] is True
+        assert data["drift_count"] == 0, f"Unexpected drift: {data['drift'][:5]}"
+        print(f"Leaderboard snapshots: {data['snapshot_count']}")
@@ -0,0 +1,81 @@
+"""
+Test suite for MongoDB command monitoring in Edu Advisor app.
+Tests for:
+- /api/admin/perf/slow-queries response shape
+- Per-route DB time histograms filled by API requests
+- Filter shapes of slow commands carrying no values
+- Connection pool settings and checkout metrics
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+@pytest.fixture(scope="module")
+def perf_stats():
+    """Stats after a request that reads from MongoDB"""
+    assert requests.get(f"{BASE_URL}/api/admin/calls?limit=5").status_code == 200
+    response = requests.get(f"{BASE_URL}/api/admin/perf/slow-queries")
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestSlowQueryLog:
+    """Test the slow-query endpoint"""
+
+    def test_response_shape(self, perf_stats):
+        """Endpoint should return the threshold, slow commands and routes"""
+        assert perf_stats["success"] is True
+        assert perf_stats["threshold_ms"] > 0
+        assert isinstance(perf_stats["slow_queries"], list)
+        assert len(perf_stats["slow_queries"]) <= perf_stats["buffer_size"]
+        print(f"Slow commands kept: {len(perf_stats['slow_queries'])}")
+
+    def test_route_histogram(self, perf_stats):
+        """The calls list route should have DB time recorded"""
+        route = perf_stats["routes"].get("GET /api/admin/calls")
+        assert route is not None
+        assert route["requests"] >= 1
+        assert route["commands"] >= 1
+        assert sum(route["histogram"].values()) == route["requests"]
+        assert route["db_ms_avg"] <= route["db_ms_max"] + 0.01
+
+    def test_slow_query_entries(self, perf_stats):
+        """Slow commands should carry a collection and a value-free shape"""
+        if not perf_stats["slow_queries"]:
+            pytest.skip("No command above the threshold yet")
+        for entry in perf_stats["slow_queries"]:
+            assert entry["collection"]
+            assert entry["duration_ms"] >= perf_stats["threshold_ms"]
+            assert entry["route"]
+
+        def values(shape):
+            if isinstance(shape, dict):
+                return [v for item in shape.values() for v in values(item)]
+            if isinstance(shape, list):
+                return [v for item in shape for v in values(item)]
+            return [shape]
+        for entry in perf_stats["slow_queries"]:
+            if entry["command"] == "find":
+                assert set(values(entry["shape"])) <= {"?"}
+
+
+class TestPoolMetrics:
+    """Test the connection pool endpoint"""
+
+    def test_pool_stats(self):
+        """Pool settings and per-server checkout metrics should be returned"""
+        assert requests.get(f"{BASE_URL}/api/admin/calls?limit=5").status_code == 200
+        response = requests.get(f"{BASE_URL}/api/admin/perf/pool")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["settings"]["max_pool_size"] >= data["settings"]["min_pool_size"]
+        assert data["pools"], "No pool activity recorded"
+        for address, pool in data["pools"].items():
+            assert 0 <= pool["in_use"] <= pool["in_use_max"]
+            assert pool["in_use_max"] <= data["settings"]["max_pool_size"] or data["settings"]["max_pool_size"] == 0
+            assert sum(pool["wait_histogram"].values()) == pool["checkouts"]
+            print(f"{address}: {pool['checkouts']} checkouts, avg wait {pool['wait_ms_avg']} ms")
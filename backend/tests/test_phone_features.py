@@ -0,0 +1,70 @@
+"""
+Test suite for normalised phone keys in Edu Advisor app.
+Tests for:
+- Duplicate report detection across phone number formatting
+- /api/admin/phone-lookup history across reports, calls and queries
+- Other consultants reported by the duplicate check
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+CONSULTANT_ID = "PRIYAMPATRA"
+
+NUMBER = "+91 90000 00025"
+SAME_NUMBER_FORMATS = ["9000000025", "090000 00025", "0091-90000-00025"]
+
+
+@pytest.fixture(scope="module")
+def logged_number():
+    """An attempted call on NUMBER (which also creates an auto-reminder report)"""
+    response = requests.post(
+        f"{BASE_URL}/api/consultant/calls",
+        params={
+            "consultant_id": CONSULTANT_ID,
+            "call_type": "attempted",
+            "student_name": "TEST_PhoneKey",
+            "contact_number": NUMBER
+        }
+    )
+    assert response.status_code == 200
+    return response.json()["call_id"]
+
+
+class TestPhoneLookup:
+    """Test the cross-collection phone history endpoint"""
+
+    @pytest.mark.parametrize("number", [NUMBER, *SAME_NUMBER_FORMATS])
+    def test_lookup_any_format(self, logged_number, number):
+        """Every formatting of the number should resolve to the same history"""
+        response = requests.get(f"{BASE_URL}/api/admin/phone-lookup", params={"number": number})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["phone_key"] == "+919000000025"
+        assert any(c["id"] == logged_number for c in data["calls"])
+        assert any(c["consultant_id"] == CONSULTANT_ID for c in data["touched_by"])
+        print(f"{number}: {len(data['reports'])} reports, {len(data['calls'])} calls, {len(data['queries'])} queries")
+
+    def test_invalid_number(self):
+        """Values that cannot be phone numbers should be rejected"""
+        response = requests.get(f"{BASE_URL}/api/admin/phone-lookup", params={"number": "N/A"})
+        assert response.status_code == 400
+
+
+class TestDuplicateByPhoneKey:
+    """Test duplicate detection on the normalised key"""
+
+    def test_duplicate_check_ignores_formatting(self, logged_number):
+        """A differently formatted number should find the existing report"""
+        response = requests.get(
+            f"{BASE_URL}/api/consultant/reports/check-duplicate",
+            params={"consultant_id": CONSULTANT_ID, "contact_number": SAME_NUMBER_FORMATS[0]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["exists"] is True
+        assert isinstance(data["other_consultants"], list)
+        assert all(c["consultant_id"] != CONSULTANT_ID for c in data["other_consultants"])
@@ -0,0 +1,101 @@
+"""
+Test suite for the Student Query inbox in Edu Advisor app.
+Tests for:
+- GET /api/queries filtering by status, course and date range
+- Prefix search on name, phone and email
+- Keyset pagination and status counters kept by PATCH /api/queries/{id}/status
+"""
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+@pytest.fixture
+def test_query():
+    """Create a uniquely named student query and delete it afterwards"""
+    suffix = uuid.uuid4().hex[:8]
+    payload = {
+        "name": f"TEST_Inbox{suffix} Student",
+        "phone": f"+91 98{uuid.uuid4().int % 10**8:08d}",
+        "email": f"test_inbox_{suffix}@example.com",
+        "current_institution": "TEST School",
+        "course": "TEST_COURSE",
+        "message": "Inbox test"
+    }
+    response = requests.post(f"{BASE_URL}/api/queries", json=payload)
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    query_id = response.json()["query_id"]
+
+    yield {"id": query_id, "suffix": suffix, **payload}
+
+    requests.delete(f"{BASE_URL}/api/queries/{query_id}")
+
+
+def find_ids(**params):
+    response = requests.get(f"{BASE_URL}/api/queries", params=params)
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    return {q["id"] for q in response.json()["queries"]}
+
+
+class TestQueryInboxFilters:
+    """Test server-side filtering and search"""
+
+    def test_inbox_structure(self):
+        """Inbox should return a page with totals and status counters"""
+        response = requests.get(f"{BASE_URL}/api/queries", params={"limit": 5})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data.get("success") is True
+        assert len(data["queries"]) <= 5
+        for key in ["count", "total", "status_counts", "next_cursor"]:
+            assert key in data, f"Inbox should return {key}"
+        counts = data["status_counts"]
+        assert counts["total"] == counts["new"] + counts["contacted"] + counts["closed"]
+        assert all("search_keys" not in q for q in data["queries"])
+
+    def test_search_by_name_email_and_phone(self, test_query):
+        """Prefix search should match name words, email and phone digits"""
+        assert test_query["id"] in find_ids(q=f"test_inbox{test_query['suffix']}")
+        assert test_query["id"] in find_ids(q=f"test_inbox_{test_query['suffix']}@")
+        national = "".join(ch for ch in test_query["phone"] if ch.isdigit())[-10:]
+        assert test_query["id"] in find_ids(q=national)
+        assert test_query["id"] not in find_ids(q=f"zz{test_query['suffix']}")
+
+    def test_filter_by_course_and_date(self, test_query):
+        """Course and since/until filters should narrow the inbox"""
+        assert test_query["id"] in find_ids(course="TEST_COURSE")
+        assert test_query["id"] not in find_ids(course="TEST_COURSE", until="2020-01-01")
+
+    def test_invalid_filters(self):
+        """Unknown status and malformed dates should return 400"""
+        assert requests.get(f"{BASE_URL}/api/queries", params={"status": "archived"}).status_code == 400
+        assert requests.get(f"{BASE_URL}/api/queries", params={"since": "soon"}).status_code == 400
+
+
+class TestQueryInboxCounters:
+    """Test status counters and pagination"""
+
+    def test_status_change_moves_counter(self, test_query):
+        """Marking a query contacted should move it from new to contacted"""
+        before = requests.get(f"{BASE_URL}/api/queries", params={"limit": 1}).json()["status_counts"]
+
+        response = requests.patch(f"{BASE_URL}/api/queries/{test_query['id']}/status", params={"status": "contacted"})
+        assert response.status_code == 200
+
+        after = requests.get(f"{BASE_URL}/api/queries", params={"limit": 1}).json()["status_counts"]
+        assert after["new"] == before["new"] - 1
+        assert after["contacted"] == before["contacted"] + 1
+        assert test_query["id"] in find_ids(status="contacted", q=f"test_inbox{test_query['suffix']}")
+
+    def test_pages_do_not_overlap(self):
+        """Walking next_cursor should never repeat a query"""
+        first = requests.get(f"{BASE_URL}/api/queries", params={"limit": 2}).json()
+        if not first["next_cursor"]:
+            pytest.skip("Not enough queries to paginate")
+
+        second = requests.get(f"{BASE_URL}/api/queries", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+        assert not {q["id"] for q in first["queries"]} & {q["id"] for q in second["queries"]}
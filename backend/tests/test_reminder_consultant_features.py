@@ -362,30 +362,38 @@ class TestReportsVisibility:
         print(f"✓ Consultant {CONSULTANT_ID} can view {data['count']} reports")
     
     def test_admin_can_view_all_consultant_reports(self):
-        """Test admin can see all consultant reports in Consultant Reports tab"""
+        """Test admin can page through all consultant reports in Consultant Reports tab"""
         response = requests.get(f"{API}/admin/consultant-reports")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] == True
         assert "reports" in data
-        assert "reports_by_consultant" in data
-        assert "total_count" in data
-        print(f"✓ Admin can view {data['total_count']} total reports from all consultants")
+        assert "next_cursor" in data
+        assert "reports_by_consultant" not in data, "Reports should not be duplicated in a grouped copy"
+        print(f"✓ Admin can view {data['count']} reports on the first page")
+    
+    def test_admin_reports_filtered_by_consultant(self):
+        """Test admin reports page filtered to one consultant"""
+        response = requests.get(f"{API}/admin/consultant-reports", params={"consultant_id": CONSULTANT_ID, "limit": 20})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["reports"]) <= 20
+        for report in data["reports"]:
+            assert report.get("consultant_id") == CONSULTANT_ID
     
     def test_reports_grouped_by_consultant(self):
-        """Test admin reports are grouped by consultant name"""
-        response = requests.get(f"{API}/admin/consultant-reports")
+        """Test admin reports summary is grouped by consultant with interest-scope breakdowns"""
+        response = requests.get(f"{API}/admin/consultant-reports/summary")
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data.get("reports_by_consultant"), dict)
-        
-        # If there are reports, verify structure
-        if data["total_count"] > 0:
-            for consultant_name, reports in data["reports_by_consultant"].items():
-                assert isinstance(reports, list)
-                for report in reports:
-                    assert report.get("consultant_name") == consultant_name
-        print(f"✓ Reports correctly grouped by {len(data['reports_by_consultant'])} consultants")
+        assert data["success"] == True
+        assert isinstance(data.get("consultants"), list)
+        
+        assert sum(c["count"] for c in data["consultants"]) == data["total_count"]
+        for entry in data["consultants"]:
+            assert entry["count"] > 0
+            assert sum(entry["interest_scope"].values()) <= entry["count"]
+        print(f"✓ Reports correctly grouped by {len(data['consultants'])} consultants")
 
 
 class TestConsultantPersistence:
@@ -0,0 +1,80 @@
+"""
+Test suite for consultant dashboard delta sync in Edu Advisor app.
+Tests for:
+- GET /api/consultant/sync/{consultant_id} watermarks and reset
+- Created calls and auto-reminders showing up as upserts
+- Deleted reports showing up as tombstones
+"""
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+# Test credentials
+CONSULTANT_ID = "PRIYAMPATRA"
+
+
+def sync(since=None):
+    params = {"since": since} if since else {}
+    response = requests.get(f"{BASE_URL}/api/consultant/sync/{CONSULTANT_ID}", params=params)
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    return response.json()
+
+
+class TestDeltaSync:
+    """Test GET /api/consultant/sync/{consultant_id}"""
+
+    def test_first_sync_returns_watermark(self):
+        """Without since only a watermark is returned, with reset set"""
+        data = sync()
+        assert data.get("success") is True
+        assert data["reset"] is True
+        assert data["watermark"]
+
+    def test_empty_diff(self):
+        """Syncing right away should return every section"""
+        data = sync(sync()["watermark"])
+        assert data["reset"] is False
+        for section in ["reports", "calls", "admissions", "reminders"]:
+            assert set(data[section]) == {"upserted", "deleted"}
+
+    def test_attempted_call_and_reminder_delete(self):
+        """An attempted call should sync as a call plus a reminder, and its deletion as a tombstone"""
+        watermark = sync()["watermark"]
+        contact = f"9{uuid.uuid4().int % 10**9:09d}"
+        response = requests.post(
+            f"{BASE_URL}/api/consultant/calls",
+            params={
+                "consultant_id": CONSULTANT_ID,
+                "call_type": "attempted",
+                "student_name": "TEST_SyncStudent",
+                "contact_number": contact
+            }
+        )
+        assert response.status_code == 200
+
+        data = sync(watermark)
+        assert contact in {c["contact_number"] for c in data["calls"]["upserted"]}
+        reminder = next(r for r in data["reminders"]["upserted"] if r["contact_number"] == contact)
+        assert reminder["id"] in {r["id"] for r in data["reports"]["upserted"]}
+
+        watermark = data["watermark"]
+        response = requests.delete(f"{BASE_URL}/api/consultant/reports/{reminder['id']}")
+        assert response.status_code == 200
+
+        data = sync(watermark)
+        assert reminder["id"] in data["reports"]["deleted"]
+        assert reminder["id"] in data["reminders"]["deleted"]
+        print("✓ Call, reminder and tombstone synced")
+
+    def test_expired_watermark_resets(self):
+        """A watermark older than the tombstone retention should ask for a reload"""
+        assert sync("2020-01-01T00:00:00+00:00")["reset"] is True
+
+    def test_invalid_requests(self):
+        """Malformed watermarks return 400 and unknown consultants 401"""
+        response = requests.get(f"{BASE_URL}/api/consultant/sync/{CONSULTANT_ID}", params={"since": "yesterday"})
+        assert response.status_code == 400
+        response = requests.get(f"{BASE_URL}/api/consultant/sync/INVALID_CONSULTANT")
+        assert response.status_code == 401
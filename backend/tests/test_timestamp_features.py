@@ -0,0 +1,60 @@
+"""
+Test suite for BSON date timestamps in Edu Advisor app.
+Tests for:
+- New calls and auto-reminders returned with UTC offset timestamps
+- Date range filters matching documents written today
+"""
+from datetime import datetime, timezone
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+CONSULTANT_ID = "PRIYAMPATRA"
+
+
+@pytest.fixture(scope="module")
+def logged_call():
+    """An attempted call, which also creates an auto-reminder report"""
+    response = requests.post(
+        f"{BASE_URL}/api/consultant/calls",
+        params={
+            "consultant_id": CONSULTANT_ID,
+            "call_type": "attempted",
+            "student_name": "TEST_Timestamp",
+            "contact_number": "9000000024"
+        }
+    )
+    assert response.status_code == 200
+    return response.json()["call_id"]
+
+
+class TestTimestampStorage:
+    """Test that timestamps come back as UTC dates"""
+
+    def test_call_timestamp_has_offset(self, logged_call):
+        """created_at should be an ISO timestamp with a UTC offset"""
+        response = requests.get(
+            f"{BASE_URL}/api/consultant/calls/{CONSULTANT_ID}",
+            params={"fields": "call_type"}
+        )
+        assert response.status_code == 200
+        call = next(c for c in response.json()["calls"] if c["id"] == logged_call)
+        created_at = datetime.fromisoformat(call["created_at"].replace("Z", "+00:00"))
+        assert created_at.utcoffset() is not None
+        assert abs((datetime.now(timezone.utc) - created_at).total_seconds()) < 600
+        print(f"Call created_at: {call['created_at']}")
+
+    def test_since_filter_matches_new_report(self, logged_call):
+        """A since=today filter should include the auto-reminder created just now"""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        response = requests.get(
+            f"{BASE_URL}/api/admin/consultant-reports",
+            params={"consultant_id": CONSULTANT_ID, "since": today, "fields": "student_name"}
+        )
+        assert response.status_code == 200
+        reports = response.json()["reports"]
+        assert any(r.get("student_name") == "TEST_Timestamp" for r in reports)
+        for report in reports:
+            assert report["created_at"][:10] >= today
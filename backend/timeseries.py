@@ -0,0 +1,97 @@
+"""
+Date buckets for time series.
+
+Day, week and month bucket arithmetic and the day key of a timestamp, shared
+by the daily rollups (rollups.py) that serve every trend chart.
+"""
+from datetime import datetime, date, timezone, timedelta
+
+GRANULARITIES = ["day", "week", "month"]
+
+# Longest window a trend endpoint may request
+MAX_DAYS = 366 * 5
+
+LABEL_FORMATS = {
+    "day": "%b %d",
+    "week": "%b %d",
+    "month": "%b",
+}
+
+
+def day_key_expr(field: str = "$created_at"):
+    """Aggregation expression for the UTC day (YYYY-MM-DD) of a timestamp.
+
+    Timestamps are BSON dates; ISO strings the timestamp migration could not
+    convert (timestamps.py) are handled too.
+    """
+    return {
+        "$cond": [
+            {"$eq": [{"$type": field}, "date"]},
+            {"$dateToString": {"format": "%Y-%m-%d", "date": field}},
+            {"$substrBytes": [{"$ifNull": [field, ""]}, 0, 10]}
+        ]
+    }
+
+
+def day_key(created_at) -> str:
+    """Python counterpart of day_key_expr for a single created_at value"""
+    if isinstance(created_at, datetime):
+        return created_at.strftime("%Y-%m-%d")
+    if isinstance(created_at, str):
+        return created_at[:10]
+    return ""
+
+
+def created_at_range(start: datetime = None, end: datetime = None, field: str = "created_at"):
+    """Date range filter on a timestamp field; end is exclusive. Empty without bounds."""
+    cond = {}
+    if start:
+        cond["$gte"] = start
+    if end:
+        cond["$lt"] = end
+    return {field: cond} if cond else {}
+
+
+def validate_series(days: int, granularity: str):
+    """Raise ValueError for an unknown granularity or a window outside 1..MAX_DAYS"""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Invalid granularity. Must be one of: {GRANULARITIES}")
+    if days < 1 or days > MAX_DAYS:
+        raise ValueError(f"Invalid days. Must be between 1 and {MAX_DAYS}")
+
+
+def bucket_start(d: date, granularity: str) -> date:
+    """First day of the bucket containing d"""
+    if granularity == "week":
+        return d - timedelta(days=d.weekday())
+    if granularity == "month":
+        return d.replace(day=1)
+    return d
+
+
+def next_bucket(d: date, granularity: str) -> date:
+    if granularity == "week":
+        return d + timedelta(days=7)
+    if granularity == "month":
+        return date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
+    return d + timedelta(days=1)
+
+
+def bucket_starts(days: int, granularity: str = "day", now: datetime = None):
+    """Start dates of every bucket overlapping the last `days` days (inclusive of today)"""
+    today = (now or datetime.now(timezone.utc)).date()
+    current = bucket_start(today - timedelta(days=max(days, 1) - 1), granularity)
+    starts = []
+    while current <= today:
+        starts.append(current)
+        current = next_bucket(current, granularity)
+    return starts
+
+
+def days_for_months(months: int, now: datetime = None) -> int:
+    """Number of days covering the current month and the `months - 1` before it"""
+    today = (now or datetime.now(timezone.utc)).date()
+    start = today.replace(day=1)
+    for _ in range(max(months, 1) - 1):
+        start = (start - timedelta(days=1)).replace(day=1)
+    return (today - start).days + 1
@@ -0,0 +1,163 @@
+"""
+Timestamp migration.
+
+created_at and updated_at are stored as BSON dates in UTC (the client reads
+them back timezone-aware). Older write paths stored ISO strings, which range
+filters on dates do not match; migrate_timestamps converts them in place,
+run by hand with `python maintenance.py migrate-timestamps` (--dry-run,
+--restart). init_timestamps only checks for leftover strings at startup and
+logs a warning, so workers never rewrite collections while starting.
+
+Each collection is scanned in _id order, batch_size documents at a time, for
+documents with a string timestamp. Every converted batch is written with one
+bulk_write and a checkpoint ({_id: "timestamps:<collection>", last_id, ...})
+is saved in `migrations`, so an interrupted run resumes after the last batch.
+A document is only updated if its strings are unchanged, so the migration is
+safe alongside live writes. Strings that do not parse are left alone and
+counted; they fall outside date ranges, but day_key_expr and keyset
+pagination still handle them.
+"""
+import logging
+from datetime import datetime, timezone
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+# Collection -> timestamp fields stored as BSON dates
+TIMESTAMP_FIELDS = {
+    "consultant_reports": ("created_at", "updated_at"),
+    "call_logs": ("created_at",),
+    "admissions": ("created_at", "updated_at"),
+    "student_queries": ("created_at", "updated_at"),
+}
+
+MIGRATION_BATCH_SIZE = 500
+
+
+def parse_timestamp(value) -> datetime:
+    """UTC datetime for a stored ISO string (naive values are UTC); None if it does not parse"""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _string_timestamps(fields) -> dict:
+    return {"$or": [{field: {"$type": "string"}} for field in fields]}
+
+
+async def migrate_collection(db, collection_name: str, batch_size: int = MIGRATION_BATCH_SIZE,
+                             dry_run: bool = False, restart: bool = False) -> dict:
+    """Convert the string timestamps of one collection, resuming from its checkpoint"""
+    fields = TIMESTAMP_FIELDS[collection_name]
+    collection = getattr(db, collection_name)
+    checkpoint_id = f"timestamps:{collection_name}"
+
+    checkpoint = {} if restart else (await db.migrations.find_one({"_id": checkpoint_id}) or {})
+    last_id = checkpoint.get("last_id")
+    result = {
+        "converted": checkpoint.get("converted", 0),
+        "unparseable": checkpoint.get("unparseable", 0),
+        "batches": 0,
+    }
+    # Current write paths store dates, so everything up to the newest document
+    # is done once the scan ends; the next run starts from there
+    newest = await collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+
+    async def save_checkpoint():
+        await db.migrations.update_one(
+            {"_id": checkpoint_id},
+            {"$set": {
+                "last_id": last_id,
+                "converted": result["converted"],
+                "unparseable": result["unparseable"],
+                "updated_at": datetime.now(timezone.utc)
+            }},
+            upsert=True
+        )
+
+    while True:
+        query = _string_timestamps(fields)
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        cursor = collection.find(query, {field: 1 for field in fields}).sort("_id", 1).limit(batch_size)
+        batch = await cursor.to_list(None)
+        if not batch:
+            break
+
+        operations = []
+        for doc in batch:
+            original, update = {}, {}
+            for field in fields:
+                value = doc.get(field)
+                if not isinstance(value, str):
+                    continue
+                parsed = parse_timestamp(value)
+                if parsed is None:
+                    result["unparseable"] += 1
+                    continue
+                original[field] = value
+                update[field] = parsed
+            if update:
+                operations.append(UpdateOne({"_id": doc["_id"], **original}, {"$set": update}))
+
+        if dry_run:
+            result["converted"] += len(operations)
+        elif operations:
+            written = await collection.bulk_write(operations, ordered=False)
+            result["converted"] += written.modified_count
+
+        last_id = batch[-1]["_id"]
+        result["batches"] += 1
+        if not dry_run:
+            await save_checkpoint()
+
+    if not dry_run and newest and newest["_id"] != last_id:
+        try:
+            if last_id is None or newest["_id"] > last_id:
+                last_id = newest["_id"]
+                await save_checkpoint()
+        except TypeError:
+            pass  # _id values of different types do not compare; keep the scan position
+
+    result["remaining"] = await collection.count_documents(_string_timestamps(fields))
+    return result
+
+
+async def migrate_timestamps(db, batch_size: int = MIGRATION_BATCH_SIZE, dry_run: bool = False,
+                             restart: bool = False, collections=None) -> dict:
+    """Migrate every collection in TIMESTAMP_FIELDS (or the given ones); results per collection"""
+    results = {}
+    for collection_name in collections or TIMESTAMP_FIELDS:
+        if collection_name not in TIMESTAMP_FIELDS:
+            raise ValueError(f"Unknown collection. Must be one of: {list(TIMESTAMP_FIELDS)}")
+        results[collection_name] = await migrate_collection(
+            db, collection_name, batch_size, dry_run, restart
+        )
+    return results
+
+
+async def init_timestamps(db) -> list:
+    """Warn about collections that still hold string timestamps; returns their names.
+
+    Read-only. Once the migration has a checkpoint only documents after it are
+    checked, plus the unparseable strings it recorded.
+    """
+    pending = []
+    for collection_name, fields in TIMESTAMP_FIELDS.items():
+        checkpoint = await db.migrations.find_one({"_id": f"timestamps:{collection_name}"}) or {}
+        query = _string_timestamps(fields)
+        if checkpoint.get("last_id") is not None:
+            query["_id"] = {"$gt": checkpoint["last_id"]}
+        if checkpoint.get("unparseable") or await getattr(db, collection_name).find_one(query, {"_id": 1}):
+            pending.append(collection_name)
+            logger.warning(
+                f"{collection_name} still has string timestamps, which date ranges do not match; "
+                f"run `python maintenance.py migrate-timestamps`"
+            )
+    return pending
@@ -31,6 +31,9 @@ import Leaderboard from './Leaderboard';
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
+// Columns rendered by the admissions table and edit dialog
+const ADMISSION_FIELDS = 'student_name,course,college,admission_date,consultant_id,consultant_name,payout_amount,payout_status';
+
 const PAYOUT_STATUS_OPTIONS = [
   "PAYOUT NOT CREDITED YET",
   "PAYOUT REFLECTED",
@@ -42,10 +45,13 @@ const AdminDashboard = () => {
   const { isDark } = useTheme();
   const [activeTab, setActiveTab] = useState('queries');
   const [queries, setQueries] = useState([]);
-  const [filteredQueries, setFilteredQueries] = useState([]);
+  const [queriesCursor, setQueriesCursor] = useState(null);
+  const [queriesTotal, setQueriesTotal] = useState(0);
+  const [queryStatusCounts, setQueryStatusCounts] = useState({ total: 0, new: 0, contacted: 0, closed: 0 });
   const [consultantReports, setConsultantReports] = useState([]);
   const [filteredReports, setFilteredReports] = useState([]);
-  const [reportsByConsultant, setReportsByConsultant] = useState({});
+  const [reportsSummary, setReportsSummary] = useState({ total_count: 0, today_count: 0, month_count: 0, consultants: [] });
+  const [reportsCursor, setReportsCursor] = useState(null);
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
   const [reportSearchTerm, setReportSearchTerm] = useState('');
@@ -89,6 +95,7 @@ const AdminDashboard = () => {
   const [callDetailsConsultantId, setCallDetailsConsultantId] = useState('');
   const [callDetailsConsultantName, setCallDetailsConsultantName] = useState('');
   const [callDetailsList, setCallDetailsList] = useState([]);
+  const [callDetailsCursor, setCallDetailsCursor] = useState(null);
   const [loadingCallDetails, setLoadingCallDetails] = useState(false);
 
   // Reminders State
@@ -127,8 +134,6 @@ const AdminDashboard = () => {
   }, [navigate]);
 
   useEffect(() => {
-    fetchQueries();
-    fetchConsultantReports();
     fetchConsultants();
     fetchAdmissions();
     fetchCallStats();
@@ -136,33 +141,36 @@ const AdminDashboard = () => {
     fetchAllAnalytics();
   }, []);
 
+  // Queries are filtered server-side; debounce typing in the search box
   useEffect(() => {
-    filterQueries();
-  }, [queries, searchTerm, filterStatus]);
+    const timer = setTimeout(() => fetchQueries(), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm, filterStatus]);
+
+  // Reports are loaded per consultant and day from the server; search filters the loaded pages
+  useEffect(() => {
+    fetchConsultantReports();
+  }, [selectedConsultant, selectedDate]);
 
   useEffect(() => {
     filterReports();
-  }, [consultantReports, reportSearchTerm, selectedConsultant, selectedDate]);
+  }, [consultantReports, reportSearchTerm]);
 
   // Fetch All Analytics Data
   const fetchAllAnalytics = async () => {
     setLoadingAnalytics(true);
     try {
-      const [overview, calls, interest, trend, performance, monthly] = await Promise.all([
-        axios.get(`${API}/admin/analytics/overview`),
-        axios.get(`${API}/admin/analytics/call-distribution`),
-        axios.get(`${API}/admin/analytics/interest-scope`),
-        axios.get(`${API}/admin/analytics/reports-trend`),
-        axios.get(`${API}/admin/analytics/consultant-performance`),
-        axios.get(`${API}/admin/analytics/monthly-admissions`)
-      ]);
+      const response = await axios.get(`${API}/admin/analytics/bundle`);
       
-      if (overview.data.success) setAnalyticsOverview(overview.data.overview);
-      if (calls.data.success) setCallDistribution(calls.data.distribution);
-      if (interest.data.success) setInterestDistribution(interest.data.distribution);
-      if (trend.data.success) setReportsTrend(trend.data.trend);
-      if (performance.data.success) setConsultantPerformance(performance.data.performance);
-      if (monthly.data.success) setMonthlyAdmissions(monthly.data.monthly);
+      if (response.data.success) {
+        const bundle = response.data;
+        setAnalyticsOverview(bundle.overview);
+        setCallDistribution(bundle.call_distribution);
+        setInterestDistribution(bundle.interest_scope);
+        setReportsTrend(bundle.reports_trend);
+        setConsultantPerformance(bundle.consultant_performance);
+        setMonthlyAdmissions(bundle.monthly_admissions);
+      }
     } catch (error) {
       console.error('Error fetching analytics:', error);
     } finally {
@@ -173,7 +181,7 @@ const AdminDashboard = () => {
   // Fetch Call Stats
   const fetchCallStats = async () => {
     try {
-      const response = await axios.get(`${API}/admin/calls`);
+      const response = await axios.get(`${API}/admin/calls`, { params: { stats_only: true } });
       if (response.data.success) {
         setCallStats(response.data);
       }
@@ -201,20 +209,25 @@ const AdminDashboard = () => {
     }
   };
 
-  // Fetch Call Details for a consultant
-  const fetchCallDetails = async (consultantId, consultantName, callType) => {
-    setLoadingCallDetails(true);
+  // Fetch Call Details for a consultant (pass the previous next_cursor to load the next page)
+  const fetchCallDetails = async (consultantId, consultantName, callType, cursor = null) => {
+    if (!cursor) {
+      setLoadingCallDetails(true);
+      setCallDetailsList([]);
+    }
     setCallDetailsConsultantId(consultantId);
     setCallDetailsConsultantName(consultantName);
     setCallDetailsType(callType);
     setShowCallDetails(true);
     try {
-      const url = callType === 'all'
-        ? `${API}/admin/calls/details?consultant_id=${consultantId}`
-        : `${API}/admin/calls/details?consultant_id=${consultantId}&call_type=${callType}`;
-      const response = await axios.get(url);
+      const params = { consultant_id: consultantId };
+      if (callType !== 'all') params.call_type = callType;
+      if (cursor) params.cursor = cursor;
+      const response = await axios.get(`${API}/admin/calls/details`, { params });
       if (response.data.success) {
-        setCallDetailsList(response.data.calls || []);
+        const calls = response.data.calls || [];
+        setCallDetailsList(prev => cursor ? [...prev, ...calls] : calls);
+        setCallDetailsCursor(response.data.next_cursor || null);
       }
     } catch (error) {
       console.error('Error fetching call details:', error);
@@ -322,7 +335,9 @@ const AdminDashboard = () => {
   // Fetch Admissions
   const fetchAdmissions = async () => {
     try {
-      const response = await axios.get(`${API}/admin/admissions`);
+      const response = await axios.get(`${API}/admin/admissions`, {
+        params: { fields: ADMISSION_FIELDS }
+      });
       if (response.data.success) {
         setAdmissions(response.data.admissions);
       }
@@ -513,12 +528,28 @@ const AdminDashboard = () => {
     }
   };
 
-  const fetchConsultantReports = async () => {
+  // Fetch one page of reports for the selected consultant and day (pass next_cursor to append the next page)
+  const fetchConsultantReports = async (cursor = null) => {
     try {
-      const response = await axios.get(`${API}/admin/consultant-reports`);
+      const params = {};
+      if (selectedConsultant !== 'all') params.consultant_id = selectedConsultant;
+      if (selectedDate) {
+        const dayStart = new Date(selectedDate);
+        dayStart.setHours(0, 0, 0, 0);
+        params.since = dayStart.toISOString().replace('Z', '+00:00');
+        params.until = new Date(dayStart.getTime() + 24 * 60 * 60 * 1000).toISOString().replace('Z', '+00:00');
+      }
+      if (cursor) params.cursor = cursor;
+      const [response, summary] = await Promise.all([
+        axios.get(`${API}/admin/consultant-reports`, { params }),
+        cursor ? null : axios.get(`${API}/admin/consultant-reports/summary`)
+      ]);
       if (response.data.success) {
-        setConsultantReports(response.data.reports);
-        setReportsByConsultant(response.data.reports_by_consultant);
+        setConsultantReports(prev => cursor ? [...prev, ...response.data.reports] : response.data.reports);
+        setReportsCursor(response.data.next_cursor || null);
+      }
+      if (summary?.data.success) {
+        setReportsSummary(summary.data);
       }
     } catch (error) {
       console.error('Error fetching consultant reports:', error);
@@ -529,19 +560,6 @@ const AdminDashboard = () => {
   const filterReports = () => {
     let filtered = [...consultantReports];
 
-    // Filter by consultant
-    if (selectedConsultant !== 'all') {
-      filtered = filtered.filter(report => report.consultant_name === selectedConsultant);
-    }
-
-    // Filter by date
-    if (selectedDate) {
-      filtered = filtered.filter(report => {
-        const reportDate = new Date(report.created_at);
-        return reportDate.toDateString() === selectedDate.toDateString();
-      });
-    }
-
     // Search filter
     if (reportSearchTerm) {
       filtered = filtered.filter(
@@ -564,12 +582,19 @@ const AdminDashboard = () => {
     navigate('/admin');
   };
 
-  const fetchQueries = async () => {
+  // Fetch one page of queries matching the search and status filter (pass next_cursor to append the next page)
+  const fetchQueries = async (cursor = null) => {
     try {
-      setLoading(true);
-      const response = await axios.get(`${API}/queries`);
+      const params = {};
+      if (searchTerm) params.q = searchTerm;
+      if (filterStatus !== 'all') params.status = filterStatus;
+      if (cursor) params.cursor = cursor;
+      const response = await axios.get(`${API}/queries`, { params });
       if (response.data.success) {
-        setQueries(response.data.queries);
+        setQueries(prev => cursor ? [...prev, ...response.data.queries] : response.data.queries);
+        setQueriesCursor(response.data.next_cursor || null);
+        setQueriesTotal(response.data.total);
+        setQueryStatusCounts(response.data.status_counts);
       }
     } catch (error) {
       console.error('Error fetching queries:', error);
@@ -579,84 +604,28 @@ const AdminDashboard = () => {
     }
   };
 
-  const filterQueries = () => {
-    let filtered = [...queries];
-
-    // Search filter
-    if (searchTerm) {
-      filtered = filtered.filter(
-        (query) =>
-          query.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-          query.email.toLowerCase().includes(searchTerm.toLowerCase()) ||
-          query.phone.includes(searchTerm) ||
-          query.course.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
-    // Status filter
-    if (filterStatus !== 'all') {
-      filtered = filtered.filter((query) => query.status === filterStatus);
-    }
-
-    setFilteredQueries(filtered);
+  // Exports are streamed by the server so they include every row, not just the loaded pages
+  const downloadExport = (collection, params = {}) => {
+    const query = new URLSearchParams({ format: 'csv', ...params });
+    const a = document.createElement('a');
+    a.href = `${API}/admin/export/${collection}?${query.toString()}`;
+    a.click();
   };
 
   const exportToCSV = () => {
-    const headers = ['Date', 'Name', 'Phone', 'Email', 'Institution', 'Course', 'Message', 'Status'];
-    const csvData = filteredQueries.map((query) => [
-      new Date(query.created_at).toLocaleDateString(),
-      query.name,
-      query.phone,
-      query.email,
-      query.current_institution || '',
-      query.course,
-      query.message.replace(/,/g, ';'),
-      query.status,
-    ]);
-
-    const csv = [
-      headers.join(','),
-      ...csvData.map((row) => row.map((cell) => `"${cell}"`).join(',')),
-    ].join('\n');
-
-    const blob = new Blob([csv], { type: 'text/csv' });
-    const url = window.URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `student-queries-${new Date().toISOString().split('T')[0]}.csv`;
-    a.click();
-    window.URL.revokeObjectURL(url);
-    toast.success('Queries exported to CSV');
+    downloadExport('queries');
+    toast.success('Queries export started');
   };
 
   const exportConsultantReportsToCSV = () => {
-    const headers = ['Date (IST)', 'Consultant', 'Student Name', 'Contact', 'Institution', 'Exam Preference', 'Career Interest', 'College Interest', 'Interest Scope', 'Remarks'];
-    const csvData = filteredReports.map((report) => [
-      formatDate(report.created_at),
-      report.consultant_name,
-      report.student_name,
-      report.contact_number,
-      report.institution_name,
-      report.competitive_exam_preference,
-      report.career_interest,
-      report.college_interest || '',
-      report.interest_scope,
-      (report.other_remarks || '').replace(/,/g, ';'),
-    ]);
-
-    const csv = [
-      headers.join(','),
-      ...csvData.map((row) => row.map((cell) => `"${cell}"`).join(',')),
-    ].join('\n');
-
-    const blob = new Blob([csv], { type: 'text/csv' });
-    const url = window.URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `consultant-reports-${new Date().toISOString().split('T')[0]}.csv`;
-    a.click();
-    window.URL.revokeObjectURL(url);
-    toast.success('Consultant reports exported to CSV');
+    const params = {};
+    if (selectedConsultant !== 'all') params.consultant_id = selectedConsultant;
+    if (selectedDate) {
+      params.start_date = format(selectedDate, 'yyyy-MM-dd');
+      params.end_date = format(selectedDate, 'yyyy-MM-dd');
+    }
+    downloadExport('reports', params);
+    toast.success('Consultant reports export started');
   };
 
   const getStatusBadge = (status) => {
@@ -1071,7 +1040,7 @@ const AdminDashboard = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className={`text-xs md:text-sm ${isDark ? 'text-gray-400' : 'text-gray-600'}`}>Total Queries</p>
-                  <p className={`text-xl md:text-3xl font-bold ${isDark ? 'text-white' : 'text-gray-900'}`}>{queries.length}</p>
+                  <p className={`text-xl md:text-3xl font-bold ${isDark ? 'text-white' : 'text-gray-900'}`}>{queryStatusCounts.total}</p>
                 </div>
                 <MessageSquare className="h-6 w-6 md:h-10 md:w-10 text-blue-500" />
               </div>
@@ -1084,7 +1053,7 @@ const AdminDashboard = () => {
                 <div>
                   <p className={`text-xs md:text-sm ${isDark ? 'text-gray-400' : 'text-gray-600'}`}>New</p>
                   <p className="text-xl md:text-3xl font-bold text-blue-500">
-                    {queries.filter((q) => q.status === 'new').length}
+                    {queryStatusCounts.new}
                   </p>
                 </div>
                 <MessageSquare className="h-6 w-6 md:h-10 md:w-10 text-blue-500" />
@@ -1098,7 +1067,7 @@ const AdminDashboard = () => {
                 <div>
                   <p className={`text-xs md:text-sm ${isDark ? 'text-gray-400' : 'text-gray-600'}`}>Contacted</p>
                   <p className="text-xl md:text-3xl font-bold text-yellow-500">
-                    {queries.filter((q) => q.status === 'contacted').length}
+                    {queryStatusCounts.contacted}
                   </p>
                 </div>
                 <Phone className="h-6 w-6 md:h-10 md:w-10 text-yellow-500" />
@@ -1112,7 +1081,7 @@ const AdminDashboard = () => {
                 <div>
                   <p className={`text-xs md:text-sm ${isDark ? 'text-gray-400' : 'text-gray-600'}`}>Closed</p>
                   <p className="text-xl md:text-3xl font-bold text-green-500">
-                    {queries.filter((q) => q.status === 'closed').length}
+                    {queryStatusCounts.closed}
                   </p>
                 </div>
                 <BookOpen className="h-6 w-6 md:h-10 md:w-10 text-green-500" />
@@ -1160,7 +1129,7 @@ const AdminDashboard = () => {
                 </Button>
 
                 <Button
-                  onClick={fetchQueries}
+                  onClick={() => fetchQueries()}
                   variant="outline"
                   size="sm"
                   className={isDark ? 'border-gray-600' : 'border-gray-300'}
@@ -1176,10 +1145,10 @@ const AdminDashboard = () => {
         {/* Queries Table */}
         <Card className={isDark ? 'bg-gray-800 border-gray-700' : ''}>
           <CardHeader>
-            <CardTitle className={isDark ? 'text-white' : ''}>Student Queries ({filteredQueries.length})</CardTitle>
+            <CardTitle className={isDark ? 'text-white' : ''}>Student Queries ({queries.length < queriesTotal ? `${queries.length} of ${queriesTotal}` : queriesTotal})</CardTitle>
           </CardHeader>
           <CardContent>
-            {filteredQueries.length === 0 ? (
+            {queries.length === 0 ? (
               <div className="text-center py-12">
                 <MessageSquare className={`h-16 w-16 mx-auto mb-4 ${isDark ? 'text-gray-600' : 'text-gray-300'}`} />
                 <p className={`text-lg ${isDark ? 'text-gray-400' : 'text-gray-500'}`}>No queries found</p>
@@ -1205,7 +1174,7 @@ const AdminDashboard = () => {
                     </TableRow>
                   </TableHeader>
                   <TableBody>
-                    {filteredQueries.map((query) => {
+                    {queries.map((query) => {
                       const isNew = isNewQuery(query.created_at);
                       return (
                         <TableRow 
@@ -1300,6 +1269,18 @@ const AdminDashboard = () => {
                     })}
                   </TableBody>
                 </Table>
+                {queriesCursor && (
+                  <div className="p-3 text-center">
+                    <Button
+                      size="sm" variant="outline"
+                      onClick={() => fetchQueries(queriesCursor)}
+                      className={isDark ? 'border-gray-600' : ''}
+                      data-testid="queries-load-more"
+                    >
+                      Load more
+                    </Button>
+                  </div>
+                )}
               </div>
             )}
           </CardContent>
@@ -1413,7 +1394,7 @@ const AdminDashboard = () => {
                   <div className="flex items-center justify-between">
                     <div>
                       <p className="text-sm text-gray-600">Total Reports</p>
-                      <p className="text-3xl font-bold text-gray-900">{consultantReports.length}</p>
+                      <p className="text-3xl font-bold text-gray-900">{reportsSummary.total_count}</p>
                     </div>
                     <FileText className="h-10 w-10 text-green-500" />
                   </div>
@@ -1426,7 +1407,7 @@ const AdminDashboard = () => {
                     <div>
                       <p className="text-sm text-gray-600">Consultants</p>
                       <p className="text-3xl font-bold text-green-600">
-                        {Object.keys(reportsByConsultant).length}
+                        {reportsSummary.consultants.length}
                       </p>
                     </div>
                     <Users className="h-10 w-10 text-green-500" />
@@ -1440,12 +1421,7 @@ const AdminDashboard = () => {
                     <div>
                       <p className="text-sm text-gray-600">This Month</p>
                       <p className="text-3xl font-bold text-blue-600">
-                        {consultantReports.filter(report => {
-                          const reportDate = new Date(report.created_at);
-                          const now = new Date();
-                          return reportDate.getMonth() === now.getMonth() && 
-                                 reportDate.getFullYear() === now.getFullYear();
-                        }).length}
+                        {reportsSummary.month_count}
                       </p>
                     </div>
                     <CalendarIcon className="h-10 w-10 text-blue-500" />
@@ -1459,11 +1435,7 @@ const AdminDashboard = () => {
                     <div>
                       <p className="text-sm text-gray-600">Today</p>
                       <p className="text-3xl font-bold text-yellow-600">
-                        {consultantReports.filter(report => {
-                          const reportDate = new Date(report.created_at);
-                          const now = new Date();
-                          return reportDate.toDateString() === now.toDateString();
-                        }).length}
+                        {reportsSummary.today_count}
                       </p>
                     </div>
                     <BookOpen className="h-10 w-10 text-yellow-500" />
@@ -1532,9 +1504,9 @@ const AdminDashboard = () => {
                       className="flex-1 min-w-[120px] px-3 py-2 text-sm border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-green-500"
                     >
                       <option value="all">All Consultants</option>
-                      {Object.keys(reportsByConsultant).map((consultant) => (
-                        <option key={consultant} value={consultant}>
-                          {consultant} ({reportsByConsultant[consultant].length})
+                      {reportsSummary.consultants.map((consultant) => (
+                        <option key={consultant.consultant_id} value={consultant.consultant_id}>
+                          {consultant.consultant_name} ({consultant.count})
                         </option>
                       ))}
                     </select>
@@ -1549,7 +1521,7 @@ const AdminDashboard = () => {
                     </Button>
 
                     <Button
-                      onClick={fetchConsultantReports}
+                      onClick={() => fetchConsultantReports()}
                       variant="outline"
                       size="sm"
                       className="border-gray-300"
@@ -1574,7 +1546,7 @@ const AdminDashboard = () => {
                       {selectedConsultant !== 'all' && (
                         <Badge className="bg-green-100 text-green-800 flex items-center gap-1">
                           <Users className="h-3 w-3" />
-                          {selectedConsultant}
+                          {reportsSummary.consultants.find(c => c.consultant_id === selectedConsultant)?.consultant_name || selectedConsultant}
                           <button onClick={() => setSelectedConsultant('all')} className="ml-1 hover:text-green-900">
                             <X className="h-3 w-3" />
                           </button>
@@ -1694,6 +1666,17 @@ const AdminDashboard = () => {
                         ))}
                       </TableBody>
                     </Table>
+                    {reportsCursor && (
+                      <div className="p-3 text-center">
+                        <Button
+                          size="sm" variant="outline"
+                          onClick={() => fetchConsultantReports(reportsCursor)}
+                          data-testid="reports-load-more"
+                        >
+                          Load more
+                        </Button>
+                      </div>
+                    )}
                   </div>
                 )}
               </CardContent>
@@ -3089,7 +3072,7 @@ const AdminDashboard = () => {
                       {callDetailsType === 'all' && <PhoneCall className="h-5 w-5" />}
                       {callDetailsType === 'all' ? 'All' : callDetailsType.charAt(0).toUpperCase() + callDetailsType.slice(1)} Calls
                     </CardTitle>
-                    <p className="text-sm opacity-90">{callDetailsConsultantName} ({callDetailsList.length} calls)</p>
+                    <p className="text-sm opacity-90">{callDetailsConsultantName} ({callDetailsList.length}{callDetailsCursor ? '+' : ''} calls)</p>
                   </div>
                   <button onClick={() => setShowCallDetails(false)} className="text-white hover:text-gray-200">
                     <X className="h-5 w-5" />
@@ -3148,6 +3131,18 @@ const AdminDashboard = () => {
                         ))}
                       </TableBody>
                     </Table>
+                    {callDetailsCursor && (
+                      <div className="p-3 text-center">
+                        <Button
+                          size="sm" variant="outline"
+                          onClick={() => fetchCallDetails(callDetailsConsultantId, callDetailsConsultantName, callDetailsType, callDetailsCursor)}
+                          className={isDark ? 'border-gray-600' : ''}
+                          data-testid="call-details-load-more"
+                        >
+                          Load more
+                        </Button>
+                      </div>
+                    )}
                   </div>
                 )}
               </CardContent>
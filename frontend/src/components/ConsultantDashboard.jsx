@@ -71,6 +71,10 @@ import CollegeComparison from './CollegeComparison';
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
+// Columns rendered by the reports table and detail dialog, and the admissions table
+const REPORT_FIELDS = 'student_name,contact_number,institution_name,competitive_exam_preference,career_interest,college_interest,interest_scope,other_remarks,source';
+const ADMISSION_FIELDS = 'student_name,course,college,admission_date,payout_amount,payout_status';
+
 const INTEREST_SCOPE_OPTIONS = [
   "ACTIVELY INTERESTED",
   "LESS INTERESTED",
@@ -80,6 +84,24 @@ const INTEREST_SCOPE_OPTIONS = [
   "NOT INTERESTED"
 ];
 
+// Apply a delta sync section ({ upserted, deleted }) to a list kept newest first
+const applyChanges = (rows, changes) => {
+  const replaced = new Set([...changes.deleted, ...changes.upserted.map(doc => doc.id)]);
+  return [...changes.upserted, ...rows.filter(row => !replaced.has(row.id))]
+    .sort((a, b) => new Date(b.created_at) - new Date(a.created_at));
+};
+
+// Split pending reminders the way /consultant/reminders does (UTC dates)
+const categorizeReminders = (pending) => {
+  const today = new Date().toISOString().slice(0, 10);
+  const sorted = [...pending].sort((a, b) => a.next_followup_date.localeCompare(b.next_followup_date));
+  return {
+    today_reminders: sorted.filter(r => r.next_followup_date === today),
+    upcoming_reminders: sorted.filter(r => r.next_followup_date > today),
+    overdue_reminders: sorted.filter(r => r.next_followup_date < today)
+  };
+};
+
 const ConsultantDashboard = () => {
   const navigate = useNavigate();
   const { isDark } = useTheme();
@@ -122,6 +144,7 @@ const ConsultantDashboard = () => {
   const [showCallDetails, setShowCallDetails] = useState(false);
   const [callDetailsType, setCallDetailsType] = useState('');
   const [callDetailsList, setCallDetailsList] = useState([]);
+  const [callDetailsCursor, setCallDetailsCursor] = useState(null);
   const [loadingCallDetails, setLoadingCallDetails] = useState(false);
   
   // CSV Upload State
@@ -131,6 +154,10 @@ const ConsultantDashboard = () => {
   const [isUploadingCsv, setIsUploadingCsv] = useState(false);
   const fileInputRef = useRef(null);
   
+  // Delta sync: last watermark and the lists loaded in full (only those get diffs)
+  const syncWatermark = useRef(null);
+  const loadedLists = useRef({ reports: false, admissions: false, reminders: false });
+  
   // Spreadsheet State
   const [showSpreadsheet, setShowSpreadsheet] = useState(false);
   const [spreadsheetRows, setSpreadsheetRows] = useState([]);
@@ -179,19 +206,20 @@ const ConsultantDashboard = () => {
     }
   }, [navigate]);
 
-  // Fetch reports when tab changes to 'reports' or when consultantId is set
+  // Fetch reports when tab changes to 'reports' or when consultantId is set;
+  // lists already loaded are brought up to date with a delta sync instead
   useEffect(() => {
     if (consultantId && activeTab === 'reports') {
-      fetchMyReports();
+      loadedLists.current.reports ? syncDashboard() : fetchMyReports();
     }
     if (consultantId && activeTab === 'admissions') {
-      fetchMyAdmissions();
+      loadedLists.current.admissions ? syncDashboard() : fetchMyAdmissions();
     }
     if (consultantId && activeTab === 'calls') {
       fetchCallStats();
     }
     if (consultantId && activeTab === 'reminders') {
-      fetchReminders();
+      loadedLists.current.reminders ? syncDashboard() : fetchReminders();
     }
     if (consultantId && activeTab === 'analytics') {
       fetchConsultantAnalytics();
@@ -201,6 +229,9 @@ const ConsultantDashboard = () => {
   // Fetch call stats and reminders on load (with notification on initial load)
   useEffect(() => {
     if (consultantId) {
+      syncWatermark.current = null;
+      loadedLists.current = { reports: false, admissions: false, reminders: false };
+      syncDashboard();
       fetchCallStats();
       fetchReminders(true); // true = show notification popup
     }
@@ -209,7 +240,7 @@ const ConsultantDashboard = () => {
   const fetchCallStats = async () => {
     if (!consultantId) return;
     try {
-      const response = await axios.get(`${API}/consultant/calls/${consultantId}`);
+      const response = await axios.get(`${API}/consultant/calls/${consultantId}`, { params: { stats_only: true } });
       if (response.data.success) {
         setCallStats(response.data.stats);
       }
@@ -223,18 +254,14 @@ const ConsultantDashboard = () => {
     if (!consultantId) return;
     setLoadingAnalytics(true);
     try {
-      const [overview, calls, interest, trend, daily] = await Promise.all([
-        axios.get(`${API}/consultant/analytics/overview/${consultantId}`),
-        axios.get(`${API}/consultant/analytics/call-distribution/${consultantId}`),
-        axios.get(`${API}/consultant/analytics/interest-scope/${consultantId}`),
-        axios.get(`${API}/consultant/analytics/reports-trend/${consultantId}`),
-        axios.get(`${API}/consultant/analytics/daily-calls/${consultantId}`)
-      ]);
-      if (overview.data.success) setAnalyticsOverview(overview.data.overview);
-      if (calls.data.success) setCallDistribution(calls.data.distribution);
-      if (interest.data.success) setInterestDistribution(interest.data.distribution);
-      if (trend.data.success) setReportsTrend(trend.data.trend);
-      if (daily.data.success) setDailyCalls(daily.data.trend);
+      const response = await axios.get(`${API}/consultant/analytics/bundle/${consultantId}`);
+      if (response.data.success) {
+        setAnalyticsOverview(response.data.overview);
+        setCallDistribution(response.data.call_distribution);
+        setInterestDistribution(response.data.interest_scope);
+        setReportsTrend(response.data.reports_trend);
+        setDailyCalls(response.data.daily_calls);
+      }
     } catch (error) {
       console.error('Error fetching consultant analytics:', error);
     } finally {
@@ -257,6 +284,7 @@ const ConsultantDashboard = () => {
           upcoming_reminders: response.data.upcoming_reminders || [],
           overdue_reminders: overdueReminders
         });
+        loadedLists.current.reminders = true;
         
         // Show notification popup on login if there are reminders
         if (showNotification && (todayReminders.length > 0 || overdueReminders.length > 0)) {
@@ -271,19 +299,24 @@ const ConsultantDashboard = () => {
     }
   };
 
-  // Fetch Call Details
-  const fetchCallDetails = async (callType) => {
+  // Fetch Call Details (pass the previous next_cursor to load the next page)
+  const fetchCallDetails = async (callType, cursor = null) => {
     if (!consultantId) return;
-    setLoadingCallDetails(true);
+    if (!cursor) {
+      setLoadingCallDetails(true);
+      setCallDetailsList([]);
+    }
     setCallDetailsType(callType);
     setShowCallDetails(true);
     try {
-      const url = callType === 'all' 
-        ? `${API}/consultant/calls/details/${consultantId}`
-        : `${API}/consultant/calls/details/${consultantId}?call_type=${callType}`;
-      const response = await axios.get(url);
+      const params = {};
+      if (callType !== 'all') params.call_type = callType;
+      if (cursor) params.cursor = cursor;
+      const response = await axios.get(`${API}/consultant/calls/details/${consultantId}`, { params });
       if (response.data.success) {
-        setCallDetailsList(response.data.calls || []);
+        const calls = response.data.calls || [];
+        setCallDetailsList(prev => cursor ? [...prev, ...calls] : calls);
+        setCallDetailsCursor(response.data.next_cursor || null);
       }
     } catch (error) {
       console.error('Error fetching call details:', error);
@@ -299,7 +332,7 @@ const ConsultantDashboard = () => {
       const response = await axios.put(`${API}/consultant/reminders/${reportId}/complete?consultant_id=${consultantId}`);
       if (response.data.success) {
         toast.success('Follow-up marked as complete!');
-        fetchReminders();
+        syncDashboard();
         // Remove from notification list if open
         setNotificationReminders(prev => prev.filter(r => r.id !== reportId));
         if (notificationReminders.length <= 1) {
@@ -320,7 +353,7 @@ const ConsultantDashboard = () => {
       const response = await axios.put(`${API}/consultant/reminders/${reportId}/ignore?consultant_id=${consultantId}`);
       if (response.data.success) {
         toast.success('Reminder ignored');
-        fetchReminders();
+        syncDashboard();
         // Remove from notification list if open
         setNotificationReminders(prev => prev.filter(r => r.id !== reportId));
         if (notificationReminders.length <= 1) {
@@ -353,7 +386,7 @@ const ConsultantDashboard = () => {
       const response = await axios.post(`${API}/consultant/calls?${params.toString()}`);
       if (response.data.success) {
         toast.success(`${callType.charAt(0).toUpperCase() + callType.slice(1)} call logged!`);
-        fetchCallStats();
+        syncDashboard();
         setShowQuickCall(false);
         setQuickCallData({ call_type: 'attempted', student_name: '', contact_number: '', remarks: '' });
       }
@@ -364,14 +397,55 @@ const ConsultantDashboard = () => {
     }
   };
 
+  // Apply changes since the last watermark to the loaded lists; the first call
+  // only takes a watermark, and a reset (expired watermark or too many
+  // changes) reloads the loaded lists in full
+  const syncDashboard = async () => {
+    if (!consultantId) return;
+    const since = syncWatermark.current;
+    try {
+      const response = await axios.get(`${API}/consultant/sync/${consultantId}`, {
+        params: since ? { since } : {}
+      });
+      if (!response.data.success) return;
+      syncWatermark.current = response.data.watermark;
+      const loaded = loadedLists.current;
+      
+      if (response.data.reset) {
+        if (!since) return;
+        if (loaded.reports) fetchMyReports();
+        if (loaded.admissions) fetchMyAdmissions();
+        if (loaded.reminders) fetchReminders();
+        fetchCallStats();
+        return;
+      }
+      
+      const { reports, admissions, reminders: reminderChanges, calls } = response.data;
+      if (loaded.reports) setMyReports(prev => applyChanges(prev, reports));
+      if (loaded.admissions) setMyAdmissions(prev => applyChanges(prev, admissions));
+      if (loaded.reminders) {
+        setReminders(prev => categorizeReminders(applyChanges(
+          [...prev.overdue_reminders, ...prev.today_reminders, ...prev.upcoming_reminders],
+          reminderChanges
+        )));
+      }
+      if (calls.upserted.length || calls.deleted.length) fetchCallStats();
+    } catch (error) {
+      console.error('Error syncing dashboard:', error);
+    }
+  };
+
   const fetchMyReports = async () => {
     if (!consultantId) return;
     
     setLoadingReports(true);
     try {
-      const response = await axios.get(`${API}/consultant/reports/${consultantId}`);
+      const response = await axios.get(`${API}/consultant/reports/${consultantId}`, {
+        params: { fields: REPORT_FIELDS }
+      });
       if (response.data.success) {
         setMyReports(response.data.reports);
+        loadedLists.current.reports = true;
       }
     } catch (error) {
       console.error('Error fetching reports:', error);
@@ -387,9 +461,12 @@ const ConsultantDashboard = () => {
     
     setLoadingAdmissions(true);
     try {
-      const response = await axios.get(`${API}/consultant/admissions/${consultantId}`);
+      const response = await axios.get(`${API}/consultant/admissions/${consultantId}`, {
+        params: { fields: ADMISSION_FIELDS }
+      });
       if (response.data.success) {
         setMyAdmissions(response.data.admissions);
+        loadedLists.current.admissions = true;
       }
     } catch (error) {
       console.error('Error fetching admissions:', error);
@@ -618,8 +695,7 @@ const ConsultantDashboard = () => {
         setCsvData([]);
         setCsvErrors([]);
         setBulkMode(null);
-        fetchCallStats();
-        fetchMyReports();
+        syncDashboard();
       }
     } catch (error) {
       console.error('Error uploading CSV:', error);
@@ -717,8 +793,7 @@ const ConsultantDashboard = () => {
         setSpreadsheetRows([]);
         setSpreadsheetErrors({});
         setBulkMode(null);
-        fetchCallStats();
-        fetchMyReports();
+        syncDashboard();
       }
     } catch (error) {
       console.error('Error uploading spreadsheet:', error);
@@ -772,8 +847,7 @@ const ConsultantDashboard = () => {
         setShowDuplicateModal(false);
         setDuplicateInfo(null);
         setPendingFormData(null);
-        fetchCallStats();
-        fetchReminders();
+        syncDashboard();
         
         // Enable next submission after 5 seconds
         setTimeout(() => {
@@ -2641,7 +2715,7 @@ const ConsultantDashboard = () => {
                     {callDetailsType === 'failed' && <PhoneOff className="h-5 w-5" />}
                     {callDetailsType === 'attempted' && <PhoneMissed className="h-5 w-5" />}
                     {callDetailsType === 'all' && <PhoneCall className="h-5 w-5" />}
-                    {callDetailsType === 'all' ? 'All' : callDetailsType.charAt(0).toUpperCase() + callDetailsType.slice(1)} Calls ({callDetailsList.length})
+                    {callDetailsType === 'all' ? 'All' : callDetailsType.charAt(0).toUpperCase() + callDetailsType.slice(1)} Calls ({callDetailsList.length}{callDetailsCursor ? '+' : ''})
                   </CardTitle>
                   <button onClick={() => setShowCallDetails(false)} className="text-white hover:text-gray-200">
                     <X className="h-5 w-5" />
@@ -2700,6 +2774,18 @@ const ConsultantDashboard = () => {
                         ))}
                       </TableBody>
                     </Table>
+                    {callDetailsCursor && (
+                      <div className="p-3 text-center">
+                        <Button
+                          size="sm" variant="outline"
+                          onClick={() => fetchCallDetails(callDetailsType, callDetailsCursor)}
+                          className={isDark ? 'border-gray-600' : ''}
+                          data-testid="call-details-load-more"
+                        >
+                          Load more
+                        </Button>
+                      </div>
+                    )}
                   </div>
                 )}
               </CardContent>
@@ -54,14 +54,14 @@ const Leaderboard = ({ currentConsultantId = null }) => {
           <p className={`text-sm ${isDark ? 'text-gray-400' : 'text-gray-500'}`}>Rankings based on performance score</p>
         </div>
         <div className="flex items-center gap-2">
-          {['all', 'monthly', 'weekly'].map(p => (
+          {['all', 'monthly', 'weekly', '90d', '30d', '7d'].map(p => (
             <Button
               key={p} size="sm" variant={period === p ? 'default' : 'outline'}
               onClick={() => setPeriod(p)}
               className={`text-xs capitalize ${period === p ? 'bg-yellow-500 hover:bg-yellow-600 text-white' : isDark ? 'border-gray-600' : ''}`}
               data-testid={`period-${p}`}
             >
-              {p === 'all' ? 'All Time' : p}
+              {p === 'all' ? 'All Time' : p.endsWith('d') ? `Last ${parseInt(p, 10)} days` : p}
             </Button>
           ))}
           <Button onClick={fetchLeaderboard} size="sm" variant="outline" disabled={loading} className={isDark ? 'border-gray-600' : ''}>